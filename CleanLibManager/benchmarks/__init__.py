@@ -0,0 +1,10 @@
+"""
+Standalone performance benchmarks for Library Manager.
+Run from CleanLibManager/, e.g.:  python -m benchmarks.cover_decode <covers dir>
+
+- cover_decode: cover thumbnail decode paths
+- import_budget: import-time budget per app module
+- synthetic: generate synthetic libraries (1k-500k books) to benchmark against
+- library_ops: end-to-end LibraryData timings on synthetic libraries, JSON for comparing commits
+- perf_budget: regression gate, key operations vs machine-independent budgets (exit 1 when over)
+"""
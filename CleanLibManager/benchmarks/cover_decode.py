@@ -0,0 +1,86 @@
+"""
+Cover thumbnail decode benchmark.
+
+Compares the old tile path (full decode -> convert("RGB") -> thumbnail LANCZOS)
+with decode_fitted_image (JPEG draft / scale-on-decode, full decode for other formats).
+
+    python -m benchmarks.cover_decode <covers dir> [--size 130x190] [--repeat 3] [--json out.json]
+
+Point it at a real covers/ folder (e.g. <user data dir>/covers) for meaningful numbers.
+"""
+from __future__ import annotations
+from pathlib import Path
+import argparse
+import json
+import sys
+import time
+
+from PIL import Image
+
+from library_data import decode_fitted_image
+
+_IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+
+
+def _full_decode(path: Path, size: tuple[int, int]) -> Image.Image:
+    im = Image.open(path).convert("RGB")
+    im.thumbnail(size, Image.LANCZOS)
+    return im
+
+
+def _time_path(fn, files: list[Path], size: tuple[int, int], repeat: int) -> float:
+    """Best-of-`repeat` seconds to run fn over every file."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        for p in files:
+            fn(p, size)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(covers_dir: Path, size: tuple[int, int] = (130, 190), repeat: int = 3) -> dict:
+    files = sorted(p for p in Path(covers_dir).iterdir() if p.suffix.lower() in _IMAGE_EXTS)
+    if not files:
+        raise SystemExit(f"No cover images found in {covers_dir}")
+
+    jpegs = [p for p in files if p.suffix.lower() in (".jpg", ".jpeg")]
+    full_s = _time_path(_full_decode, files, size, repeat)
+    draft_s = _time_path(decode_fitted_image, files, size, repeat)
+
+    n = len(files)
+    return {
+        "benchmark": "cover_decode",
+        "files": n,
+        "jpeg_files": len(jpegs),
+        "size": list(size),
+        "repeat": repeat,
+        "full_decode_ms_per_tile": round(full_s * 1000 / n, 3),
+        "draft_decode_ms_per_tile": round(draft_s * 1000 / n, 3),
+        "speedup": round(full_s / draft_s, 2) if draft_s > 0 else None,
+    }
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    w, _, h = (text or "").lower().partition("x")
+    return int(w), int(h or w)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("covers_dir", type=Path)
+    ap.add_argument("--size", type=_parse_size, default=(130, 190), help="tile size WxH (default 130x190)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--json", type=Path, default=None, help="also write the result here")
+    args = ap.parse_args(argv)
+
+    result = run(args.covers_dir, args.size, args.repeat)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.json:
+        args.json.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
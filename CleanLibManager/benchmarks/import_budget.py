@@ -0,0 +1,130 @@
+"""
+Import-time budget check.
+
+Imports each app module in a fresh interpreter under `python -X importtime` and fails when
+- the module's cumulative import time (best of --repeat runs) is over its budget, or
+- a module that is supposed to load lazily (network stack, difflib, dialogs, ...) shows up
+  during the import.
+
+    python -m benchmarks.import_budget [--repeat 3] [--budget library_data=60] [--json out.json]
+
+Exit status is 1 when anything is over budget, so it can gate a build.
+"""
+from __future__ import annotations
+from pathlib import Path
+import argparse
+import json
+import subprocess
+import sys
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# cumulative ms per top-level module; generous enough for a cold-ish laptop, tight enough to
+# catch someone importing the network stack (or Pillow, for library_data) at module level again.
+# library_data measures ~35-45 ms with Pillow lazy; an eager `from PIL import Image` adds ~25 ms.
+BUDGETS_MS: dict[str, float] = {
+    "library_data": 80.0,
+    "messy_cozy_lib": 250.0,
+}
+
+# must not be imported as a side effect of importing the key module
+_LAZY_DATA = ("ssl", "certifi", "http.client", "urllib.request", "difflib", "concurrent.futures")
+LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    "library_data": _LAZY_DATA + ("PIL",),  # only cover thumbnails need it
+    "messy_cozy_lib": _LAZY_DATA + ("ctypes", "tkinter.filedialog", "tkinter.simpledialog", "PIL.ImageOps"),
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """`-X importtime` lines -> {module: (self us, cumulative us)} (first occurrence wins)."""
+    out: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # the header row
+        out.setdefault(parts[2].strip(), (self_us, cum_us))
+    return out
+
+
+def measure(module: str | None) -> dict[str, tuple[int, int]]:
+    """Import timings for `import module` in a fresh interpreter (module=None: startup only)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        cwd=APP_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["(no output)"]
+        raise SystemExit(f"import {module} failed: {tail[0]}")
+    return parse_importtime(proc.stderr)
+
+
+def run(budgets: dict[str, float] | None = None, repeat: int = 3) -> dict:
+    import compileall
+
+    budgets = dict(BUDGETS_MS if budgets is None else budgets)
+    # time imports from fresh bytecode, as a build ships them; with a stale .pyc (and
+    # PYTHONDONTWRITEBYTECODE set) every run would include compiling the source
+    for module in budgets:
+        compileall.compile_file(str(APP_DIR / f"{module}.py"), quiet=2)
+    startup = set(measure(None))  # site hooks may preload some modules; don't blame the app for those
+    results = []
+    for module, budget_ms in budgets.items():
+        best_ms = float("inf")
+        eager: set[str] = set()
+        for _ in range(max(1, repeat)):
+            times = measure(module)
+            best_ms = min(best_ms, times.get(module, (0, 0))[1] / 1000)
+            eager.update(m for m in LAZY_MODULES.get(module, ()) if m in times and m not in startup)
+        results.append({
+            "module": module,
+            "cumulative_ms": round(best_ms, 1),
+            "budget_ms": budget_ms,
+            "eager_imports": sorted(eager),
+            "ok": best_ms <= budget_ms and not eager,
+        })
+    return {
+        "benchmark": "import_budget",
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "modules": results,
+        "ok": all(r["ok"] for r in results),
+    }
+
+
+def _parse_budget(text: str) -> tuple[str, float]:
+    module, _, ms = (text or "").partition("=")
+    return module.strip(), float(ms)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--budget", type=_parse_budget, action="append", default=[],
+                    help="override a budget, MODULE=MS (repeatable)")
+    ap.add_argument("--json", type=Path, default=None, help="also write the result here")
+    args = ap.parse_args(argv)
+
+    budgets = dict(BUDGETS_MS)
+    budgets.update(args.budget)
+    result = run(budgets, args.repeat)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.json:
+        args.json.write_text(text + "\n", encoding="utf-8")
+
+    for r in result["modules"]:
+        if r["cumulative_ms"] > r["budget_ms"]:
+            print(f"OVER BUDGET: {r['module']} {r['cumulative_ms']} ms > {r['budget_ms']} ms", file=sys.stderr)
+        for m in r["eager_imports"]:
+            print(f"EAGER IMPORT: {r['module']} pulls in {m} at import time", file=sys.stderr)
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
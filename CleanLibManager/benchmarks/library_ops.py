@@ -0,0 +1,228 @@
+"""
+End-to-end LibraryData benchmark on synthetic libraries.
+
+Generates a library per size (benchmarks.synthetic) and times the core data paths:
+cold load, save, autocomplete per keystroke, the search page's token scan, sorted paging,
+genre rename/delete, CSV import/export and collection resolution.
+
+    python -m benchmarks.library_ops [--books 1000,10000,100000] [--seed 0] [--repeat 3] [--json out.json]
+
+Times are best-of-repeat milliseconds; commit the --json output next to a change to compare runs.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from library_data import LibraryData
+from benchmarks.synthetic import generate_library, synthetic_rows, write_csv
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+SORT_MODES = ("Title", "Author", "Year", "Genre", "Last Updated")
+# what people type into the search bar, one keystroke at a time
+TYPED_QUERIES = ("winter", "tanaka", "the gar", "café", "1987")
+# whole queries for the search page (perform_search in the app)
+SEARCH_QUERIES = ("winter", "garden tanaka", "1987", "café", "the night river", "zzzz")
+
+
+class _Timer:
+    """Best-of-N millisecond timings keyed by operation name."""
+
+    def __init__(self) -> None:
+        self.ms: dict[str, float] = {}
+
+    def record(self, name: str, ms: float) -> None:
+        self.ms[name] = round(min(self.ms.get(name, ms), ms), 3)
+
+    @contextmanager
+    def __call__(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - t0) * 1000)
+
+
+def _git_commit() -> str:
+    try:
+        proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                              capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return proc.stdout.strip() if proc.returncode == 0 else ""
+
+
+def perform_search(catalog: list[dict], query: str) -> list[dict]:
+    """The search page's token scan (LibraryApp.perform_search without the UI)."""
+    tokens = (query or "").strip().lower().split()
+    if not tokens:
+        return catalog[:]
+    results = []
+    for row in catalog:
+        search_text = row.get("search_text") or " ".join(
+            [row.get("title") or "", row.get("creators") or "", row.get("first_name") or "",
+             row.get("last_name") or "", row.get("date_published") or ""]
+        ).lower()
+        if all(tok in search_text for tok in tokens):
+            results.append(row)
+    return results
+
+
+def _bench_load_save(t: _Timer, lib: Path) -> None:
+    with t("cold_load"):
+        data = LibraryData(lib)
+    with t("save"):
+        data.save()
+
+
+def _bench_search(t: _Timer, lib: Path) -> dict:
+    data = LibraryData(lib)
+    with t("search_first_keystroke"):  # builds the suggestion index
+        data.search_matches(TYPED_QUERIES[0][0])
+    per_key: list[float] = []
+    for q in TYPED_QUERIES:
+        for i in range(1, len(q) + 1):
+            t0 = time.perf_counter()
+            data.search_matches(q[:i])
+            per_key.append((time.perf_counter() - t0) * 1000)
+    t.record("search_keystroke_mean", sum(per_key) / len(per_key))
+    t.record("search_keystroke_max", max(per_key))
+
+    catalog = list(data.catalog.values())
+    hits = {}
+    for q in SEARCH_QUERIES:
+        with t(f"perform_search[{q}]"):
+            hits[q] = len(perform_search(catalog, q))
+    return hits
+
+
+def _bench_sort(t: _Timer, lib: Path) -> None:
+    data = LibraryData(lib)
+    mid = len(data.catalog) // 2
+    for mode in SORT_MODES:
+        data._drop_book_indexes()
+        with t(f"sort_cold[{mode}]"):
+            data.page(mode, 0, 50)
+        with t(f"sort_page_mid[{mode}]"):
+            data.page(mode, mid, 50, reverse=True)
+
+
+def _bench_genres(t: _Timer, lib: Path, scratch: Path) -> dict:
+    # both operations rewrite books, so each repeat gets its own copy of the library
+    shutil.rmtree(scratch, ignore_errors=True)
+    shutil.copytree(lib, scratch)
+    data = LibraryData(scratch)
+    counts: dict[str, int] = {}
+    for b in data.catalog.values():
+        g = b.get("genre") or ""
+        if g:
+            counts[g] = counts.get(g, 0) + 1
+    ranked = sorted(counts, key=counts.get, reverse=True)
+    if len(ranked) < 2:
+        return {}
+    with t("rename_genre"):
+        renamed = data.rename_genre(ranked[0], f"{ranked[0]} Renamed")
+    with t("delete_genre"):
+        deleted = data.delete_genre(ranked[1])
+    return {"rename_genre_books": renamed, "delete_genre_books": deleted}
+
+
+def _bench_csv(t: _Timer, lib: Path, scratch: Path, csv_in: Path) -> None:
+    data = LibraryData(lib)
+    with t("export_csv"):
+        data.export_csv(scratch.with_suffix(".export.csv"))
+    shutil.rmtree(scratch, ignore_errors=True)
+    fresh = LibraryData(scratch)
+    with t("import_csv"):
+        fresh.import_csv(csv_in)
+
+
+def _bench_collections(t: _Timer, lib: Path, seed: int) -> None:
+    data = LibraryData(lib)
+    records = [rec for rec in data.collections.values() if isinstance(rec, dict)]
+    with t("resolve_collections"):  # builds the alias index on first use
+        for rec in records:
+            data.resolve_book_refs(rec.get("book_ids") or [])
+    sample = random.Random(seed).sample(list(data.catalog), min(1000, len(data.catalog)))
+    with t("collections_for_book_x1000"):
+        for bid in sample:
+            data.collections_for_book(bid)
+    with t("get_books_by_ids_x1000"):
+        data.get_books_by_ids(sample)
+    with t("refresh_smart_collections"):
+        data.refresh_smart_collections()
+
+
+def run(sizes: list[int], seed: int = 0, repeat: int = 3, covers: int = 0, keep: Path | None = None) -> dict:
+    root = Path(keep) if keep else Path(tempfile.mkdtemp(prefix="libbench-"))
+    root.mkdir(parents=True, exist_ok=True)
+    results = []
+    try:
+        for n in sizes:
+            lib = root / f"lib-{n}"
+            shutil.rmtree(lib, ignore_errors=True)
+            summary = generate_library(lib, n, seed=seed, covers=covers)
+            csv_in = write_csv(root / f"books-{n}.csv", synthetic_rows(n, seed))
+            t = _Timer()
+            extra: dict = {}
+            for _ in range(max(1, repeat)):
+                _bench_load_save(t, lib)
+                extra["search_hits"] = _bench_search(t, lib)
+                _bench_sort(t, lib)
+                extra.update(_bench_genres(t, lib, root / "scratch-genres"))
+                _bench_csv(t, lib, root / "scratch-import", csv_in)
+                _bench_collections(t, lib, seed)
+            results.append({
+                "books": summary["books"],
+                "requested": n,
+                "generate_s": summary["seconds"],
+                "catalog_bytes": (lib / "catalog.json").stat().st_size,
+                "ms": t.ms,
+                **extra,
+            })
+    finally:
+        if not keep:
+            shutil.rmtree(root, ignore_errors=True)
+    return {
+        "benchmark": "library_ops",
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "seed": seed,
+        "repeat": repeat,
+        "sizes": results,
+    }
+
+
+def _parse_sizes(text: str) -> list[int]:
+    return [int(s.replace("_", "").replace("k", "000")) for s in text.split(",") if s.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--books", type=_parse_sizes, default=[1000, 10_000],
+                    help="comma-separated library sizes, e.g. 1k,10k,500k")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--covers", type=int, default=0, help="synthetic cover files per library (needs Pillow)")
+    ap.add_argument("--keep", type=Path, default=None, help="generate into this folder and leave it there")
+    ap.add_argument("--json", type=Path, default=None, help="also write the result here")
+    args = ap.parse_args(argv)
+
+    result = run(args.books, args.seed, args.repeat, args.covers, args.keep)
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    print(text)
+    if args.json:
+        args.json.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Performance regression budget check.
+
+Times a reduced set of LibraryData operations on a fixed synthetic library (benchmarks.synthetic,
+10k books, seed 0) and fails when one is over its budget. Budgets are in calibration units: the
+operation's time divided by a fixed pure-Python loop timed in the same run, so the same numbers
+hold on a fast desktop and a slow laptop.
+
+    python -m benchmarks.perf_budget [--repeat 3] [--budget load=60] [--json out.json]
+
+Exit status is 1 when anything is over budget, so it can gate a build. Over-budget autocomplete,
+genre page or collection figures usually mean something rebuilds a whole-catalog index per call.
+"""
+from __future__ import annotations
+from pathlib import Path
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+
+from library_data import LibraryData
+from benchmarks.library_ops import TYPED_QUERIES
+from benchmarks.synthetic import generate_library, synthetic_rows, write_csv
+
+BOOKS = 10_000
+SEED = 0
+
+# operation -> max calibration units. About 3x what a healthy tree measures, so noise doesn't
+# trip them but an accidental O(catalog) step per call does.
+BUDGETS: dict[str, float] = {
+    "load": 60.0,
+    "save": 30.0,
+    "autocomplete_p95": 5.0,
+    "genre_page_p95": 0.15,  # a catalog scan per visit measures ~0.25
+    "collection_resolve": 4.0,
+    "csv_import_10k": 75.0,
+}
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Best-of-`repeat` ms for a fixed loop of the work LibraryData does most: dicts, strings, sorting."""
+    words = [f"word{i % 97} title{i}" for i in range(20_000)]
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        index: dict[str, list[int]] = {}
+        for i, w in enumerate(words):
+            index.setdefault(w.split()[0].lower(), []).append(i)
+        sorted(words, key=lambda s: (s[-3:], s))
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def _best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def _p95_ms(samples: list[float]) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(0.95 * len(samples)))] * 1000 if samples else 0.0
+
+
+def _timed(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+def measure(root: Path, repeat: int = 3) -> dict[str, float]:
+    """Milliseconds per budgeted operation on the fixed library under root."""
+    lib = root / "lib"
+    generate_library(lib, BOOKS, seed=SEED)
+    csv_in = write_csv(root / "books.csv", synthetic_rows(BOOKS, SEED))
+    ms: dict[str, float] = {}
+
+    ms["load"] = _best_ms(lambda: LibraryData(lib), repeat)
+    data = LibraryData(lib)
+    ms["save"] = _best_ms(data.save, repeat)
+
+    # steady state, as the user sees it: the index is built on the first keystroke (or at startup)
+    data.search_matches(TYPED_QUERIES[0][0])
+    ms["autocomplete_p95"] = _p95_ms([_timed(data.search_matches, q[:i])
+                                      for _ in range(max(1, repeat)) for q in TYPED_QUERIES
+                                      for i in range(1, len(q) + 1)])
+
+    # the genre page's data fetch (LibraryApp._filter_books_by_genre)
+    genres = sorted({(b.get("genre") or "").strip() for b in data.catalog.values()} - {""})
+    data.books_in_genre(genres[0])  # first visit builds the genre ordering
+    ms["genre_page_p95"] = _p95_ms([_timed(data.books_in_genre, g) for _ in range(max(1, repeat)) for g in genres])
+
+    # older collections.json files hold bare ISBNs and other legacy keys; mix some in so the alias
+    # index is on the measured path, not just the catalog fast path
+    refs = [[bid.partition(":")[2] if bid.startswith("isbn:") and i % 3 == 0 else bid
+             for i, bid in enumerate(rec.get("book_ids") or [])]
+            for rec in data.collections.values() if isinstance(rec, dict)]
+
+    def resolve_all() -> None:
+        for ids in refs:
+            data.resolve_book_refs(ids)
+
+    resolve_all()  # builds the alias index
+    ms["collection_resolve"] = _best_ms(resolve_all, repeat)
+
+    def import_fresh() -> None:
+        target = root / "import"
+        shutil.rmtree(target, ignore_errors=True)
+        LibraryData(target).import_csv(csv_in)
+
+    ms["csv_import_10k"] = _best_ms(import_fresh, repeat)
+    return ms
+
+
+def run(budgets: dict[str, float] | None = None, repeat: int = 3) -> dict:
+    budgets = dict(BUDGETS if budgets is None else budgets)
+    root = Path(tempfile.mkdtemp(prefix="libbudget-"))
+    try:
+        calib_ms = calibrate()
+        ms = measure(root, repeat)
+        calib_ms = min(calib_ms, calibrate())  # again afterwards, in case the machine was busy at first
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    results = []
+    for name, budget in budgets.items():
+        units = ms[name] / calib_ms
+        results.append({
+            "operation": name,
+            "ms": round(ms[name], 3),
+            "units": round(units, 3),
+            "budget_units": budget,
+            "ok": units <= budget,
+        })
+    return {
+        "benchmark": "perf_budget",
+        "python": sys.version.split()[0],
+        "books": BOOKS,
+        "seed": SEED,
+        "repeat": repeat,
+        "calibration_ms": round(calib_ms, 3),
+        "operations": results,
+        "ok": all(r["ok"] for r in results),
+    }
+
+
+def _parse_budget(text: str) -> tuple[str, float]:
+    name, _, units = (text or "").partition("=")
+    name = name.strip()
+    if name not in BUDGETS:
+        raise argparse.ArgumentTypeError(f"unknown operation {name!r} (one of {', '.join(BUDGETS)})")
+    return name, float(units)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--budget", type=_parse_budget, action="append", default=[],
+                    help="override a budget, OPERATION=UNITS (repeatable)")
+    ap.add_argument("--json", type=Path, default=None, help="also write the result here")
+    args = ap.parse_args(argv)
+
+    budgets = dict(BUDGETS)
+    budgets.update(args.budget)
+    result = run(budgets, args.repeat)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.json:
+        args.json.write_text(text + "\n", encoding="utf-8")
+
+    for r in result["operations"]:
+        if not r["ok"]:
+            print(f"OVER BUDGET: {r['operation']} {r['units']} units ({r['ms']} ms) > {r['budget_units']}",
+                  file=sys.stderr)
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Synthetic library generator.
+
+Builds a realistic data_dir (catalog.json, collections.json, optional covers/) for benchmarks:
+- Zipf-skewed authors (a few prolific ones, a long tail), genres and tags
+- unicode titles (accents, CJK, Cyrillic, Greek, the odd emoji) and valid ISBN-13s
+- ~8% of books without a genre and ~15% without an ISBN, like real imports
+- plain collections plus a couple of smart ones
+- optional solid-colour JPEG covers (needs Pillow)
+
+    python -m benchmarks.synthetic <out dir> --books 10000 [--seed 0] [--covers 500] [--csv books.csv]
+
+Books are normalized through LibraryData itself, so the files match what the app writes.
+"""
+from __future__ import annotations
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+
+from library_data import LibraryData
+
+_WORDS = (
+    "night garden river shadow winter glass iron silver house letters empire tide ember "
+    "lantern orchard harbor crown wolves salt storm paper clock echo north mirror stone "
+    "whisper forest ocean hollow sparrow thorn velvet ash copper meadow tower marrow"
+).split()
+_UNICODE_WORDS = (
+    "café", "naïve", "Ærø", "São", "Zürich", "señor", "façade", "Ångström", "Łódź", "smørrebrød",
+    "夜の庭", "風の歌", "长城", "Война", "Мир", "Ελπίδα", "Θάλασσα", "🌙", "★",
+)
+_FIRST = (
+    "Ada Ben Chloé Dmitri Elena Farid Grace Hiro Inès James Kofi Lena Mateo Nadia Oscar Priya "
+    "Quinn Rosa Sven Tomás Uma Viktor Wen Ximena Yusuf Zoë"
+).split()
+_LAST = (
+    "Abbott Brontë Castillo Dubois Eriksen Fujimoto García Haddad Ivanova Jensen Kowalski Laurent "
+    "Moreau Nakamura O'Connor Petrov Quintero Rossi Schmidt Tanaka Ueda Varga Whitfield Xu Yilmaz Zhang"
+).split()
+_PUBLISHERS = ("Penguin", "Tor", "Orbit", "Vintage", "Faber & Faber", "Gallimard", "Kodansha", "Del Rey", "")
+_TAGS = (
+    "favorite", "to reread", "signed", "book club", "summer", "classic", "series", "gift",
+    "audiobook", "borrowed", "award winner", "kids", "cozy", "dark", "short", "doorstopper",
+)
+
+
+def _zipf_cdf(n: int, s: float = 1.1) -> list[float]:
+    return list(accumulate(1.0 / (k ** s) for k in range(1, n + 1)))
+
+
+def _zipf_pick(rng: random.Random, items, cdf: list[float]):
+    return items[min(len(items) - 1, bisect_left(cdf, rng.random() * cdf[-1]))]
+
+
+def _isbn13(rng: random.Random) -> str:
+    digits = [9, 7, 8] + [rng.randrange(10) for _ in range(9)]
+    total = sum(d * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits))
+    return "".join(map(str, digits)) + str((10 - total % 10) % 10)
+
+
+def _title(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(1, 4))]
+    if rng.random() < 0.12:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(_UNICODE_WORDS))
+    title = " ".join(w.capitalize() for w in words)
+    if rng.random() < 0.25:
+        title = f"The {title}"
+    if rng.random() < 0.05:
+        title += f", Book {rng.randint(1, 9)}"
+    return title
+
+
+def synthetic_rows(n: int, seed: int = 0) -> list[dict]:
+    """n CSV-style rows (the shape import_csv reads), reproducible for a given seed."""
+    rng = random.Random(seed)
+    authors = [f"{rng.choice(_FIRST)} {rng.choice(_LAST)}" for _ in range(max(8, n // 6))]
+    genres = list(LibraryData.FICTION_GENRES) + list(LibraryData.NONFICTION_GENRES)
+    rng.shuffle(genres)
+    author_cdf, genre_cdf, tag_cdf = _zipf_cdf(len(authors)), _zipf_cdf(len(genres)), _zipf_cdf(len(_TAGS))
+
+    rows = []
+    for i in range(n):
+        author = _zipf_pick(rng, authors, author_cdf)
+        first, _, last = author.partition(" ")
+        tags = {_zipf_pick(rng, _TAGS, tag_cdf) for _ in range(rng.choice((0, 0, 1, 1, 2, 3)))}
+        rows.append({
+            "title": _title(rng),
+            "creators": author,
+            "first_name": first,
+            "last_name": last,
+            "date_published": str(rng.randint(1850, 2025)),
+            "publisher": rng.choice(_PUBLISHERS),
+            # no ISBN: build_book_id falls back to title/author, like hand-entered books
+            "isbn": _isbn13(rng) if rng.random() > 0.15 else "",
+            "genre": _zipf_pick(rng, genres, genre_cdf) if rng.random() > 0.08 else "",
+            "tags": ", ".join(sorted(tags)),
+            "read": "yes" if rng.random() < 0.3 else "",
+        })
+    return rows
+
+
+def write_csv(path: Path, rows: list[dict]) -> Path:
+    path = Path(path)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["title"])
+        w.writeheader()
+        w.writerows(rows)
+    return path
+
+
+def _write_covers(data: LibraryData, book_ids: list[str], rng: random.Random) -> int:
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit("--covers needs Pillow")
+    for bid in book_ids:
+        filename = f"{bid.replace(':', '_')}.jpg"
+        colour = tuple(rng.randrange(256) for _ in range(3))
+        Image.new("RGB", (300, 450), colour).save(data.covers_dir / filename, quality=85)
+        data.cover_index[bid] = filename
+    return len(book_ids)
+
+
+def generate_library(data_dir: Path, n_books: int, *, seed: int = 0, covers: int = 0,
+                     collections: int = 20) -> dict:
+    """Write a synthetic library into data_dir (an empty folder). Returns a summary."""
+    t0 = time.perf_counter()
+    rng = random.Random(seed + 1)
+    data = LibraryData(Path(data_dir))
+    if data.catalog:
+        raise SystemExit(f"{data_dir} already holds a library")
+
+    for row in synthetic_rows(n_books, seed):
+        bid = data.build_book_id(row)
+        data.catalog[bid] = data._normalize_row(row, bid)
+    ids = list(data.catalog)  # duplicate title/author pairs without ISBN merge, so len(ids) <= n_books
+
+    n_covers = _write_covers(data, rng.sample(ids, min(covers, len(ids))), rng) if covers else 0
+
+    with data.transaction():
+        for i in range(collections):
+            members = rng.sample(ids, min(len(ids), rng.randint(5, 400)))
+            data.create_collection(f"Shelf {i + 1:02d}", members, persist=False)
+        if collections:
+            data.create_smart_collection("Unread Mysteries", "genre=Mystery AND unread", persist=False)
+            data.create_smart_collection("Summer Picks", 'tag:"summer" OR tag:"cozy"', persist=False)
+        data.save()
+    data.rebuild_queues(force=True)
+
+    return {
+        "data_dir": str(data.data_dir),
+        "books": len(data.catalog),
+        "covers": n_covers,
+        "collections": len(data.collections),
+        "seed": seed,
+        "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("out_dir", type=Path)
+    ap.add_argument("--books", type=int, default=10_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--covers", type=int, default=0, help="write this many synthetic cover JPEGs")
+    ap.add_argument("--collections", type=int, default=20)
+    ap.add_argument("--csv", type=Path, default=None, help="also write the raw rows as an import CSV")
+    args = ap.parse_args(argv)
+
+    summary = generate_library(args.out_dir, args.books, seed=args.seed, covers=args.covers,
+                               collections=args.collections)
+    if args.csv:
+        write_csv(args.csv, synthetic_rows(args.books, args.seed))
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
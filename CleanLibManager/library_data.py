@@ -1,33 +1,75 @@
 from __future__ import annotations
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from pathlib import Path
 import csv
+import functools
 import json
 import re
-import difflib
+import glob
 import unicodedata
 import time
 import hashlib
-import ssl
-import http.client
-import socket
+import math
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable, Any
+from collections import OrderedDict
+from contextlib import contextmanager
 from collections.abc import Iterable
 from urllib.parse import quote
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from socket import timeout as TimeoutError
+
+# The network stack (ssl/certifi, http.client, urllib.request), difflib and
+# concurrent.futures are imported where they're used: most launches never sync,
+# and the UI shouldn't pay for them before its first paint.
 
 # =========================
 # SSL + HTTP helpers
 # =========================
-try:
-    import certifi
-    _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
-except Exception:
-    _SSL_CTX = ssl.create_default_context()
+_SSL_CTX = None
+
+def _ssl_context():
+    """Verified SSL context (certifi's CA bundle when available), built on first request."""
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        import ssl
+        try:
+            import certifi
+            _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
+        except Exception:
+            _SSL_CTX = ssl.create_default_context()
+    return _SSL_CTX
+
+# Pillow is only needed for cover thumbnails; everything else (and the CLI) works without it,
+# so it's imported on the first thumbnail rather than with this module.
+_PIL_IMAGE: Any = None  # PIL.Image once imported, False if Pillow isn't installed
+
+def _pil_image():
+    """PIL.Image, or None when Pillow isn't available (looked up once)."""
+    global _PIL_IMAGE
+    if _PIL_IMAGE is None:
+        try:
+            from PIL import Image
+            _PIL_IMAGE = Image
+        except Exception:
+            _PIL_IMAGE = False
+    return _PIL_IMAGE or None
+
+def decode_fitted_image(path, size: tuple[int, int]):
+    """
+    Decode an image straight to (at most) size, keeping aspect.
+    JPEGs use Pillow's draft mode so libjpeg scales by 1/2..1/8 while decoding
+    (most covers are Open Library JPEGs); PNG/WebP/GIF uploads get a full decode.
+    Requires Pillow.
+    """
+    Image = _pil_image()
+    w, h = max(1, int(size[0])), max(1, int(size[1]))
+    im = Image.open(path)
+    if im.format == "JPEG":
+        im.draft("RGB", (w, h))  # never goes below the requested size
+    im = im.convert("RGB")
+    im.thumbnail((w, h), Image.LANCZOS)
+    return im
 
 def _norm(s: str) -> str:
     s = (s or "").strip().lower()
@@ -35,6 +77,38 @@ def _norm(s: str) -> str:
 def _only_digits(s: str) -> str:
     return re.sub(r"\D+", "", (s or ""))
 
+def _isbn_variants(value: str) -> list[str]:
+    """ISBN spellings that name the same book: bare digits plus the ISBN-10 <-> 978 ISBN-13 twin."""
+    s = "".join(ch for ch in str(value or "") if ch.isdigit() or ch in "xX").upper()
+    out: list[str] = []
+    if len(s) == 10 and s[:9].isdigit():
+        out.append(s)
+        core = "978" + s[:9]
+        total = sum(int(c) * (1 if i % 2 == 0 else 3) for i, c in enumerate(core))
+        out.append(core + str((10 - total % 10) % 10))
+    elif len(s) == 13 and s.isdigit():
+        out.append(s)
+        if s.startswith("978"):
+            core = s[3:12]
+            total = sum(int(c) * (10 - i) for i, c in enumerate(core))
+            check = (11 - total % 11) % 11
+            out.append(core + ("X" if check == 10 else str(check)))
+    return out
+
+_LEADING_ARTICLES = ("the ", "a ", "an ")
+
+def _title_collation_key(title: str) -> str:
+    """Lowercased title with a leading English article moved out of the way ("The Hobbit" -> "hobbit")."""
+    t = str(title or "").strip()
+    if "&" in t:
+        import html
+        t = html.unescape(t)
+    t = re.sub(r"\s+", " ", t.lower())
+    for art in _LEADING_ARTICLES:
+        if t.startswith(art) and len(t) > len(art):
+            return t[len(art):]
+    return t
+
 def _normalize_text(s: str) -> str:
     """
     Normalize strings for search:
@@ -111,10 +185,17 @@ def _safe_write_json(path: Path, data):
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 def _http_get(url: str, timeout: float = 6.0, retries: int = 2) -> bytes | None:
+    import http.client
+    import socket
+    import ssl
+    from urllib.request import urlopen, Request
+    from urllib.error import URLError, HTTPError
+
+    ctx = _ssl_context()
     for attempt in range(retries):
         try:
             req = Request(url, headers={"User-Agent": "LibraryManager/1.0"})
-            with urlopen(req, timeout=timeout, context=_SSL_CTX) as resp:
+            with urlopen(req, timeout=timeout, context=ctx) as resp:
                 return resp.read()
 
         except (
@@ -293,7 +374,155 @@ def _merge_tags(existing: list[str], incoming: list[str]) -> list[str]:
     return out
 
 
+# =========================
+# Smart collection queries
+# =========================
+# Grammar (keywords case-insensitive, adjacent terms are ANDed):
+#   query := term (AND|OR term)* ; NOT term ; ( query )
+#   term  := read | unread | field OP value
+#   field := genre | tag | author | title | year
+#   OP    := = or : (genre exact, tag has, author/title contains) | != | < <= > >= (year)
+# e.g.  genre=Mystery AND unread AND tag:"summer"
+_SMART_TOKEN_RE = re.compile(
+    r"""\s*(?:(?P<lp>\()|(?P<rp>\))"""
+    r"""|(?P<field>[A-Za-z_]+)\s*(?P<op>>=|<=|!=|=|:|>|<)\s*(?P<val>"[^"]*"|'[^']*'|[^\s()]+)"""
+    r"""|(?P<word>[^\s()]+))"""
+)
+_SMART_FIELDS = ("genre", "tag", "author", "title", "year")
+
+
+def _book_tag_set(b: dict) -> set[str]:
+    tags = b.get("tags")
+    if isinstance(tags, str):
+        tags = re.split(r"[,\n;]+", tags)
+    if not isinstance(tags, list):
+        return set()
+    return {_norm_tag(t) for t in tags if _norm_tag(t)}
+
+
+def _smart_term(field: str, op: str, value: str) -> Callable[[dict], bool]:
+    field = field.lower()
+    if field not in _SMART_FIELDS:
+        raise ValueError(f'Unknown field "{field}" (use {", ".join(_SMART_FIELDS)}).')
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        value = value[1:-1]
+    want = _norm_tag(value)
+
+    if field == "year":
+        try:
+            y = int(value)
+        except ValueError:
+            raise ValueError(f'Year must be a number, got "{value}".') from None
 
+        def _year(b: dict) -> int:
+            raw = (b.get("publish_date") or b.get("date_published") or b.get("_year") or "")
+            try:
+                return int(str(raw).strip().split("-")[0])
+            except ValueError:
+                return 0
+
+        cmp = {
+            "=": lambda a: a == y, ":": lambda a: a == y, "!=": lambda a: a != y,
+            "<": lambda a: 0 < a < y, "<=": lambda a: 0 < a <= y, ">": lambda a: a > y, ">=": lambda a: a >= y,
+        }[op]
+        return lambda b: cmp(_year(b))
+
+    if op not in ("=", ":", "!="):
+        raise ValueError(f'"{op}" only works with year.')
+
+    if field == "genre":
+        test = lambda b: _norm_tag(b.get("genre")) == want
+    elif field == "tag":
+        test = lambda b: want in _book_tag_set(b)
+    elif field == "author":
+        test = lambda b: want in _norm_tag(
+            " ".join(str(b.get(k) or "") for k in ("first_name", "last_name", "creators", "author")))
+    else:
+        test = lambda b: want in _norm_tag(b.get("title"))
+
+    if op == "!=":
+        return lambda b: not test(b)
+    return test
+
+
+def _compile_smart_query(query: str) -> Callable[[dict], bool]:
+    """
+    Parse a smart-collection rule into a predicate over book dicts.
+    Raises ValueError with a user-facing message when the rule can't be parsed.
+    """
+    tokens: list[tuple[str, Any]] = []
+    pos = 0
+    text = (query or "").strip()
+    while pos < len(text):
+        m = _SMART_TOKEN_RE.match(text, pos)
+        if not m or m.end() == pos:
+            break
+        pos = m.end()
+        if m.group("lp"):
+            tokens.append(("(", None))
+        elif m.group("rp"):
+            tokens.append((")", None))
+        elif m.group("field"):
+            tokens.append(("term", _smart_term(m.group("field"), m.group("op"), m.group("val"))))
+        else:
+            w = m.group("word").lower()
+            if w in ("and", "or", "not"):
+                tokens.append((w, None))
+            elif w == "read":
+                tokens.append(("term", lambda b: bool(b.get("read"))))
+            elif w == "unread":
+                tokens.append(("term", lambda b: not b.get("read")))
+            else:
+                raise ValueError(f'Don\'t understand "{m.group("word")}".')
+    if not tokens:
+        raise ValueError("The rule is empty.")
+
+    i = 0
+
+    def peek() -> str | None:
+        return tokens[i][0] if i < len(tokens) else None
+
+    def parse_or() -> Callable[[dict], bool]:
+        nonlocal i
+        parts = [parse_and()]
+        while peek() == "or":
+            i += 1
+            parts.append(parse_and())
+        return parts[0] if len(parts) == 1 else (lambda b: any(p(b) for p in parts))
+
+    def parse_and() -> Callable[[dict], bool]:
+        nonlocal i
+        parts = [parse_not()]
+        while peek() in ("and", "not", "term", "("):
+            if peek() == "and":
+                i += 1
+            parts.append(parse_not())
+        return parts[0] if len(parts) == 1 else (lambda b: all(p(b) for p in parts))
+
+    def parse_not() -> Callable[[dict], bool]:
+        nonlocal i
+        kind = peek()
+        if kind == "not":
+            i += 1
+            inner = parse_not()
+            return lambda b: not inner(b)
+        if kind == "(":
+            i += 1
+            inner = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing closing parenthesis.")
+            i += 1
+            return inner
+        if kind == "term":
+            fn = tokens[i][1]
+            i += 1
+            return fn
+        raise ValueError("Rule ends early or has a misplaced AND/OR.")
+
+    pred = parse_or()
+    if i != len(tokens):
+        raise ValueError("Unexpected text near the end of the rule.")
+    return pred
 
 
 # =========================
@@ -307,6 +536,213 @@ class ImportReport:
     skipped_no_isbn: int = 0
     skipped_existing_isbn: int = 0
 
+# =========================
+# Profiling hooks (opt-in)
+# =========================
+class OpProfiler:
+    """
+    Registry of per-operation timings for @profiled methods.
+    - disabled (default): a wrapped call costs one attribute check
+    - enable(): call counts, cumulative time and p50/p95/p99 latency per operation
+    - capture_next(name): run the next call of one operation under cProfile
+    """
+    MAX_SAMPLES = 2048  # latency samples kept per operation (newest win)
+
+    def __init__(self):
+        self.active = False  # enabled, or a cProfile capture is armed
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+        self._armed: dict[str, Path | None] = {}
+        self.captures: dict[str, str] = {}  # operation -> pstats text of its last capture
+
+    def _update_active(self) -> None:
+        self.active = self.enabled or bool(self._armed)
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._update_active()
+
+    def disable(self) -> None:
+        self.enabled = False
+        self._update_active()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+            self.captures = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            st = self._stats.get(name)
+            if st is None:
+                st = self._stats[name] = {"calls": 0, "total": 0.0, "max": 0.0, "samples": [], "next": 0}
+            st["calls"] += 1
+            st["total"] += seconds
+            if seconds > st["max"]:
+                st["max"] = seconds
+            samples = st["samples"]
+            if len(samples) < self.MAX_SAMPLES:
+                samples.append(seconds)
+            else:
+                samples[st["next"]] = seconds
+                st["next"] = (st["next"] + 1) % self.MAX_SAMPLES
+
+    @contextmanager
+    def measure(self, name: str):
+        """Time an ad hoc block under `name` (no-op while disabled)."""
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0)
+
+    def capture_next(self, name: str, path: Path | None = None) -> None:
+        """Profile the next call of `name` (e.g. "LibraryData.search_matches") with cProfile.
+        The pstats summary lands in captures[name]; raw stats are also written to `path` if given."""
+        with self._lock:
+            self._armed[name] = Path(path) if path else None
+            self._update_active()
+
+    def _call_captured(self, name: str, fn, args, kwargs):
+        with self._lock:
+            if name not in self._armed:
+                path = False
+            else:
+                path = self._armed.pop(name)
+                self._update_active()
+        if path is False:  # another thread took the capture
+            return fn(*args, **kwargs)
+
+        import cProfile
+        import io
+        import pstats
+
+        prof = cProfile.Profile()
+        t0 = time.perf_counter()
+        try:
+            return prof.runcall(fn, *args, **kwargs)
+        finally:
+            if self.enabled:
+                self.record(name, time.perf_counter() - t0)
+            out = io.StringIO()
+            pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(30)
+            self.captures[name] = out.getvalue()
+            if path is not None:
+                prof.dump_stats(str(path))
+
+    def stats(self) -> dict[str, dict]:
+        """{operation: calls, total_ms, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}, busiest first."""
+        with self._lock:
+            snap = {k: (v["calls"], v["total"], v["max"], sorted(v["samples"])) for k, v in self._stats.items()}
+
+        def pct(samples: list[float], p: float) -> float:
+            return samples[min(len(samples) - 1, int(p / 100 * len(samples)))] if samples else 0.0
+
+        out: dict[str, dict] = {}
+        for name, (calls, total, mx, samples) in sorted(snap.items(), key=lambda kv: -kv[1][1]):
+            out[name] = {
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total * 1000 / calls, 3) if calls else 0.0,
+                "p50_ms": round(pct(samples, 50) * 1000, 3),
+                "p95_ms": round(pct(samples, 95) * 1000, 3),
+                "p99_ms": round(pct(samples, 99) * 1000, 3),
+                "max_ms": round(mx * 1000, 3),
+            }
+        return out
+
+    def dump_json(self, path: Path) -> Path:
+        path = Path(path)
+        _safe_write_json(path, {"enabled": self.enabled, "operations": self.stats(), "captures": self.captures})
+        return path
+
+
+PROFILER = OpProfiler()
+
+def profiled(fn):
+    """Record fn's latency in PROFILER (by qualified name) while profiling is on."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        prof = PROFILER
+        if not prof.active:
+            return fn(*args, **kwargs)
+        if name in prof._armed:
+            return prof._call_captured(name, fn, args, kwargs)
+        if not prof.enabled:
+            return fn(*args, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            prof.record(name, time.perf_counter() - t0)
+
+    return wrapper
+
+# =========================
+# Memory accounting (diagnostics)
+# =========================
+_SIZED_ATOMS = (str, bytes, int, float, bool, type(None))
+
+def deep_sizeof(obj, seen: set[int] | None = None) -> int:
+    """
+    Approximate bytes held by obj: sys.getsizeof over dicts/lists/tuples/sets and what they contain.
+    - objects already in `seen` (by id) count zero, so pass one set across components to avoid
+      counting shared strings/dicts twice (the first component to reach an object owns it)
+    - other objects count their own getsizeof only (their attributes aren't walked)
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, _SIZED_ATOMS):
+            continue
+        if isinstance(o, dict):
+            # snapshot in one C call, so a writer on another thread can't break the walk
+            for k, v in tuple(o.items()):
+                stack.append(k)
+                stack.append(v)
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(tuple(o))
+    return total
+
+def tracemalloc_report(limit: int = 10) -> dict:
+    """Current/peak traced bytes and the top allocation sites, if tracemalloc is tracing."""
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+    current, peak = tracemalloc.get_traced_memory()
+    top = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+    return {
+        "tracing": True,
+        "current_bytes": current,
+        "peak_bytes": peak,
+        "top": [{"where": f"{s.traceback[0].filename}:{s.traceback[0].lineno}", "bytes": s.size, "count": s.count}
+                for s in top],
+    }
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process (POSIX only; None elsewhere)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # bytes on macOS, KiB on Linux
+
+
 # =========================
 # LibraryData
 # =========================
@@ -327,11 +763,14 @@ class LibraryData:
 
     ALL_ALLOWED_GENRES = set(FICTION_GENRES) | set(NONFICTION_GENRES)
 
+    profiler = PROFILER  # see OpProfiler; LibraryData.profiler.enable() to start recording
+
     """
     Owns:
       - internal catalog storage (catalog.json) : dict[book_id, book_dict]
       - cover cache folder (covers/)
       - cover index (cover_index.json) mapping book_id -> cover filename
+      - cover thumbnail cache (thumbs/), pre-sized per display size
       - queues:
           sync_queue  = missing cover
           genre_queue = missing genre/subject
@@ -341,6 +780,7 @@ class LibraryData:
     def __init__(self, data_dir: Path):
         self.data_dir = Path(data_dir)
         self.covers_dir = self.data_dir / "covers"
+        self.thumbs_dir = self.data_dir / "thumbs"
         self.collection_images_dir = self.data_dir / "collection_images"
         self.collection_images_dir.mkdir(parents=True, exist_ok=True)
         self.catalog_path = self.data_dir / "catalog.json"
@@ -366,19 +806,48 @@ class LibraryData:
         self._cached_norm_map: dict[str, str] = {}
         self._token_index: dict[str, set[str]] = {}
 
+        # --- Per-book collation keys (see sort_keys_for) ---
+        self._sort_keys: dict[str, tuple[tuple, tuple]] = {}
+
+        # --- Maintained sorted orderings for paging (built lazily per sort mode) ---
+        self._orderings: dict[str, list[tuple]] = {}
+        self._ordering_keys: dict[str, dict[str, tuple]] = {}
+        self._book_index_lock = threading.RLock()
+
+        # --- Reference alias index: alias -> (rank, book_id); see resolve_book_refs ---
+        self._alias_index: dict[str, tuple[int, str]] | None = None
+        self._alias_owners: dict[str, dict[str, int]] = {}  # alias -> {book_id: rank}, every book carrying it
+        self._book_aliases: dict[str, tuple[str, ...]] = {}
+
+        # --- Tag usage index: tag -> number of books carrying it (built lazily, see _ensure_tag_counts) ---
+        self._tag_counts: dict[str, int] | None = None
+        self._book_tags: dict[str, frozenset[str]] = {}
+
+        # --- Batched writes (see transaction()) ---
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+        # --- Bumped on every persisted edit; lets views tell whether cached UI is still current ---
+        self.generation = 0
+
         # --- Collections (custom user lists) ---
         self.collections_path = self.data_dir / "collections.json"
         self.collections: dict[str, dict] = _safe_load_json(self.collections_path, {})
         if not isinstance(self.collections, dict):
             self.collections = {}
+        # book_id -> {collection_id}; built lazily, maintained by the membership methods
+        self._book_collections: dict[str, set[str]] | None = None
+        # collection_id -> compiled rule, for smart collections (rec["smart"]["query"])
+        self._smart_predicates: dict[str, Callable[[dict], bool]] = {}
 
         # --- Recent tag history (persisted) ---
+        # OrderedDict LRU: tag -> (decayed use score, last-used ts), most-recent LAST.
+        # Written lazily (dirty flag + short debounce), never on launch.
         self.recent_tags_path = self.data_dir / "recent_tags.json"
-        self.recent_tags = _safe_load_json(self.recent_tags_path, [])
-        if not isinstance(self.recent_tags, list):
-            self.recent_tags = []
-        self.recent_tags = [_norm_tag(t) for t in self.recent_tags if _norm_tag(t)]
-        _safe_write_json(self.recent_tags_path, self.recent_tags)
+        self._recent_tags_lock = threading.Lock()
+        self._recent_tags_dirty = False
+        self._recent_tags_timer: threading.Timer | None = None
+        self.recent_tags: OrderedDict[str, tuple[float, float]] = self._load_recent_tags()
 
         # --- User-defined genres (persisted) ---
         self.user_genres_path = self.data_dir / "user_genres.json"
@@ -427,10 +896,23 @@ class LibraryData:
             self.rebuild_queues(force=True)  # Force rebuild after normalization
             self.save()
 
+        # Collections saved by older versions may reference books by ISBN/title/dicts
+        if self.migrate_collection_book_ids(persist=False):
+            _safe_write_json(self.collections_path, self.collections)
+
+        # Smart collections: membership is derived, re-evaluate once against the loaded catalog
+        self.refresh_smart_collections()
+
+    @profiled
     def save(self):
+        if self._batch_depth:
+            # inside transaction(): write (and invalidate search) once on exit
+            self._batch_dirty = True
+            return
         _safe_write_json(self.catalog_path, self.catalog)
         _safe_write_json(self.cover_index_path, self.cover_index)
-        _safe_write_json(self.collections_path, self.collections)
+        with self._book_index_lock:  # sync workers update smart membership under this lock
+            _safe_write_json(self.collections_path, self.collections)
 
         # Persist user customizations too (so they survive restarts)
         try:
@@ -445,9 +927,31 @@ class LibraryData:
             _safe_write_json(self.deleted_genres_path, sorted(getattr(self, "deleted_genres", set()), key=str.lower))
         except Exception:
             pass
+        self._save_recent_tags()
 
+        self.generation += 1
         self._invalidate_search_cache()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group many edits into one write:
+            with data.transaction():
+                data.add_book_to_collection(...)
+                data.touch_collection_book(...)
+        save() calls inside the block are deferred; if any happened, one save()
+        (catalog/collections write + search invalidation) runs on exit. Nests safely.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self.save()
+
+    @profiled
     def factory_reset(self) -> None:
         """
         Deletes ALL stored library data on disk (covers + catalog + queues + any future
@@ -496,12 +1000,21 @@ class LibraryData:
         self.user_genres = set()  # Clear custom user genres
         self.genre_overrides = {}  # Clear renamed standard genres (restore to defaults)
         self.deleted_genres = set()  # Clear deleted genres (restore standard genres)
+        self._drop_book_indexes()
+        with self._recent_tags_lock:
+            if self._recent_tags_timer is not None:
+                self._recent_tags_timer.cancel()
+                self._recent_tags_timer = None
+            self.recent_tags.clear()
+            self._recent_tags_dirty = False
         self.save()
         self._save_sync_queue()
         self._save_genre_queue()
         self._save_genre_overrides()
         self._save_deleted_genres()
         self.collections = {}
+        self._book_collections = None
+        self._smart_predicates = {}
         self._migrate_collection_read_to_catalog()
 
     # =========================
@@ -548,6 +1061,7 @@ class LibraryData:
             return
         b["read"] = bool(is_read)
         self.catalog[bid] = b
+        self._update_smart_membership(bid)
         if persist:
             self.save()
 
@@ -763,6 +1277,7 @@ class LibraryData:
         g = (genre or "").strip().title()
         return g in self.deleted_genres
 
+    @profiled
     def delete_genre(self, genre: str) -> int:
         """
         Delete a genre (standard or custom) and clear it from all books.
@@ -788,6 +1303,7 @@ class LibraryData:
             if book_genre == g or (original and book_genre == original):
                 book["genre"] = ""
                 self.catalog[bid] = book
+                self.note_book_changed(bid)
                 books_updated += 1
         
         if self.is_user_genre(g):
@@ -815,6 +1331,7 @@ class LibraryData:
             
         return books_updated
 
+    @profiled
     def rename_genre(self, old_name: str, new_name: str) -> int:
         """
         Rename a genre (standard or custom) and update all books with that genre.
@@ -839,6 +1356,7 @@ class LibraryData:
             if book_genre == old:
                 book["genre"] = new
                 self.catalog[bid] = book
+                self.note_book_changed(bid)
                 count += 1
 
         if is_standard:
@@ -864,6 +1382,7 @@ class LibraryData:
 
         return count
 
+    @profiled
     def get_all_active_genres(self) -> list[str]:
         """
         Get all active genres (for display in UI).
@@ -924,10 +1443,10 @@ class LibraryData:
         self._cached_norm_map = {}
         self._token_index = {}
 
-    def _build_search_token_index(self) -> None:
+    def _build_search_token_index(self, norm_index: list[tuple[str, str]] | None = None) -> None:
         """Build token -> originals index for faster suggestions."""
         token_index: dict[str, set[str]] = {}
-        for orig, norm in self._cached_norm_index:
+        for orig, norm in (self._cached_norm_index if norm_index is None else norm_index):
             for t in (norm or "").split():
                 if t and t not in _SEARCH_STOPWORDS:
                     token_index.setdefault(t, set()).add(orig)
@@ -942,6 +1461,7 @@ class LibraryData:
     
     # ---------- SEARCH CANDIDATES & MATCHING ----------
 
+    @profiled
     def collect_search_candidates(self) -> list[str]:
         """
         Collect (and cache) unique searchable strings from the catalog for autocomplete/suggestions.
@@ -981,12 +1501,26 @@ class LibraryData:
                 seen.add(norm)
                 out.append(s)
 
+        norm_index = [(orig, _normalize_text(orig)) for orig in out]
         self._cached_candidates = out
-        self._cached_norm_index = [(orig, _normalize_text(orig)) for orig in out]
-        self._cached_norm_map = {orig: norm for orig, norm in self._cached_norm_index}
-        self._build_search_token_index()
+        self._cached_norm_map = {orig: norm for orig, norm in norm_index}
+        self._build_search_token_index(norm_index)
+        # published last: search_matches() treats a non-empty index as ready
+        self._cached_norm_index = norm_index
         return out
 
+    @profiled
+    def warm_search_index(self) -> None:
+        """
+        Build the suggestion index ahead of the first keystroke (safe to run on a worker thread).
+        If the catalog changes mid-build the result is dropped and rebuilt lazily on next use.
+        """
+        gen = self.generation
+        self.collect_search_candidates()
+        if self.generation != gen:
+            self._invalidate_search_cache()
+
+    @profiled
     def search_matches(self, query: str, limit: int = 6) -> list[str]:
         """
         Autocomplete-style matching:
@@ -1054,6 +1588,8 @@ class LibraryData:
         # --- Fuzzy fill (typo tolerance) ---
         # Only for longer queries to avoid noise.
         if len(q) >= 3:
+            from difflib import SequenceMatcher
+
             existing = set(results)
             fuzzy: list[tuple[int, str]] = []
 
@@ -1065,7 +1601,7 @@ class LibraryData:
                 if not any(tok.startswith(q[0]) for tok in norm.split()):
                     continue
 
-                sim = difflib.SequenceMatcher(a=q, b=norm).ratio()
+                sim = SequenceMatcher(a=q, b=norm).ratio()
                 if sim < 0.62:
                     continue
 
@@ -1089,7 +1625,346 @@ class LibraryData:
 
 
 
+    # ---------- Sort keys (cached per book) ----------
+    # Index into the tuple returned by sort_keys_for()
+    SORT_TITLE, SORT_AUTHOR, SORT_YEAR, SORT_GENRE = 0, 1, 2, 3
+    _SORT_FIELDS = {"title": 0, "author": 1, "year": 2, "genre": 3}
+    _SORT_SIG_FIELDS = ("title", "first_name", "last_name", "creators",
+                        "publish_date", "date_published", "_year", "genre")
+
+    def _compute_sort_keys(self, b: dict) -> tuple:
+        title = _title_collation_key(b.get("title") or "Untitled")
+
+        first = (b.get("first_name") or "").strip()
+        last = (b.get("last_name") or "").strip()
+        creators = (b.get("creators") or "").strip()
+        if last or first:
+            sort_last = last.lower() or "zzz"
+            sort_first = first.lower()
+        elif creators:
+            parts = creators.split()
+            sort_last = parts[-1].lower() if parts else "zzz"
+            sort_first = " ".join(parts[:-1]).lower() if len(parts) >= 2 else ""
+        else:
+            sort_last, sort_first = "zzz", ""
+
+        try:
+            year = int(self._year_from_row(b) or 0)
+        except (TypeError, ValueError):
+            year = 0
+
+        genre = sys.intern((b.get("genre") or "").strip().lower())
+        return (title, (sort_last, sort_first, title), year, genre)
+
+    def sort_keys_for(self, b: dict) -> tuple:
+        """
+        Collation keys for one book: (title, (author_last, author_first, title), year, genre).
+        - title ignores a leading "The/A/An"
+        - cached by book_id; recomputed only when one of the sort fields changed
+          (so edits that mutate the dict in place are picked up too)
+        """
+        get = b.get
+        sig = tuple(get(k) for k in self._SORT_SIG_FIELDS)
+        bid = get("book_id")
+        if not bid:
+            return self._compute_sort_keys(b)
+        hit = self._sort_keys.get(bid)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        keys = self._compute_sort_keys(b)
+        self._sort_keys[bid] = (sig, keys)
+        return keys
+
+    def sort_key_func(self, field: str) -> Callable[[dict], Any] | None:
+        """Key function for "title"/"author"/"year"/"genre" (None for other fields)."""
+        idx = self._SORT_FIELDS.get((field or "").strip().lower())
+        if idx is None:
+            return None
+        keys_for = self.sort_keys_for
+        return lambda b: keys_for(b)[idx]
+
+    def invalidate_sort_keys(self, book_id: str | None = None) -> None:
+        """Drop cached collation keys for one book (or all of them)."""
+        if book_id is None:
+            self._sort_keys = {}
+        else:
+            self._sort_keys.pop(book_id, None)
+
+    # ---------- Sorted orderings + paging ----------
+    PAGE_SORTS = ("title", "author", "year", "genre", "last updated")
+
+    def _ordering_key(self, mode: str, bid: str, b: dict) -> tuple:
+        """Unique, totally ordered entry for one book in one ordering (book_id breaks ties)."""
+        k = self.sort_keys_for(b)
+        if mode == "author":
+            return (k[1], bid)
+        if mode == "year":
+            return (k[2], k[0], bid)
+        if mode == "genre":
+            return (k[3], k[0], bid)
+        if mode == "last updated":
+            try:
+                ts = float(b.get("updated_at") or 0.0)
+            except (TypeError, ValueError):
+                ts = 0.0
+            return (ts, k[0], bid)
+        return (k[0], bid)
+
+    def _ensure_ordering(self, mode: str) -> list[tuple]:
+        """Build the ordering for mode on first use (or if the catalog size drifted)."""
+        order = self._orderings.get(mode)
+        if order is not None and len(order) == len(self.catalog):
+            return order
+        keys = {bid: self._ordering_key(mode, bid, b) for bid, b in self.catalog.items()}
+        order = sorted(keys.values())
+        self._orderings[mode] = order
+        self._ordering_keys[mode] = keys
+        return order
+
+    def _drop_book_indexes(self) -> None:
+        """Forget every derived per-book index (sort keys, orderings, aliases); they rebuild lazily."""
+        with self._book_index_lock:
+            self._sort_keys = {}
+            self._orderings = {}
+            self._ordering_keys = {}
+            self._alias_index = None
+            self._alias_owners = {}
+            self._book_aliases = {}
+            self._tag_counts = None
+            self._book_tags = {}
+
+    def note_book_changed(self, book_id: str) -> None:
+        """
+        Call after a book was added, edited or removed.
+        - bumps self.generation
+        - drops its cached collation keys
+        - moves it within every built ordering (bisect remove + insort), no full re-sort
+        """
+        bid = (book_id or "").strip()
+        if not bid:
+            return
+        self.generation += 1
+        self.invalidate_sort_keys(bid)
+        with self._book_index_lock:
+            self._update_smart_membership(bid)
+            b = self.catalog.get(bid)
+            self._reindex_book_aliases(bid, b)
+            self._reindex_book_tags(bid)
+            for mode, order in self._orderings.items():
+                keys = self._ordering_keys[mode]
+                old = keys.pop(bid, None)
+                if old is not None:
+                    i = bisect_left(order, old)
+                    if i < len(order) and order[i] == old:
+                        del order[i]
+                if b is not None:
+                    new = self._ordering_key(mode, bid, b)
+                    insort(order, new)
+                    keys[bid] = new
+
+    @profiled
+    def page(self, sort: str = "Title", offset: int = 0, limit: int = 50, reverse: bool = False) -> list[dict]:
+        """
+        One page of books in a maintained sort order, without sorting the catalog.
+        - sort: "Title", "Author", "Year", "Genre" or "Last Updated"
+        - reverse: walks the ordering backwards (Z-A / newest first)
+        """
+        mode = (sort or "title").strip().lower()
+        if mode == "updated":
+            mode = "last updated"
+        if mode not in self.PAGE_SORTS:
+            mode = "title"
+        offset = max(0, int(offset))
+        limit = max(0, int(limit))
+
+        with self._book_index_lock:
+            order = self._ensure_ordering(mode)
+            n = len(order)
+            if reverse:
+                start = n - 1 - offset
+                stop = max(start - limit, -1)
+                entries = [order[i] for i in range(start, stop, -1)]
+            else:
+                entries = order[offset:offset + limit]
+
+        out: list[dict] = []
+        for e in entries:
+            b = self.catalog.get(e[-1])
+            if b is not None:
+                out.append(b)
+        return out
+
+    @profiled
+    def ordered_book_ids(self, sort: str = "Title", reverse: bool = False) -> list[str]:
+        """All book_ids in a maintained sort order (same modes as page())."""
+        return [b.get("book_id") or "" for b in self.page(sort, 0, len(self.catalog), reverse)]
+
+    @profiled
+    def books_in_genre(self, genre: str, sort: str = "Title", reverse: bool = False) -> list[dict]:
+        """
+        Books whose genre matches (case-insensitive), for the genre page.
+        Read off the maintained "genre" ordering, where one genre is a contiguous run already in
+        title order, so it costs O(log n + matches) rather than a catalog scan. Other sorts
+        (same modes as page()) reorder just the matches.
+        """
+        g = (genre or "").strip().lower()
+        if not g:
+            return []
+        mode = (sort or "title").strip().lower()
+        if mode == "updated":
+            mode = "last updated"
+        if mode not in self.PAGE_SORTS:
+            mode = "title"
+
+        with self._book_index_lock:
+            order = self._ensure_ordering("genre")
+            i = bisect_left(order, (g,))
+            ids: list[str] = []
+            while i < len(order) and order[i][0] == g:
+                ids.append(order[i][-1])
+                i += 1
+            if mode not in ("title", "genre"):
+                self._ensure_ordering(mode)
+                keys = self._ordering_keys[mode]
+                ids.sort(key=keys.__getitem__)
+
+        if reverse:
+            ids.reverse()
+        out: list[dict] = []
+        for bid in ids:
+            b = self.catalog.get(bid)
+            if b is not None:
+                out.append(b)
+        return out
+
+    # ---------- Book reference aliases ----------
+    # Older collections saved books under many key styles; every one of these resolves.
+    # rank: when two books share an alias the lower rank (stronger identifier) wins.
+    _ALIAS_FIELDS = (
+        ("book_id", 0), ("id", 0),
+        ("isbn13", 1), ("isbn_13", 1), ("ean_isbn13", 1),
+        ("isbn10", 1), ("isbn_10", 1), ("upc_isbn10", 1), ("isbn", 1),
+        ("title", 2),
+    )
+
+    def _aliases_for(self, bid: str, b: dict) -> dict[str, int]:
+        """alias -> rank for one book: raw, normalized and digits-only values plus ISBN-10/13 twins."""
+        out: dict[str, int] = {}
+
+        def add(alias: str, rank: int) -> None:
+            if alias and (alias not in out or rank < out[alias]):
+                out[alias] = rank
+
+        add(bid, 0)
+        if bid.startswith("isbn:"):
+            for alt in _isbn_variants(bid[5:]):
+                add(alt, 1)
+
+        for fld, rank in self._ALIAS_FIELDS:
+            v = b.get(fld)
+            if v is None:
+                continue
+            if isinstance(v, (int, float)):
+                v = str(int(v))
+            v = str(v).strip()
+            if not v:
+                continue
+            add(v, rank)
+            add(_norm(v), rank)
+            if rank == 1:
+                add(_only_digits(v), 1)
+                for alt in _isbn_variants(v):
+                    add(alt, 1)
+        return out
+
+    def _reindex_book_aliases(self, bid: str, b: dict | None) -> None:
+        """Replace one book's entries in the alias index (caller holds _book_index_lock)."""
+        index = self._alias_index
+        if index is None:
+            return
+        owners_by_alias = self._alias_owners
+        for alias in self._book_aliases.pop(bid, ()):
+            owners = owners_by_alias.get(alias)
+            if owners is None:
+                continue
+            owners.pop(bid, None)
+            if not owners:
+                del owners_by_alias[alias]
+                index.pop(alias, None)
+            elif index.get(alias, (0, ""))[1] == bid:
+                # another book still carries this alias: hand it to the strongest (earliest on ties)
+                heir = min(owners.items(), key=lambda kv: kv[1])
+                index[alias] = (heir[1], heir[0])
+        if b is None:
+            return
+        aliases = self._aliases_for(bid, b)
+        for alias, rank in aliases.items():
+            owners_by_alias.setdefault(alias, {})[bid] = rank
+            hit = index.get(alias)
+            if hit is None or rank < hit[0]:
+                index[alias] = (rank, bid)
+        self._book_aliases[bid] = tuple(aliases)
+
+    def _ensure_alias_index(self) -> dict[str, tuple[int, str]]:
+        index = self._alias_index
+        if index is not None and len(self._book_aliases) == len(self.catalog):
+            return index
+        self._alias_index = {}
+        self._alias_owners = {}
+        self._book_aliases = {}
+        for bid, b in self.catalog.items():
+            self._reindex_book_aliases(bid, b)
+        return self._alias_index
+
+    def resolve_book_ref(self, ref: Any) -> str | None:
+        """
+        Catalog book_id for one stored reference, or None.
+        Accepts book_ids, ISBNs (with or without dashes, 10 or 13), titles, numbers
+        and whole book dicts (their id/isbn/title fields are tried in order).
+        """
+        if ref is None:
+            return None
+        if isinstance(ref, dict):
+            for fld, _rank in self._ALIAS_FIELDS:
+                bid = self.resolve_book_ref(ref.get(fld))
+                if bid:
+                    return bid
+            return None
+        if isinstance(ref, (int, float)):
+            ref = str(int(ref))
+        raw = str(ref).strip()
+        if not raw:
+            return None
+        if raw in self.catalog:
+            return raw
+
+        with self._book_index_lock:
+            index = self._ensure_alias_index()
+            for probe in (raw, _norm(raw), _only_digits(raw), *_isbn_variants(raw)[:1]):
+                hit = index.get(probe) if probe else None
+                if hit is not None:
+                    return hit[1]
+        return None
+
+    @profiled
+    def resolve_book_refs(self, ids: Iterable[Any]) -> list[dict]:
+        """
+        Resolve stored references to book dicts, preserving order and dropping
+        duplicates/unknowns. O(len(ids)) once the alias index exists.
+        """
+        out: list[dict] = []
+        seen: set[str] = set()
+        for ref in (ids or []):
+            bid = self.resolve_book_ref(ref)
+            if bid and bid not in seen:
+                b = self.catalog.get(bid)
+                if b is not None:
+                    seen.add(bid)
+                    out.append(b)
+        return out
+
     # ---------- COLLECTION GROUPING & SORTING ----------
+    @profiled
     def group_books_by_genre(self, books: list[dict]) -> list[tuple[str, list[dict]]]:
         """
         Group a list of books by their genre, sorted alphabetically.
@@ -1104,6 +1979,7 @@ class LibraryData:
         """
         from collections import defaultdict
         
+        keys_for = self.sort_keys_for
         groups: dict[str, list[dict]] = defaultdict(list)
         for b in books:
             g = (b.get("genre") or "").strip() or "Unknown"
@@ -1111,10 +1987,11 @@ class LibraryData:
         
         out: list[tuple[str, list[dict]]] = []
         for g in sorted(groups.keys(), key=str.lower):
-            sorted_books = sorted(groups[g], key=lambda x: (x.get("title") or "").lower())
+            sorted_books = sorted(groups[g], key=lambda x: keys_for(x)[0])
             out.append((g, sorted_books))
         return out
 
+    @profiled
     def sort_collection_books(
         self, 
         collection_name: str, 
@@ -1139,23 +2016,25 @@ class LibraryData:
             bid = str(b.get("id") or b.get("book_id") or "")
             b["_collection_last_updated"] = self.get_collection_last_updated(collection_name, bid)
         
+        keys_for = self.sort_keys_for
         if mode == "last_updated":
             # Most recently updated first, then by title
             return sorted(
                 books,
-                key=lambda b: (b.get("_collection_last_updated", 0.0), (b.get("title") or "").lower()),
+                key=lambda b: (b.get("_collection_last_updated", 0.0), keys_for(b)[0]),
                 reverse=True
             )
         elif mode == "genre":
             # By genre, then by title within genre
             return sorted(
                 books,
-                key=lambda b: ((b.get("genre") or "Unknown").lower(), (b.get("title") or "").lower())
+                key=lambda b: (keys_for(b)[3] or "unknown", keys_for(b)[0])
             )
         else:
             # Default: by title
-            return sorted(books, key=lambda b: (b.get("title") or "").lower())
+            return sorted(books, key=lambda b: keys_for(b)[0])
 
+    @profiled
     def top_tags_for_books(self, book_ids: list[str], limit: int = 8) -> list[str]:
         """
         Get the most frequently used tags across a set of books.
@@ -1189,6 +2068,7 @@ class LibraryData:
         return [tag for tag, count in counter.most_common(limit)]
 
     # ---------- COVER IMPORT (PERSISTED IMMEDIATELY) ----------
+    @profiled
     def set_cover_from_file(self, book_id: str, src_path: Path) -> None:
         """Copy a user-picked cover image into covers/ and update cover_index + queues, then persist immediately."""
         bid = (book_id or "").strip()
@@ -1198,6 +2078,9 @@ class LibraryData:
         if not p.exists():
             raise FileNotFoundError(str(p))
 
+        # old cover's thumbnails are dead weight once it's replaced
+        self.drop_cover_thumbnails(self.cover_index.get(bid, ""))
+
         ext = p.suffix.lower()
         if ext not in (".jpg", ".jpeg", ".png", ".webp", ".gif"):
             ext = ".png"
@@ -1238,7 +2121,7 @@ class LibraryData:
         meta = rec.get("book_meta") or {}
         return meta.get(str(book_id), {}) if isinstance(meta, dict) else {}
 
-    def set_collection_book_meta(self, collection_name_or_id: str, book_id: str, updates: dict) -> None:
+    def set_collection_book_meta(self, collection_name_or_id: str, book_id: str, updates: dict, *, persist: bool = True) -> None:
         cid = self._resolve_collection_id(collection_name_or_id)
         if not cid:
             return
@@ -1255,7 +2138,8 @@ class LibraryData:
         row.update(dict(updates or {}))
         meta[bid] = row
 
-        self._save_collections()
+        if persist:
+            self._save_collections()
 
     def _migrate_collection_read_to_catalog(self) -> None:
         """
@@ -1319,11 +2203,11 @@ class LibraryData:
         """
         self.set_book_read(str(book_id), bool(is_read), persist=True)
 
-    def touch_collection_book(self, collection_name: str, book_id: str) -> None:
+    def touch_collection_book(self, collection_name: str, book_id: str, *, persist: bool = True) -> None:
         """
         Call this whenever collection-specific details for this book are edited.
         """
-        self.set_collection_book_meta(collection_name, book_id, {"last_updated": time.time()})
+        self.set_collection_book_meta(collection_name, book_id, {"last_updated": time.time()}, persist=persist)
 
     def get_collection_last_updated(self, collection_name: str, book_id: str) -> float:
         meta = self.get_collection_book_meta(collection_name, book_id)
@@ -1422,6 +2306,74 @@ class LibraryData:
         p = self.covers_dir / filename
         return p if p.exists() else None
 
+    # ---------- Cover thumbnails (thumbs/) ----------
+    THUMB_QUALITY = 88
+
+    def _thumbnail_path(self, cover: Path, size: tuple[int, int]) -> Path:
+        """thumbs/<cover filename>.<w>x<h>.<mtime_ns>.jpg -- a rewritten cover file never hits a stale thumb."""
+        w, h = int(size[0]), int(size[1])
+        mtime = cover.stat().st_mtime_ns
+        return self.thumbs_dir / f"{cover.name}.{w}x{h}.{mtime}.jpg"
+
+    @profiled
+    def get_cover_thumbnail(self, book_id: str, size: tuple[int, int]) -> Path | None:
+        """
+        Path to a pre-sized copy of the book's cover that fits inside `size`.
+        Built on first request (LANCZOS, once) and reused afterwards; safe to call from worker threads.
+        Returns None when there is no cover or Pillow isn't available (callers fall back to get_cover_path).
+        """
+        cover = self.get_cover_path((book_id or "").strip())
+        if cover is None or _pil_image() is None:
+            return None
+        try:
+            thumb = self._thumbnail_path(cover, size)
+        except OSError:
+            return None
+        if thumb.exists():
+            return thumb
+
+        try:
+            self.thumbs_dir.mkdir(parents=True, exist_ok=True)
+            im = decode_fitted_image(cover, size)
+            # write-then-rename so a reader never sees a half-written file
+            tmp = thumb.with_name(f"{thumb.name}.{threading.get_ident()}.tmp")
+            im.save(tmp, "JPEG", quality=self.THUMB_QUALITY)
+            tmp.replace(thumb)
+        except Exception:
+            return None
+
+        # older mtimes of the same cover/size are stale now
+        for old in self.thumbs_dir.glob(f"{glob.escape(cover.name)}.{int(size[0])}x{int(size[1])}.*.jpg"):
+            if old != thumb:
+                try:
+                    old.unlink()
+                except Exception:
+                    pass
+        return thumb
+
+    @profiled
+    def warm_cover_thumbnails(self, book_ids: Iterable[str], size: tuple[int, int], *,
+                              stop_flag: Callable[[], bool] | None = None) -> int:
+        """Generate missing thumbnails for book_ids (meant for a background thread). Returns how many exist after."""
+        made = 0
+        for bid in book_ids:
+            if stop_flag and stop_flag():
+                break
+            if self.get_cover_thumbnail(bid, size) is not None:
+                made += 1
+        return made
+
+    def drop_cover_thumbnails(self, cover_filename: str) -> None:
+        """Delete every cached thumbnail (all sizes) of one cover file."""
+        name = (cover_filename or "").strip()
+        if not name or not self.thumbs_dir.exists():
+            return
+        for p in self.thumbs_dir.glob(f"{glob.escape(name)}.*"):
+            try:
+                p.unlink()
+            except Exception:
+                pass
+
     def _has_genre(self, b: dict) -> bool:
         # For queues: only count a CLEAN canonical genre as "has genre"
         return self._genre_is_clean(b)
@@ -1448,6 +2400,7 @@ class LibraryData:
         # must be exactly one of your allowed genres
         return g_norm in self.ALL_ALLOWED_GENRES
 
+    @profiled
     def recanonize_all_genres(self) -> int:
         """
         Recompute bucket genre + starter tags for every book using existing subjects_raw/subject.
@@ -1533,6 +2486,7 @@ class LibraryData:
         except Exception:
             pass
 
+    @profiled
     def rebuild_queues(self, force: bool = False):
         """
         Rebuild sync queues by scanning the catalog.
@@ -1556,6 +2510,7 @@ class LibraryData:
         self._save_sync_queue()
         self._save_genre_queue()
 
+    @profiled
     def get_books_needing_update(self) -> list[dict]:
         """
         Union of:
@@ -1626,6 +2581,7 @@ class LibraryData:
             self._save_genre_queue()
 
     # ---------- Normalization (safe migration) ----------
+    @profiled
     def normalize_catalog_keys(self) -> int:
         """
         Consolidates legacy genre-ish fields into canonical:
@@ -1671,6 +2627,7 @@ class LibraryData:
         return changed
 
     # ---------- Import / Export ----------
+    @profiled
     def import_csv(
             self,
             csv_path: Path,
@@ -1733,6 +2690,14 @@ class LibraryData:
                 imported_book_ids.append(book_id)  # Track for sync queue
                 report.created += 1
 
+        # Keep paging orderings current: small imports move single books, big ones rebuild lazily
+        if len(imported_book_ids) > 256:
+            self._drop_book_indexes()
+            self.refresh_smart_collections()  # note_book_changed is skipped, so re-evaluate membership here
+        else:
+            for bid in imported_book_ids:
+                self.note_book_changed(bid)
+
         self.save()
         
         # Queue imported books for sync (incremental, not full rebuild)
@@ -1741,6 +2706,7 @@ class LibraryData:
         
         return report
 
+    @profiled
     def export_csv(self, out_path: Path, rows: list[dict] | None = None):
         """
         Export books to CSV with consistent column ordering.
@@ -1866,6 +2832,7 @@ class LibraryData:
     # =========================
     # Collections (custom user lists)
     # =========================
+    @profiled
     def list_collections(self) -> list[dict]:
         """Returns all saved collections as a list of dicts."""
         out = list(self.collections.values())
@@ -1893,9 +2860,10 @@ class LibraryData:
             "name": name,
             "created_at": ts,
             "updated_at": ts,
-            "book_ids": list(book_ids or []),
+            "book_ids": self._canonical_book_ids(book_ids or []),
         }
         self.collections[cid] = rec
+        self._note_collection_members(cid, (), rec["book_ids"])
         if persist:
             self.save()
         return rec
@@ -1906,6 +2874,8 @@ class LibraryData:
             return False
         existed = cid in self.collections
         if existed:
+            self._smart_predicates.pop(cid, None)
+            self._note_collection_members(cid, self.collections[cid].get("book_ids") or [], ())
             self.collections.pop(cid, None)
             self.clear_collection_photo(cid, persist=False)
             if persist:
@@ -1927,9 +2897,11 @@ class LibraryData:
 
     def set_collection_books(self, collection_id: str, book_ids: list[str], *, persist: bool = True) -> bool:
         cid = (collection_id or "").strip()
-        if cid not in self.collections:
+        if cid not in self.collections or self.is_smart_collection(cid):
             return False
-        self.collections[cid]["book_ids"] = list(book_ids or [])
+        new_ids = self._canonical_book_ids(book_ids or [])
+        self._note_collection_members(cid, self.collections[cid].get("book_ids") or [], new_ids)
+        self.collections[cid]["book_ids"] = new_ids
         self.collections[cid]["updated_at"] = self._now_ts()
         if persist:
             self.save()
@@ -2040,7 +3012,7 @@ class LibraryData:
         This makes "Save Collection" behave the way users expect across sessions.
         """
         name = (name or "").strip() or "Untitled Collection"
-        book_ids = list(book_ids or [])
+        book_ids = self._canonical_book_ids(book_ids or [])
 
         cid = self._find_collection_id_by_name(name)
         if cid is None:
@@ -2056,7 +3028,10 @@ class LibraryData:
                 "book_ids": [],
             })
 
-        # update fields
+        # update fields (saving an explicit list turns a smart collection into a regular one)
+        self.collections[cid].pop("smart", None)
+        self._smart_predicates.pop(cid, None)
+        self._note_collection_members(cid, self.collections[cid].get("book_ids") or [], book_ids)
         self.collections[cid]["name"] = name
         self.collections[cid]["book_ids"] = book_ids
         self.collections[cid]["updated_at"] = self._now_ts()
@@ -2072,21 +3047,23 @@ class LibraryData:
         Accepts either collection name or collection_id.
         """
         cid = self._resolve_collection_id(collection_name_or_id)
-        if not cid or cid not in self.collections:
+        if not cid or cid not in self.collections or self.is_smart_collection(cid):
             return False
 
         book_id = (book_id or "").strip()
         if not book_id:
             return False
+        book_id = self.resolve_book_ref(book_id) or book_id
+
+        if cid in self._collections_index().get(book_id, ()):
+            return False  # Already in collection
 
         book_ids = self.collections[cid].get("book_ids") or []
         if not isinstance(book_ids, list):
             book_ids = []
 
-        if book_id in book_ids:
-            return False  # Already in collection
-
         book_ids.append(book_id)
+        self._note_collection_members(cid, (), (book_id,))
         self.collections[cid]["book_ids"] = book_ids
         self.collections[cid]["updated_at"] = self._now_ts()
 
@@ -2100,21 +3077,23 @@ class LibraryData:
         Accepts either collection name or collection_id.
         """
         cid = self._resolve_collection_id(collection_name_or_id)
-        if not cid or cid not in self.collections:
+        if not cid or cid not in self.collections or self.is_smart_collection(cid):
             return False
 
         book_id = (book_id or "").strip()
         if not book_id:
             return False
+        book_id = self.resolve_book_ref(book_id) or book_id
+
+        if cid not in self._collections_index().get(book_id, ()):
+            return False  # Not in collection
 
         book_ids = self.collections[cid].get("book_ids") or []
         if not isinstance(book_ids, list):
             book_ids = []
 
-        if book_id not in book_ids:
-            return False  # Not in collection
-
-        book_ids.remove(book_id)
+        book_ids = [x for x in book_ids if x != book_id]
+        self._note_collection_members(cid, (book_id,), ())
         self.collections[cid]["book_ids"] = book_ids
         self.collections[cid]["updated_at"] = self._now_ts()
 
@@ -2122,6 +3101,301 @@ class LibraryData:
             self.save()
         return True
 
+    def add_books_to_collection(self, collection_name_or_id: str, book_ids: Iterable[Any], *, persist: bool = True) -> int:
+        """
+        Add many books in one pass (one timestamp bump, at most one save).
+        Returns how many were newly added.
+        """
+        result = self.apply_collection_changes(collection_name_or_id, add=book_ids, persist=persist)
+        return result["added"]
+
+    @profiled
+    def apply_collection_changes(
+            self,
+            collection_name_or_id: str,
+            *,
+            add: Iterable[Any] = (),
+            remove: Iterable[Any] = (),
+            touch: Iterable[Any] = (),
+            persist: bool = True,
+    ) -> dict:
+        """
+        Apply a batch of membership edits to one collection:
+        - add / remove: book references (canonicalized like set_collection_books)
+        - touch: books whose collection last_updated should be bumped
+        Returns {"added", "removed", "touched"}; saves once if anything changed.
+        """
+        result = {"added": 0, "removed": 0, "touched": 0}
+        cid = self._resolve_collection_id(collection_name_or_id)
+        if not cid or cid not in self.collections:
+            return result
+        rec = self.collections[cid]
+        smart = self.is_smart_collection(cid)
+
+        book_ids = rec.get("book_ids") or []
+        if not isinstance(book_ids, list):
+            book_ids = []
+        present = set(book_ids)
+
+        to_add: list[str] = []
+        to_remove: set[str] = set()
+        if not smart:
+            for bid in self._canonical_book_ids(add):
+                if bid not in present:
+                    present.add(bid)
+                    to_add.append(bid)
+            for bid in self._canonical_book_ids(remove):
+                if bid in present and bid not in to_add:
+                    to_remove.add(bid)
+
+        if to_add or to_remove:
+            new_ids = [b for b in book_ids if b not in to_remove] + to_add
+            self._note_collection_members(cid, to_remove, to_add)
+            rec["book_ids"] = new_ids
+            rec["updated_at"] = self._now_ts()
+            meta = rec.get("book_meta")
+            if isinstance(meta, dict):
+                for bid in to_remove:
+                    meta.pop(bid, None)
+            result["added"] = len(to_add)
+            result["removed"] = len(to_remove)
+
+        now = time.time()
+        for bid in self._canonical_book_ids(touch):
+            self.set_collection_book_meta(cid, bid, {"last_updated": now}, persist=False)
+            result["touched"] += 1
+
+        if persist and any(result.values()):
+            self.save()
+        return result
+
+    # ---------- Canonical membership + reverse index ----------
+    @staticmethod
+    def _coerce_collection_refs(raw: Any) -> list:
+        """Flatten a stored book_ids value (list, comma string, single value) into a list of refs."""
+        if raw is None:
+            return []
+        if isinstance(raw, str):
+            return [p.strip() for p in raw.split(",") if p.strip()]
+        if isinstance(raw, (list, tuple)):
+            return list(raw)
+        return [raw]
+
+    def _canonical_book_ids(self, refs: Iterable[Any]) -> list[str]:
+        """
+        Map references to catalog book_ids, preserving order and dropping duplicates.
+        References that don't resolve (book not in the catalog yet) are kept as plain strings.
+        """
+        out: list[str] = []
+        seen: set[str] = set()
+        for ref in self._coerce_collection_refs(refs):
+            bid = self.resolve_book_ref(ref)
+            if not bid:
+                if isinstance(ref, dict):
+                    continue
+                bid = str(int(ref)) if isinstance(ref, (int, float)) else str(ref or "").strip()
+            if bid and bid not in seen:
+                seen.add(bid)
+                out.append(bid)
+        return out
+
+    @profiled
+    def migrate_collection_book_ids(self, *, persist: bool = True) -> int:
+        """
+        Rewrite every collection's book_ids (and book_meta keys) to canonical catalog keys.
+        Cheap no-op when everything is already canonical. Returns collections changed.
+        """
+        changed = 0
+        for cid, rec in (self.collections or {}).items():
+            if not isinstance(rec, dict):
+                continue
+            raw = rec.get("book_ids")
+            if raw is None and "ids" in rec:
+                raw = rec.get("ids")
+            meta = rec.get("book_meta")
+            catalog = self.catalog
+            if "ids" not in rec and isinstance(raw, list) \
+                    and all(isinstance(x, str) and x in catalog for x in raw) and len(set(raw)) == len(raw) \
+                    and all(k in catalog for k in (meta if isinstance(meta, dict) else ())):
+                continue  # fast path: already canonical
+
+            new_ids = self._canonical_book_ids(raw)
+            new_meta: dict[str, dict] = {}
+            if isinstance(meta, dict):
+                for key, m in meta.items():
+                    bid = self.resolve_book_ref(key) or str(key)
+                    if isinstance(m, dict):
+                        new_meta.setdefault(bid, {}).update(m)
+
+            if new_ids == raw and "ids" not in rec and (not isinstance(meta, dict) or new_meta == meta):
+                continue  # references to books that aren't in the catalog; nothing to rewrite
+
+            rec["book_ids"] = new_ids
+            rec.pop("ids", None)
+            if isinstance(meta, dict):
+                rec["book_meta"] = new_meta
+            self.collections[cid] = rec
+            changed += 1
+
+        if changed:
+            self._book_collections = None
+            if persist:
+                self.save()
+        return changed
+
+    def _collections_index(self) -> dict[str, set[str]]:
+        """book_id -> set of collection_ids (built on first use)."""
+        index = self._book_collections
+        if index is None:
+            with self._book_index_lock:
+                index = self._book_collections
+                if index is None:
+                    index = {}
+                    for cid, rec in tuple((self.collections or {}).items()):
+                        if not isinstance(rec, dict):
+                            continue
+                        for bid in self._coerce_collection_refs(rec.get("book_ids")):
+                            if isinstance(bid, str) and bid:
+                                index.setdefault(bid, set()).add(cid)
+                    self._book_collections = index
+        return index
+
+    def _note_collection_members(self, cid: str, before: Iterable[str], after: Iterable[str]) -> None:
+        """Apply a membership change of one collection to the reverse index."""
+        index = self._book_collections
+        if index is None:
+            return
+        before = {b for b in before if isinstance(b, str)}
+        after = {b for b in after if isinstance(b, str)}
+        for bid in before - after:
+            cids = index.get(bid)
+            if cids is not None:
+                cids.discard(cid)
+                if not cids:
+                    del index[bid]
+        for bid in after - before:
+            index.setdefault(bid, set()).add(cid)
+
+    def collection_ids_for_book(self, book_id: str) -> list[str]:
+        """Collection ids that contain this book (O(1) lookup)."""
+        bid = (book_id or "").strip()
+        return list(self._collections_index().get(bid, ()))
+
+    def collections_for_book(self, book_id: str) -> list[dict]:
+        """Collection records that contain this book."""
+        return [self.collections[cid] for cid in self.collection_ids_for_book(book_id) if cid in self.collections]
+
+    def remove_book_from_all_collections(self, book_id: str, *, persist: bool = True) -> int:
+        """Drop a book from every collection it is in (e.g. before deleting the book). Returns count."""
+        bid = (book_id or "").strip()
+        removed = 0
+        for cid in self.collection_ids_for_book(bid):
+            if self.remove_book_from_collection(cid, bid, persist=False):
+                removed += 1
+            meta = self.collections.get(cid, {}).get("book_meta")
+            if isinstance(meta, dict):
+                meta.pop(bid, None)
+        if removed and persist:
+            self.save()
+        return removed
+
+    # ---------- Smart collections ----------
+    def is_smart_collection(self, collection_name_or_id: str) -> bool:
+        cid = self._resolve_collection_id(collection_name_or_id)
+        rec = self.collections.get(cid) if cid else None
+        return isinstance(rec, dict) and isinstance(rec.get("smart"), dict)
+
+    def get_smart_query(self, collection_name_or_id: str) -> str:
+        cid = self._resolve_collection_id(collection_name_or_id)
+        rec = self.collections.get(cid) if cid else None
+        smart = rec.get("smart") if isinstance(rec, dict) else None
+        return str(smart.get("query") or "") if isinstance(smart, dict) else ""
+
+    def create_smart_collection(self, name: str, query: str, *, persist: bool = True) -> dict:
+        """
+        Create a collection whose members are every book matching query
+        (e.g. 'genre=Mystery AND unread AND tag:"summer"').
+        Raises ValueError if the rule can't be parsed.
+        """
+        pred = _compile_smart_query(query)
+        rec = self.create_collection(name, [], persist=False)
+        cid = rec["collection_id"]
+        rec["smart"] = {"query": (query or "").strip()}
+        self._smart_predicates[cid] = pred
+        self.refresh_smart_collections(cid)
+        if persist:
+            self.save()
+        return rec
+
+    def set_smart_query(self, collection_name_or_id: str, query: str, *, persist: bool = True) -> bool:
+        """Change the rule of a smart collection (ValueError on a bad rule)."""
+        cid = self._resolve_collection_id(collection_name_or_id)
+        if not cid or not self.is_smart_collection(cid):
+            return False
+        self._smart_predicates[cid] = _compile_smart_query(query)
+        self.collections[cid]["smart"] = {"query": (query or "").strip()}
+        self.refresh_smart_collections(cid)
+        if persist:
+            self.save()
+        return True
+
+    def _smart_predicate(self, cid: str) -> Callable[[dict], bool] | None:
+        pred = self._smart_predicates.get(cid)
+        if pred is None:
+            try:
+                pred = _compile_smart_query(self.get_smart_query(cid))
+            except ValueError:
+                pred = lambda b: False  # broken rule on disk: show as empty, don't crash
+            self._smart_predicates[cid] = pred
+        return pred
+
+    @profiled
+    def refresh_smart_collections(self, collection_id: str | None = None) -> None:
+        """Full re-evaluation of one (or every) smart collection against the catalog."""
+        cids = [collection_id] if collection_id else [
+            cid for cid, rec in self.collections.items() if isinstance(rec, dict) and isinstance(rec.get("smart"), dict)
+        ]
+        for cid in cids:
+            rec = self.collections.get(cid)
+            pred = self._smart_predicate(cid)
+            if not isinstance(rec, dict) or pred is None:
+                continue
+            new_ids = [bid for bid, b in self.catalog.items() if pred(b)]
+            with self._book_index_lock:
+                old_ids = rec.get("book_ids") or []
+                if new_ids != old_ids:
+                    self._note_collection_members(cid, old_ids, new_ids)
+                    rec["book_ids"] = new_ids
+
+    def _update_smart_membership(self, book_id: str) -> None:
+        """
+        Check just this book against each smart rule and add/remove it where the answer changed.
+        Runs on sync worker threads too (via note_book_changed), so it holds _book_index_lock,
+        the same lock save() writes collections.json under.
+        """
+        bid = (book_id or "").strip()
+        if not bid:
+            return
+        with self._book_index_lock:
+            b = self.catalog.get(bid)
+            for cid, rec in tuple(self.collections.items()):
+                if not isinstance(rec, dict) or not isinstance(rec.get("smart"), dict):
+                    continue
+                pred = self._smart_predicate(cid)
+                match = b is not None and pred(b)
+                ids = rec.get("book_ids")
+                if not isinstance(ids, list):
+                    ids = rec["book_ids"] = []
+                present = cid in self._collections_index().get(bid, ())
+                if match and not present:
+                    ids.append(bid)
+                    self._note_collection_members(cid, (), (bid,))
+                    rec["updated_at"] = self._now_ts()
+                elif present and not match:
+                    rec["book_ids"] = [x for x in ids if x != bid]
+                    self._note_collection_members(cid, (bid,), ())
+                    rec["updated_at"] = self._now_ts()
+
     # =========================
     # Tag editing (user-driven)
     # =========================
@@ -2161,6 +3435,8 @@ class LibraryData:
                 seen.add(nt)
                 out.append(nt)
         b["tags"] = out
+        self._update_smart_membership(book_id)
+        self._reindex_book_tags(book_id)
         if persist:
             self.save()
         return out
@@ -2187,6 +3463,8 @@ class LibraryData:
                 out.append(t)
 
         b["tags"] = out
+        self._update_smart_membership(book_id)
+        self._reindex_book_tags(book_id)
         self._note_tag_use(incoming, persist=True)
         if persist:
             self.save()
@@ -2202,93 +3480,209 @@ class LibraryData:
 
         out = [t for t in tags if _norm_tag(t) != target]
         b["tags"] = out
+        self._update_smart_membership(book_id)
+        self._reindex_book_tags(book_id)
         self._prune_recent_tags(persist=True)
         if persist:
             self.save()
         return out
 
+    def _tags_of(self, b: dict | None) -> frozenset[str]:
+        tags = (b or {}).get("tags")
+        if isinstance(tags, list):
+            return frozenset(nt for nt in (_norm_tag(t) for t in tags) if nt)
+        if isinstance(tags, str):
+            return frozenset(self._split_user_tags(tags))
+        return frozenset()
+
+    def _ensure_tag_counts(self) -> dict[str, int]:
+        """tag -> books carrying it; one catalog scan on first use, then kept current per book."""
+        with self._book_index_lock:
+            counts = self._tag_counts
+            if counts is not None and len(self._book_tags) == len(self.catalog):
+                return counts
+            counts = {}
+            book_tags: dict[str, frozenset[str]] = {}
+            for bid, b in self.catalog.items():
+                tags = book_tags[bid] = self._tags_of(b)
+                for t in tags:
+                    counts[t] = counts.get(t, 0) + 1
+            self._tag_counts = counts
+            self._book_tags = book_tags
+            return counts
+
+    def _reindex_book_tags(self, book_id: str) -> None:
+        """Move one book's tags in the usage index (no-op until the index is built)."""
+        bid = (book_id or "").strip()
+        with self._book_index_lock:
+            counts = self._tag_counts
+            if counts is None or not bid:
+                return
+            old = self._book_tags.pop(bid, frozenset())
+            b = self.catalog.get(bid)
+            new = self._tags_of(b)
+            for t in old - new:
+                n = counts.get(t, 0) - 1
+                if n > 0:
+                    counts[t] = n
+                else:
+                    counts.pop(t, None)
+            for t in new - old:
+                counts[t] = counts.get(t, 0) + 1
+            if b is not None:
+                self._book_tags[bid] = new
+
     def _all_tags_in_catalog(self) -> set[str]:
         """All tags that currently exist anywhere in the library."""
-        out = set()
-        for _bid, b in (self.catalog or {}).items():
-            tags = b.get("tags")
-            if isinstance(tags, list):
-                for t in tags:
-                    nt = _norm_tag(t)
-                    if nt:
-                        out.add(nt)
-            elif isinstance(tags, str):
-                for t in self._split_user_tags(tags):
-                    nt = _norm_tag(t)
-                    if nt:
-                        out.add(nt)
-        return out
+        return set(self._ensure_tag_counts())
+
+    # ---------- Recent tag LRU ----------
+    RECENT_TAGS_MAX = 100
+    RECENT_TAGS_HALF_LIFE = 14 * 24 * 3600.0  # seconds; a use counts half as much after two weeks
+    RECENT_TAGS_FLUSH_DELAY = 2.0
+
+    def _load_recent_tags(self) -> OrderedDict[str, tuple[float, float]]:
+        """
+        Read recent_tags.json into the LRU.
+        Accepts the legacy most-recent-first list of strings as well as the
+        current list of {"tag", "score", "ts"} records (same order).
+        """
+        raw = _safe_load_json(self.recent_tags_path, [])
+        if not isinstance(raw, list):
+            raw = []
+
+        lru: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        # file is most-recent-first; the LRU keeps most-recent last
+        for item in reversed(raw[: self.RECENT_TAGS_MAX]):
+            if isinstance(item, dict):
+                nt = _norm_tag(item.get("tag"))
+                try:
+                    score = float(item.get("score") or 1.0)
+                    ts = float(item.get("ts") or 0.0)
+                except Exception:
+                    score, ts = 1.0, 0.0
+            else:
+                nt = _norm_tag(item)
+                score, ts = 1.0, 0.0
+            if not nt:
+                continue
+            lru.pop(nt, None)
+            lru[nt] = (score, ts)
+        return lru
 
     def _save_recent_tags(self) -> None:
+        """Write the LRU if it changed since the last write (no-op otherwise)."""
+        with self._recent_tags_lock:
+            if self._recent_tags_timer is not None:
+                self._recent_tags_timer.cancel()
+                self._recent_tags_timer = None
+            if not self._recent_tags_dirty:
+                return
+            rows = [
+                {"tag": t, "score": round(score, 4), "ts": round(ts, 3)}
+                for t, (score, ts) in reversed(self.recent_tags.items())
+            ]
+            self._recent_tags_dirty = False
         try:
-            _safe_write_json(self.recent_tags_path, self.recent_tags)
+            _safe_write_json(self.recent_tags_path, rows)
         except Exception:
             pass
 
+    def _schedule_recent_tags_save(self) -> None:
+        """Coalesce bursts of tag edits into a single write shortly after the last one."""
+        with self._recent_tags_lock:
+            self._recent_tags_dirty = True
+            if self._recent_tags_timer is not None:
+                self._recent_tags_timer.cancel()
+            t = threading.Timer(self.RECENT_TAGS_FLUSH_DELAY, self._save_recent_tags)
+            t.daemon = True
+            self._recent_tags_timer = t
+            t.start()
+
+    def _decayed_tag_score(self, score: float, ts: float, now: float) -> float:
+        age = max(0.0, now - ts)
+        return score * math.exp(-age * math.log(2) / self.RECENT_TAGS_HALF_LIFE)
+
     def _note_tag_use(self, tags: list[str], *, persist: bool = True) -> None:
         """
-        Move used tags to the front (most-recent-first), dedup case-insensitively.
+        Record a use of each tag: bump its decayed score by 1 and move it to the
+        most-recent end of the LRU. O(1) per tag; evicts the least recent past the cap.
         """
         if not isinstance(tags, list):
             return
 
-        recent = getattr(self, "recent_tags", []) or []
-        if not isinstance(recent, list):
-            recent = []
-
-        for t in tags:
-            nt = _norm_tag(t)
-            if not nt:
-                continue
-            # remove any existing occurrence
-            recent = [r for r in recent if _norm_tag(r) != nt]
-            # add to front
-            recent.insert(0, nt)
+        now = time.time()
+        changed = False
+        with self._recent_tags_lock:
+            lru = self.recent_tags
+            for t in tags:
+                nt = _norm_tag(t)
+                if not nt:
+                    continue
+                prev = lru.pop(nt, None)
+                score = self._decayed_tag_score(prev[0], prev[1], now) if prev else 0.0
+                lru[nt] = (score + 1.0, now)
+                changed = True
 
-        # keep a reasonable history
-        self.recent_tags = recent[:50]
+            while len(lru) > self.RECENT_TAGS_MAX:
+                lru.popitem(last=False)
 
-        if persist:
-            self._save_recent_tags()
+        if changed and persist:
+            self._schedule_recent_tags_save()
 
     def _prune_recent_tags(self, *, persist: bool = True) -> None:
         """Remove tags from history that no longer exist anywhere in the catalog."""
-        existing = self._all_tags_in_catalog()
-        recent = getattr(self, "recent_tags", []) or []
-        if not isinstance(recent, list):
-            recent = []
-        self.recent_tags = [t for t in recent if _norm_tag(t) in existing]
-        if persist:
-            self._save_recent_tags()
+        existing = self._ensure_tag_counts()
+        with self._recent_tags_lock:
+            stale = [t for t in self.recent_tags if t not in existing]
+            for t in stale:
+                del self.recent_tags[t]
+        if stale and persist:
+            self._schedule_recent_tags_save()
 
     def get_recent_tags_global(self, limit: int = 6) -> list[str]:
         """
-        Returns most-recent-first tags that still exist in the library.
+        Returns most-recent-first tags from the history that some book still carries
+        (checked against the tag usage index, not by scanning the catalog).
         """
-        try:
-            recent = getattr(self, "recent_tags", [])
-            if not isinstance(recent, list):
-                recent = []
-        except Exception:
-            recent = []
-
-        existing = self._all_tags_in_catalog()
-        out = []
-        seen = set()
-        for t in recent:
-            nt = _norm_tag(t)
-            if nt and nt in existing and nt not in seen:
-                seen.add(nt)
-                out.append(nt)
+        in_use = self._ensure_tag_counts()
+        out: list[str] = []
+        for t in reversed(self.recent_tags):
+            if t not in in_use:
+                continue
+            out.append(t)
             if len(out) >= int(limit):
                 break
         return out
 
+    def rank_recent_tags(self, prefix: str = "", *, limit: int = 6, exclude: Iterable[str] = ()) -> list[str]:
+        """
+        Tags from the history ranked by frequency blended with recency:
+        every use adds 1 to a score that halves each RECENT_TAGS_HALF_LIFE.
+        - prefix: optional typed text; matches tags containing it (prefix matches first)
+        - exclude: tags to leave out (e.g. ones already on the book)
+        Only tags some book still carries are suggested (tag usage index; no catalog scan).
+        """
+        needle = (prefix or "").strip().lower()
+        skip = {_norm_tag(t) for t in (exclude or ())}
+        in_use = self._ensure_tag_counts()
+        now = time.time()
+
+        scored: list[tuple[int, float, float, str]] = []
+        for t, (score, ts) in self.recent_tags.items():
+            if t in skip or t not in in_use:
+                continue
+            if needle:
+                if needle not in t:
+                    continue
+                bucket = 0 if t.startswith(needle) else 1
+            else:
+                bucket = 0
+            scored.append((bucket, -self._decayed_tag_score(score, ts, now), -ts, t))
+
+        scored.sort()
+        return [t for _b, _s, _ts, t in scored[: max(0, int(limit))]]
+
     # =========================
     # Open Library search + enrichment
     # =========================
@@ -2483,6 +3877,7 @@ class LibraryData:
     # =========================
     # Sync (FAST + ONLY missing cover/genre)
     # =========================
+    @profiled
     def sync_missing_data(
             self,
             books: list[dict],
@@ -2548,6 +3943,7 @@ class LibraryData:
             filename = f"{digits}.jpg" if digits else f"{book_id}.jpg"
             with lock:
                 (self.covers_dir / filename).write_bytes(data)
+                self.drop_cover_thumbnails(filename)
                 self.cover_index[book_id] = filename
                 # cover fixed → remove from cover queue
                 self.sync_queue.discard(book_id)
@@ -2608,6 +4004,7 @@ class LibraryData:
                             with lock:
                                 filename = f"olid_{cover_i}.jpg"
                                 (self.covers_dir / filename).write_bytes(data)
+                                self.drop_cover_thumbnails(filename)
                                 self.cover_index[bid] = filename
                                 self.sync_queue.discard(bid)
                             cover_ok = True
@@ -2637,6 +4034,7 @@ class LibraryData:
                     with lock:
                         if self._apply_ol_enrichment(b, doc):
                             did_enrich = True
+                            self.note_book_changed(bid)
                         # genre fixed → remove from genre queue if now present
                         if not self._needs_genre(b):
                             self.genre_queue.discard(bid)
@@ -2655,6 +4053,8 @@ class LibraryData:
             return (msg, cover_ok, did_enrich, did_fail)
 
         # run
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
         stopped_early = False
         ex = ThreadPoolExecutor(max_workers=max_workers)
         futures = [ex.submit(_process_one, b) for b in books]
@@ -2732,6 +4132,7 @@ class LibraryData:
             if apply_and_save:
                 if self._apply_ol_enrichment(b, doc):
                     enriched += 1
+                    self.note_book_changed((b.get("book_id") or "").strip())
 
             time.sleep(polite_delay)
 
@@ -2745,4 +4146,362 @@ class LibraryData:
             "enriched": enriched,
             "failed": failed,
             "total_missing_genre_in_catalog": len(missing),
-        }
\ No newline at end of file
+        }
+
+    # ---------- Memory footprint ----------
+    def memory_report(self, seen: set[int] | None = None) -> dict:
+        """
+        Approximate bytes per in-memory structure (deep_sizeof, so a baseline rather than an exact figure).
+        Components are walked in order and share `seen`: strings the search caches reuse from the
+        catalog are charged to the catalog, so each later figure is what that cache adds on top.
+        """
+        seen = set() if seen is None else seen
+        with self._book_index_lock:
+            book_indexes = {
+                "sort_keys": self._sort_keys,
+                "orderings": self._orderings,
+                "ordering_keys": self._ordering_keys,
+                "alias_index": self._alias_index,
+                "alias_owners": self._alias_owners,
+                "tag_counts": (self._tag_counts, self._book_tags),
+                "book_aliases": self._book_aliases,
+            }
+        components = {
+            "catalog": self.catalog,
+            "cover_index": self.cover_index,
+            "collections": self.collections,
+            "book_collections": self._book_collections,
+            "queues": (self.sync_queue, self.genre_queue),
+            "search_candidates": (self._cached_candidates, self._cached_norm_index, self._cached_norm_map),
+            "search_token_index": self._token_index,
+            **book_indexes,
+            "genres_tags_settings": (self.user_genres, self.genre_overrides, self.recent_tags, self.settings),
+        }
+        sizes = {name: deep_sizeof(obj, seen) for name, obj in components.items()}
+        return {
+            "books": len(self.catalog),
+            "bytes": sizes,
+            "total_bytes": sum(sizes.values()),
+            "bytes_per_book": round(sizes["catalog"] / len(self.catalog)) if self.catalog else 0,
+            "smart_predicates": len(self._smart_predicates),
+        }
+
+# =========================
+# Command line (headless batch jobs)
+# =========================
+# Same folder the app uses when run from source (see get_user_data_dir in messy_cozy_lib.py)
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent / "CozyLibraryManager_Data"
+
+def _dir_bytes(path: Path) -> int:
+    total = 0
+    if path.is_dir():
+        for p in path.rglob("*"):
+            try:
+                if p.is_file():
+                    total += p.stat().st_size
+            except OSError:
+                pass
+    return total
+
+def _integrity_problems(data: LibraryData) -> dict[str, list]:
+    """Everything `verify` reports and `compact` can clean up, grouped by kind."""
+    problems: dict[str, list] = {}
+
+    def add(kind: str, item) -> None:
+        problems.setdefault(kind, []).append(item)
+
+    for bid, b in data.catalog.items():
+        if not isinstance(b, dict):
+            add("invalid_book_record", bid)
+        elif (b.get("book_id") or "").strip() != bid:
+            add("book_id_mismatch", bid)
+
+    referenced: set[str] = set()
+    for bid, filename in data.cover_index.items():
+        referenced.add(filename)
+        if bid not in data.catalog:
+            add("cover_for_unknown_book", bid)
+        elif not (data.covers_dir / filename).is_file():
+            add("missing_cover_file", bid)
+    if data.covers_dir.is_dir():
+        for p in data.covers_dir.iterdir():
+            if p.is_file() and p.name not in referenced:
+                add("orphan_cover_file", p.name)
+
+    # thumbs/<cover filename>.<w>x<h>.<mtime_ns>.jpg
+    if data.thumbs_dir.is_dir():
+        for p in data.thumbs_dir.iterdir():
+            if not p.is_file():
+                continue
+            parts = p.name.rsplit(".", 3)
+            cover = data.covers_dir / parts[0] if len(parts) == 4 else None
+            try:
+                current = cover is not None and cover.is_file() and str(cover.stat().st_mtime_ns) == parts[2]
+            except OSError:
+                current = False
+            if not current:
+                add("stale_thumbnail", p.name)
+
+    for cid, rec in data.collections.items():
+        if not isinstance(rec, dict):
+            add("invalid_collection_record", cid)
+            continue
+        if not rec.get("smart"):
+            for bid in rec.get("book_ids") or []:
+                if bid not in data.catalog:
+                    add("collection_unknown_book", [cid, bid])
+        rel = (rec.get("photo") or "").strip()
+        if rel and not (data.data_dir / rel).is_file():
+            add("missing_collection_photo", cid)
+
+    for bid in sorted(data.sync_queue | data.genre_queue):
+        if bid not in data.catalog:
+            add("queued_unknown_book", bid)
+    return problems
+
+def _cli_import_csv(data: LibraryData, args) -> dict:
+    from dataclasses import asdict
+
+    report = data.import_csv(Path(args.csv), add_new_isbn_only=args.new_isbn_only, require_isbn=args.require_isbn)
+    return {"report": asdict(report), "books": len(data.catalog)}
+
+def _cli_export_csv(data: LibraryData, args) -> dict:
+    data.export_csv(Path(args.csv))
+    return {"exported": len(data.catalog), "path": str(args.csv)}
+
+def _cli_sync(data: LibraryData, args) -> dict:
+    import signal
+
+    data.rebuild_queues()
+    books = data.get_books_needing_update()
+    if args.limit:
+        books = books[:args.limit]
+    if not books:
+        return {"total": 0}
+
+    # Ctrl+C finishes the in-flight books, keeps what was fetched and saves
+    stop = threading.Event()
+    prev_handler = signal.signal(signal.SIGINT, lambda *_: stop.set())
+    workers = max(1, args.workers)
+    # each worker sleeps after a book, so workers / rate caps the whole run at ~rate books per second
+    delay = workers / args.rate if args.rate else 0.0
+
+    def progress(done: int, total: int, msg: str) -> None:
+        if not args.quiet:
+            print(f"[{done}/{total}] {msg}", file=sys.stderr, flush=True)
+
+    t0 = time.perf_counter()
+    try:
+        stats = data.sync_missing_data(books, progress_cb=progress, stop_flag=stop.is_set,
+                                       polite_delay=delay, max_workers=workers)
+    finally:
+        signal.signal(signal.SIGINT, prev_handler)
+        data.save()
+    stats["seconds"] = round(time.perf_counter() - t0, 2)
+    stats["stopped"] = stop.is_set()
+    return stats
+
+def _cli_search(data: LibraryData, args) -> dict:
+    tokens = (args.query or "").lower().split()
+    hits = []
+    for b in data.catalog.values():
+        text = " ".join(str(b.get(k) or "") for k in ("title", "creators", "first_name", "last_name",
+                                                         "date_published")).lower()
+        if tokens and all(t in text for t in tokens):
+            hits.append({"book_id": b.get("book_id"), "title": b.get("title"), "creators": b.get("creators")})
+            if len(hits) >= args.limit:
+                break
+    return {"suggestions": data.search_matches(args.query, limit=args.limit), "books": hits}
+
+def _cli_stats(data: LibraryData, args) -> dict:
+    return {
+        "data_dir": str(data.data_dir),
+        "books": len(data.catalog),
+        "covers_indexed": len(data.cover_index),
+        "missing_cover": len(data.sync_queue),
+        "missing_genre": len(data.genre_queue),
+        "collections": len(data.collections),
+        "smart_collections": sum(1 for c in data.collections.values() if isinstance(c, dict) and c.get("smart")),
+        "genres": len(data.get_all_active_genres()),
+        "bytes": {
+            "catalog_json": data.catalog_path.stat().st_size if data.catalog_path.exists() else 0,
+            "covers": _dir_bytes(data.covers_dir),
+            "thumbs": _dir_bytes(data.thumbs_dir),
+            "collection_images": _dir_bytes(data.collection_images_dir),
+            "total": _dir_bytes(data.data_dir),
+        },
+    }
+
+def _cli_rebuild_index(data: LibraryData, args) -> dict:
+    """
+    Rebuild what is derived but stored (sync/genre queues, smart-collection membership) and save it.
+    The sort orderings, alias index and search index only live in memory, so those are rebuilt
+    here just to time them; the app builds its own on first use.
+    """
+    timings: dict[str, float] = {}
+
+    def step(name: str, fn) -> None:
+        t0 = time.perf_counter()
+        fn()
+        timings[name] = round((time.perf_counter() - t0) * 1000, 2)
+
+    step("queues", lambda: data.rebuild_queues(force=True))  # writes both queue files
+    step("smart_collections", data.refresh_smart_collections)
+    step("save", data.save)
+
+    def book_indexes() -> None:
+        data._drop_book_indexes()
+        for mode in data.PAGE_SORTS:
+            data.page(mode, 0, 1)
+        data._ensure_alias_index()
+
+    step("book_indexes_in_memory", book_indexes)
+    step("search_index_in_memory", data.collect_search_candidates)
+    return {"ms": timings, "sync_queue": len(data.sync_queue), "genre_queue": len(data.genre_queue),
+            "smart_collections": sum(1 for c in data.collections.values() if isinstance(c, dict) and c.get("smart")),
+            "search_candidates": len(data._cached_candidates)}
+
+def _cli_verify(data: LibraryData, args) -> dict:
+    problems = _integrity_problems(data)
+    return {
+        "ok": not problems,
+        "problems": {k: len(v) for k, v in problems.items()},
+        "examples": {k: v[:5] for k, v in problems.items()},
+    }
+
+def _cli_compact(data: LibraryData, args) -> dict:
+    """Drop dead references and delete files nothing points at (covers, stale thumbnails)."""
+    problems = _integrity_problems(data)
+    freed = 0
+    doomed = [data.covers_dir / n for n in problems.get("orphan_cover_file", [])]
+    doomed += [data.thumbs_dir / n for n in problems.get("stale_thumbnail", [])]
+    for p in doomed:
+        try:
+            size = p.stat().st_size
+            if not args.dry_run:
+                p.unlink()
+            freed += size
+        except OSError:
+            pass
+
+    if not args.dry_run:
+        for bid in problems.get("cover_for_unknown_book", []) + problems.get("missing_cover_file", []):
+            data.cover_index.pop(bid, None)
+        for cid, bid in problems.get("collection_unknown_book", []):
+            rec = data.collections.get(cid)
+            if isinstance(rec, dict):
+                rec["book_ids"] = [x for x in rec.get("book_ids") or [] if x != bid]
+        data._book_collections = None
+        data.rebuild_queues()  # also drops queued ids that left the catalog
+        data.save()
+
+    fixed = ("orphan_cover_file", "stale_thumbnail", "cover_for_unknown_book", "missing_cover_file",
+             "collection_unknown_book", "queued_unknown_book")
+    return {
+        "dry_run": args.dry_run,
+        "removed": {k: len(problems[k]) for k in fixed if k in problems},
+        "bytes_freed": freed,
+        "left_for_review": {k: len(v) for k, v in problems.items() if k not in fixed},
+    }
+
+def _cli_memory(data: LibraryData, args) -> dict:
+    """Memory by component after load (and, unless --cold, after building the lazy indexes)."""
+    import tracemalloc
+
+    stages: dict[str, int] = {}
+    if tracemalloc.is_tracing():
+        stages["after_load"] = tracemalloc.get_traced_memory()[0]
+    if not args.cold:
+        data.warm_search_index()
+        if tracemalloc.is_tracing():
+            stages["after_search_index"] = tracemalloc.get_traced_memory()[0]
+        for mode in ("Title", "Author", "Year", "Genre", "Last Updated"):
+            data.page(mode, 0, 1)
+        data._ensure_alias_index()
+        data._collections_index()
+        if tracemalloc.is_tracing():
+            stages["after_book_indexes"] = tracemalloc.get_traced_memory()[0]
+    out = data.memory_report()
+    out["traced_bytes_by_stage"] = stages
+    out["tracemalloc"] = tracemalloc_report(args.top)
+    out["peak_rss_bytes"] = peak_rss_bytes()
+    return out
+
+_CLI_COMMANDS: dict[str, Callable] = {
+    "import-csv": _cli_import_csv,
+    "export-csv": _cli_export_csv,
+    "sync": _cli_sync,
+    "search": _cli_search,
+    "stats": _cli_stats,
+    "rebuild-index": _cli_rebuild_index,
+    "verify": _cli_verify,
+    "compact": _cli_compact,
+    "memory": _cli_memory,
+}
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Headless entry point: python -m library_data [--data-dir DIR] <command> ...
+    Results go to stdout as JSON, progress to stderr. Exit status 1 when verify finds problems.
+    """
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="python -m library_data", description="Library Manager batch operations")
+    ap.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR,
+                    help=f"library data folder (default: {DEFAULT_DATA_DIR})")
+    ap.add_argument("--profile", action="store_true", help="record LibraryData operation timings (see OpProfiler)")
+    ap.add_argument("--profile-json", type=Path, default=None, help="write profiler stats here (implies --profile)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import-csv", help="merge a CSV into the catalog")
+    p.add_argument("csv", type=Path)
+    p.add_argument("--new-isbn-only", action="store_true", help="only add rows whose ISBN isn't in the catalog yet")
+    p.add_argument("--require-isbn", action="store_true", help="skip rows without an ISBN")
+
+    p = sub.add_parser("export-csv", help="write the whole catalog to a CSV")
+    p.add_argument("csv", type=Path)
+
+    p = sub.add_parser("sync", help="fetch missing covers and genres from Open Library")
+    p.add_argument("--workers", type=int, default=8)
+    p.add_argument("--rate", type=float, default=0.0, help="max books per second across all workers (0 = no limit)")
+    p.add_argument("--limit", type=int, default=0, help="only sync the first N books that need it")
+    p.add_argument("--quiet", action="store_true", help="no per-book progress on stderr")
+
+    p = sub.add_parser("search", help="suggestions + matching books for a query")
+    p.add_argument("query")
+    p.add_argument("--limit", type=int, default=20)
+
+    sub.add_parser("stats", help="catalog counts and disk usage")
+    sub.add_parser("rebuild-index", help="rebuild and save sync queues and smart-collection membership "
+                                         "(in-memory indexes are rebuilt for timing only)")
+    sub.add_parser("verify", help="check catalog, covers, thumbnails, collections and queues for dangling data")
+
+    p = sub.add_parser("compact", help="delete orphaned covers/stale thumbnails and drop dangling references")
+    p.add_argument("--dry-run", action="store_true")
+
+    p = sub.add_parser("memory", help="approximate RAM per catalog structure, cache and index")
+    p.add_argument("--cold", action="store_true", help="don't build the search/sort/alias indexes first")
+    p.add_argument("--no-trace", action="store_true", help="skip tracemalloc (faster load, no allocation sites)")
+    p.add_argument("--top", type=int, default=10, help="allocation sites to list")
+
+    args = ap.parse_args(argv)
+    if args.profile or args.profile_json:
+        PROFILER.enable()
+    if args.command == "memory" and not args.no_trace:
+        import tracemalloc
+        tracemalloc.start()  # before the catalog loads, so its allocations are attributed
+
+    data = LibraryData(args.data_dir)
+    result = _CLI_COMMANDS[args.command](data, args)
+    print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+
+    if PROFILER.enabled:
+        if args.profile_json:
+            PROFILER.dump_json(args.profile_json)
+        else:
+            print(json.dumps(PROFILER.stats(), indent=2), file=sys.stderr)
+    return 1 if args.command == "verify" and not result["ok"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
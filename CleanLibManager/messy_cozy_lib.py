@@ -3,21 +3,25 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import font as tkfont
 from tkinter import ttk
-from tkinter import filedialog, messagebox, simpledialog
-from PIL import Image, ImageTk, ImageOps
+from tkinter import messagebox  # filedialog/simpledialog are imported where they're used
+from PIL import Image, ImageTk  # ImageOps likewise
+from collections import OrderedDict, deque
 from collections.abc import Callable
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, TYPE_CHECKING
+from bisect import bisect_left, bisect_right
 import time
+import json
 import re
-import random
 import threading
-import html
+import queue
 import sys
 import os
 import platform
-import ctypes
-from ctypes import wintypes
-from library_data import LibraryData
+from library_data import LibraryData, decode_fitted_image, deep_sizeof, peak_rss_bytes, tracemalloc_report
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor, Future
 
 
 def resource_path(*parts: str) -> Path:
@@ -101,6 +105,7 @@ SHARED_SCROLL_BG_COLOR               = THEME_COLOR2
 SHARED_TABLE_BG_COLOR                = THEME_COLOR2
 SHARED_TABLE_ALTROW_BG_COLOR         = THEME_COLOR4
 SHARED_SCROLLROW_TEXT_COLOR          = THEME_COLOR5
+SHARED_TABLE_HOVER_OUTLINE_COLOR     = THEME_COLOR7
 SHARED_EMPTYTABLE_BG_COLOR           = THEME_COLOR2
 SHARED_EMPTYTABLE_TEXT_COLOR         = THEME_COLOR1
 
@@ -670,6 +675,7 @@ class LibraryApp(tk.Tk):
     def _broadcast_font_change_windows(self) -> None:
         # HWND_BROADCAST = 0xFFFF, WM_FONTCHANGE = 0x001D
         try:
+            import ctypes
             ctypes.windll.user32.SendMessageTimeoutW(
                 0xFFFF, 0x001D, 0, 0,
                 0x0002, 1000, None
@@ -681,6 +687,8 @@ class LibraryApp(tk.Tk):
         # AddFontResourceExW with FR_PRIVATE makes font available to this process only
         FR_PRIVATE = 0x10
         try:
+            import ctypes
+            from ctypes import wintypes
             add = ctypes.windll.gdi32.AddFontResourceExW
             add.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPVOID]
             added = add(font_path, FR_PRIVATE, None)
@@ -749,15 +757,20 @@ class LibraryApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
 
-        # prevent initial "flash" before first page is fully rendered
+        # ---------- STARTUP TIMING (see startup_report) ----------
+        self._startup_t0 = time.perf_counter()
+        self._startup_times: list[tuple[str, str, float, float]] = []  # (thread, stage, start s, duration s)
+        self._startup_done = False
+        self._startup_aborted = False
+        self._startup_callbacks: list[Callable[[], Any]] = []
+        # workers never touch Tk: they post (step, payload) here and _startup_poll runs it on the UI thread
+        self._startup_inbox: queue.Queue[tuple[Callable[[Any], Any], Any]] = queue.Queue()
+        self._ui_monitor: dict | None = None  # see enable_ui_monitor
+
+        # prevent initial "flash" while the window is set up
         self.withdraw()
 
-        # Load bundled fonts (Windows) + resolve primary->fallback font families
-        self._load_app_fonts()
-        self._resolve_font_fallbacks()
-
-        # Build Tk Font objects using the resolved families
-        self._init_fonts()
+        # Fonts, LibraryData and page art are loaded in stages (see _startup_worker / _finish_startup)
 
         self.title(SHARED_WINDOW_TITLE)
         self.minsize(900, 600)
@@ -781,6 +794,11 @@ class LibraryApp(tk.Tk):
 
         self._bg_pil: Image.Image | None = None
         self._bg_tk: ImageTk.PhotoImage | None = None
+        self._bg_asset: str = ""
+        self._bg_fast_ts = 0.0
+        # decoded page art, once per file; fitted copies in a small LRU keyed by (asset, w, h)
+        self._asset_sources: dict[tuple[str, str], Image.Image] = {}
+        self._bg_fit_cache: OrderedDict[tuple[str, int, int], ImageTk.PhotoImage] = OrderedDict()
         self._scroll_target: tk.Canvas | None = None
         self._resize_after_id: str | None = None
 
@@ -800,16 +818,24 @@ class LibraryApp(tk.Tk):
         self._side_menu_dim: tk.Toplevel | None = None
         self._side_menu_panel_win: tk.Toplevel | None = None
 
+        # ---------- SHARED PHOTO CACHE (see _cached_photo) ----------
+        self._photo_cache: OrderedDict[tuple, tuple[ImageTk.PhotoImage, int]] = OrderedDict()
+        self._photo_cache_bytes = 0
+        self._photo_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._cover_pool: ThreadPoolExecutor | None = None
+        self._cover_jobs: dict[threading.Event, Future] = {}  # ticket -> pending decode
+
+        # ---------- PAGE CACHE (see _park_page) ----------
+        self._page_cache: OrderedDict[tuple[str, str], dict] = OrderedDict()
+        self._page_leaving: tuple[str, dict] | None = None
+
         self._menu_btn_lbl: tk.Label | None = None
         self._menu_btn_pil: Image.Image | None = None
         self._menu_btn_tk: ImageTk.PhotoImage | None = None
         self._menu_btn_last_size: int | None = None
         self._menu_btn_item: int | None = None
 
-        self._init_side_menu_assets()
-
-        self._load_background_image()
-        self._page_img_refs: list[ImageTk.PhotoImage] = []
+        self._page_img_refs: list[ImageTk.PhotoImage] = []  # pins what the current page shows
         self._sync_popup_open = False
 
         self.bind_all("<MouseWheel>", self._on_global_mousewheel)
@@ -817,6 +843,8 @@ class LibraryApp(tk.Tk):
         self.bind_all("<Button-5>", self._on_global_mousewheel)
         self.bind_all("<Escape>", self._escape_exit_fullscreen, add="+")
         self.bind("<Command-f>", lambda e: self.toggle_fullscreen())
+        self.bind("<Control-Shift-D>", lambda e: self._on_diagnostics_hotkey())
+        self.bind("<Control-Shift-M>", lambda e: self._on_memory_hotkey())
 
         self._page_rebuild_after_id = None
         self.current_page: str = "main"
@@ -870,6 +898,7 @@ class LibraryApp(tk.Tk):
             ],
             "collections": [
                 ("Add New", self.show_build_collection_page),
+                ("Add Smart Collection", self._side_new_smart_collection),
                 ("Edit Collections", self._side_edit_collections),
                 ("Settings", self.show_settings_page),
             ],
@@ -886,19 +915,449 @@ class LibraryApp(tk.Tk):
 
         # --- collections (in-memory for now) ---
         self._build_collection_selected: list[str] = []
-        self.data = LibraryData(get_user_data_dir())
-
-        # Your UI continues to use a list of dicts
-        self.catalog = list(self.data.catalog.values())
+        # self.data (LibraryData) arrives from _startup_worker; the UI uses a list of dicts
+        self.catalog: list[dict] = []
 
         self.last_search_results: list[dict] | None = None
         self.last_search_query: str = ""
-        self.show_main_page()
+
+        # Stage 1: a plain splash goes up right away, everything heavy happens off the UI thread
+        self.deiconify()
+        self.lift()
         self.update_idletasks()
-        self._update_background_image()
-        self._update_canvas_text_positions()
-        self._reposition_design_widgets()
-        self.after(50, lambda: (self.deiconify(), self.lift()))
+        self.make_canvas_text(self.SPLASH_TEXT, relx=0.5, rely=0.5, font=(SHARED_FONT_TABLE, 28),
+                              fill=BACKGROUND_TITLE_TEXT)
+        self.after_idle(lambda: self._startup_mark("first paint"))
+        # started from the event loop, so the UI thread is in mainloop() before any result can arrive
+        self.after(50, self._startup_begin)
+
+    # ---------- STARTUP ----------
+    SPLASH_TEXT = "Opening your library..."
+    STARTUP_POLL_MS = 25
+
+    @contextmanager
+    def _startup_stage(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._startup_times.append((threading.current_thread().name, stage,
+                                        start - self._startup_t0, end - start))
+    def _startup_mark(self, stage: str):
+        with self._startup_stage(stage):
+            pass
+    def _startup_begin(self):
+        threading.Thread(target=self._startup_worker, name="startup-load", daemon=True).start()
+        self._startup_poll()
+    def _startup_poll(self):
+        """Run whatever the startup workers posted, then check again until startup is done."""
+        try:
+            while not self._startup_aborted:
+                step, payload = self._startup_inbox.get_nowait()
+                try:
+                    step(payload)
+                except Exception as e:
+                    self._abort_startup(e)
+        except queue.Empty:
+            pass
+        if not (self._startup_done or self._startup_aborted):
+            self.after(self.STARTUP_POLL_MS, self._startup_poll)
+    def _abort_startup(self, err: BaseException):
+        """A stage the app can't run without failed: say so (stderr + dialog) and close, never hang on the splash."""
+        import traceback
+        self._startup_aborted = True
+        traceback.print_exception(type(err), err, err.__traceback__, file=sys.stderr)
+        try:
+            messagebox.showerror("Startup Failed", f"Library Manager couldn't open your library:\n\n{err}", parent=self)
+        finally:
+            self.destroy()
+    def _startup_worker(self):
+        """
+        Stage 2 (worker thread): register bundled fonts, load LibraryData (JSON files,
+        migrations, queue rebuilds) and decode the art the first page shows. No Tk calls here.
+        """
+        result: dict[str, Any] = {}
+        try:
+            with self._startup_stage("register fonts"):
+                self._load_app_fonts()
+            with self._startup_stage("load library data"):
+                result["data"] = LibraryData(get_user_data_dir())
+            with self._startup_stage("decode page art"):
+                self._asset_source(BG_IMAGE_PATH)
+                self._asset_source(MENU_BTN_IMG, "RGBA")
+        except Exception as e:
+            result["error"] = e
+        self._startup_inbox.put((self._finish_startup, result))
+    def _finish_startup(self, result: dict):
+        """Stage 3 (UI thread): fonts + first page, then warm the search index in the background."""
+        err = result.get("error")
+        if err is not None:
+            self._abort_startup(err)
+            return
+
+        with self._startup_stage("resolve fonts"):
+            self._resolve_font_fallbacks()
+            self._init_fonts()
+        self.data = result["data"]
+        self.catalog = list(self.data.catalog.values())
+
+        with self._startup_stage("build main page"):
+            self._init_side_menu_assets()
+            self._load_background_image()
+            self.show_main_page()
+            self.update_idletasks()
+            self._update_background_image()
+            self._update_canvas_text_positions()
+            self._reposition_design_widgets()
+        self._startup_mark("ready")
+
+        threading.Thread(target=self._startup_warm, name="startup-warm", daemon=True).start()
+    def _startup_warm(self):
+        """Stage 4 (worker thread): things nobody is looking at yet."""
+        try:
+            with self._startup_stage("search index"):
+                self.data.warm_search_index()
+            with self._startup_stage("decode side menu art"):
+                self._asset_source(SIDE_MENU_BG_IMG, "RGBA")
+        except Exception as e:
+            # not fatal: both are rebuilt lazily on first use, but leave a trace
+            print(f"[startup] background warm-up failed: {e!r}", file=sys.stderr, flush=True)
+        self._startup_inbox.put((self._startup_finished, None))
+    def _startup_finished(self, _payload=None):
+        self._startup_done = True
+        callbacks, self._startup_callbacks = self._startup_callbacks, []
+        for fn in callbacks:
+            self._safe_call(fn)
+    def when_started(self, fn: Callable[[], Any]):
+        """Run fn once every startup stage, background warm-up included, is done (right away if it is)."""
+        if self._startup_done:
+            fn()
+        else:
+            self._startup_callbacks.append(fn)
+    def startup_report(self) -> str:
+        """Printable startup breakdown: offset from launch, duration, thread, stage."""
+        lines = [f"{'at ms':>9} {'took ms':>9}  {'thread':<14} stage"]
+        for thread, stage, start, dur in sorted(self._startup_times, key=lambda t: t[2]):
+            lines.append(f"{start * 1000:9.1f} {dur * 1000:9.1f}  {thread:<14} {stage}")
+        return "\n".join(lines)
+
+    # ---------- UI MONITOR (opt-in: --ui-monitor, or the diagnostics panel on Settings) ----------
+    UI_MONITOR_HEARTBEAT_MS = 50
+    UI_MONITOR_SLOW_MS = 100        # a heartbeat this late is logged as a slow frame
+    UI_MONITOR_MAX_SAMPLES = 4000   # lag samples kept (~3 min at 50 ms)
+    UI_MONITOR_MAX_EVENTS = 200     # page builds / slow frames kept
+    # instrumented method -> build phase its time is charged to; show_* pages are added automatically
+    UI_MONITOR_PHASES = {
+        "set_page": "navigate",
+        "clear_page": "clear",
+        "_sort_books": "sort",
+        "_sort_books_multi": "sort",
+        "_sort_collections": "sort",
+        "_render_books_grid_or_list": "widget build",
+        "_render_collections_grid_or_list": "widget build",
+        "_render_open_collection_results": "widget build",
+        "_render_genre_buttons": "widget build",
+        "_mount_virtual_rows": "widget build",
+        "_mount_canvas_list": "widget build",
+        "set_background": "image load",
+        "_update_background_image": "image load",
+        "_cached_photo": "image load",
+    }
+
+    def enable_ui_monitor(self):
+        """
+        Start sampling Tk event-loop lag (a heartbeat after()) and timing page builds.
+        Instrumented methods are wrapped per instance, so disable_ui_monitor() puts everything back.
+        """
+        if self._ui_monitor is not None:
+            return
+        now = time.perf_counter()
+        self._ui_monitor = mon = {
+            "started": now,
+            "ui_thread": threading.get_ident(),
+            "wrapped": [],
+            "stack": [],             # open instrumented calls (innermost last)
+            "worst": None,           # (name, seconds) longest top-level call since the last heartbeat
+            "lag_ms": deque(maxlen=self.UI_MONITOR_MAX_SAMPLES),
+            "builds": deque(maxlen=self.UI_MONITOR_MAX_EVENTS),
+            "slow_frames": deque(maxlen=self.UI_MONITOR_MAX_EVENTS),
+            "beat_at": now,
+            "after_id": None,
+        }
+        phases = dict(self.UI_MONITOR_PHASES)
+        for name in dir(type(self)):
+            if name.startswith("show_") and callable(getattr(type(self), name, None)):
+                phases[name] = "page"
+        for name, phase in phases.items():
+            fn = getattr(self, name, None)
+            if callable(fn):
+                setattr(self, name, self._ui_monitor_wrap(fn, name, phase))
+                mon["wrapped"].append(name)
+        mon["after_id"] = self.after(self.UI_MONITOR_HEARTBEAT_MS, self._ui_monitor_beat)
+    def disable_ui_monitor(self):
+        mon, self._ui_monitor = self._ui_monitor, None
+        if mon is None:
+            return
+        try:
+            self.after_cancel(mon["after_id"])
+        except Exception:
+            pass
+        for name in mon["wrapped"]:
+            self.__dict__.pop(name, None)  # back to the class method
+    def _ui_monitor_wrap(self, fn: Callable, name: str, phase: str) -> Callable:
+        def wrapped(*args, **kwargs):
+            mon = self._ui_monitor
+            if mon is None or threading.get_ident() != mon["ui_thread"]:
+                return fn(*args, **kwargs)
+            frame = {"name": name, "phase": phase, "start": time.perf_counter(), "child": 0.0, "phases": {}}
+            mon["stack"].append(frame)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._ui_monitor_exit(mon, frame)
+        wrapped.__wrapped__ = fn
+        return wrapped
+    def _ui_monitor_exit(self, mon: dict, frame: dict):
+        took = time.perf_counter() - frame["start"]
+        stack = mon["stack"]
+        while stack and stack.pop() is not frame:
+            pass
+        own = took - frame["child"]
+        page = next((f for f in reversed(stack) if f["phase"] == "page"), None)
+        if stack:
+            stack[-1]["child"] += took
+
+        if frame["phase"] != "page":
+            if page is not None:
+                page["phases"][frame["phase"]] = page["phases"].get(frame["phase"], 0.0) + own
+        elif page is not None:
+            # a page built from inside another page's build: fold it into the outer one
+            for k, v in frame["phases"].items():
+                page["phases"][k] = page["phases"].get(k, 0.0) + v
+            page["phases"]["widget build"] = page["phases"].get("widget build", 0.0) + own
+        else:
+            frame["phases"]["widget build"] = frame["phases"].get("widget build", 0.0) + own
+            mon["builds"].append({
+                "function": frame["name"],
+                "page": getattr(self, "current_page", ""),
+                "at_s": round(frame["start"] - mon["started"], 3),
+                "ms": round(took * 1000, 2),
+                "phases_ms": {k: round(v * 1000, 2) for k, v in frame["phases"].items()},
+            })
+
+        if not stack and (mon["worst"] is None or took > mon["worst"][1]):
+            mon["worst"] = (frame["name"], took)
+    def _ui_monitor_beat(self):
+        mon = self._ui_monitor
+        if mon is None:
+            return
+        now = time.perf_counter()
+        lag = max(0.0, (now - mon["beat_at"]) * 1000 - self.UI_MONITOR_HEARTBEAT_MS)
+        mon["lag_ms"].append(lag)
+        if lag >= self.UI_MONITOR_SLOW_MS:
+            name, secs = mon["worst"] or (None, 0.0)
+            mon["slow_frames"].append({
+                "at_s": round(now - mon["started"], 3),
+                "lag_ms": round(lag, 1),
+                "page": getattr(self, "current_page", ""),
+                "function": name,          # None: the stall was in code the monitor doesn't wrap
+                "function_ms": round(secs * 1000, 1),
+            })
+            print(f"[ui-monitor] slow frame: {lag:.0f} ms late on {getattr(self, 'current_page', '')!r}"
+                  f" ({name or 'untracked callback'}{f', {secs * 1000:.0f} ms' if name else ''})",
+                  file=sys.stderr, flush=True)
+        mon["worst"] = None
+        mon["beat_at"] = time.perf_counter()
+        mon["after_id"] = self.after(self.UI_MONITOR_HEARTBEAT_MS, self._ui_monitor_beat)
+    def ui_monitor_report(self) -> dict:
+        """Lag percentiles, per-page build times split by phase, recent builds and slow frames (JSON-able)."""
+        mon = self._ui_monitor
+        if mon is None:
+            return {"enabled": False}
+
+        lags = sorted(mon["lag_ms"])
+
+        def pct(p: float) -> float:
+            return round(lags[min(len(lags) - 1, int(p / 100 * len(lags)))], 1) if lags else 0.0
+
+        pages: dict[str, dict] = {}
+        for b in mon["builds"]:
+            agg = pages.setdefault(b["function"], {"builds": 0, "total_ms": 0.0, "max_ms": 0.0, "phases_ms": {}})
+            agg["builds"] += 1
+            agg["total_ms"] += b["ms"]
+            agg["max_ms"] = max(agg["max_ms"], b["ms"])
+            for k, v in b["phases_ms"].items():
+                agg["phases_ms"][k] = agg["phases_ms"].get(k, 0.0) + v
+        for agg in pages.values():
+            n = agg["builds"]
+            agg["avg_ms"] = round(agg.pop("total_ms") / n, 2)
+            agg["phases_ms"] = {k: round(v / n, 2) for k, v in sorted(agg["phases_ms"].items(), key=lambda kv: -kv[1])}
+
+        return {
+            "enabled": True,
+            "uptime_s": round(time.perf_counter() - mon["started"], 1),
+            "books": len(getattr(self, "catalog", []) or []),
+            "heartbeat_ms": self.UI_MONITOR_HEARTBEAT_MS,
+            "lag_ms": {"samples": len(lags), "p50": pct(50), "p90": pct(90), "p99": pct(99),
+                       "max": round(lags[-1], 1) if lags else 0.0},
+            "pages": pages,
+            "recent_builds": list(mon["builds"])[-20:],
+            "slow_frames": list(mon["slow_frames"]),
+        }
+    def dump_ui_monitor(self, path: Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.ui_monitor_report(), indent=2) + "\n", encoding="utf-8")
+        return path
+    def _on_diagnostics_hotkey(self):
+        # deliberately undocumented: only answers on the Settings page
+        if getattr(self, "current_page", "") == "settings":
+            self._show_diagnostics_panel()
+    def _on_memory_hotkey(self):
+        # any page, so the footprint of whatever is on screen can be measured. The packaged exe has no
+        # console, so the report goes to a timestamped file in the data dir and we say where.
+        if not hasattr(self, "data"):
+            return  # still on the splash: LibraryData is built by _startup_worker
+        try:
+            path = self.dump_memory_report(self.data.data_dir / f"memory-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        except OSError as e:
+            messagebox.showerror("Memory Report", f"Couldn't write the memory report:\n{e}", parent=self)
+            return
+        messagebox.showinfo("Memory Report", f"Memory report saved to:\n{path}", parent=self)
+    def dump_memory_report(self, path: Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.memory_report(), indent=2) + "\n", encoding="utf-8")
+        return path
+    def memory_report(self) -> dict:
+        """
+        Approximate RAM by component: LibraryData's structures (see LibraryData.memory_report), then what
+        the GUI keeps on top of them (list copies, suggestion index), decoded images and Tk widget counts.
+        Image figures are decoded pixel bytes (w * h * bands), not measured allocations.
+        """
+        seen: set[int] = set()
+        data = self.data.memory_report(seen)
+
+        def pil_bytes(im) -> int:
+            return im.width * im.height * len(im.getbands()) if im is not None else 0
+
+        def photo_bytes(photo) -> int:
+            return photo.width() * photo.height() * 4 if photo is not None else 0
+
+        gui = {
+            # rows are LibraryData's dicts, so only the lists themselves are new
+            "catalog_list": deep_sizeof(getattr(self, "catalog", None), seen),
+            "last_search_results": deep_sizeof(self.last_search_results, seen),
+            "search_index": deep_sizeof(getattr(self, "_search_index", None), seen),
+            "collection_read_marks": deep_sizeof(self._collection_read_marks, seen),
+        }
+        images = {
+            "photo_cache": self._photo_cache_bytes,
+            "page_art_sources": sum(pil_bytes(im) for im in self._asset_sources.values()),
+            "page_art_fitted": sum(photo_bytes(p) for p in self._bg_fit_cache.values()),
+            "side_menu_and_button": sum(pil_bytes(im) for im in (self._side_menu_pil, self._side_menu_bg_pil,
+                                                                 self._menu_btn_pil)),
+            "pinned_by_page": sum(photo_bytes(p) for p in self._page_img_refs),
+        }
+
+        widgets: dict[str, int] = {}
+        canvas_items = 0
+        stack: list[tk.Misc] = [self]
+        while stack:
+            w = stack.pop()
+            cls = w.winfo_class()
+            widgets[cls] = widgets.get(cls, 0) + 1
+            if isinstance(w, tk.Canvas):
+                canvas_items += len(w.find_all())
+            stack.extend(w.winfo_children())
+
+        return {
+            "data": data,
+            "gui_bytes": gui,
+            "image_bytes": images,
+            "photo_cache_entries": len(self._photo_cache),
+            "parked_pages": len(self._page_cache),
+            "widgets": dict(sorted(widgets.items(), key=lambda kv: -kv[1])),
+            "widget_total": sum(widgets.values()),
+            "canvas_items": canvas_items,
+            "total_bytes": data["total_bytes"] + sum(gui.values()) + sum(images.values()),
+            "tracemalloc": tracemalloc_report(),
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+    def _diagnostics_report(self) -> dict:
+        return {"ui_monitor": self.ui_monitor_report(), "data_ops": self.data.profiler.stats(),
+                "photo_cache": self.photo_cache_stats()}
+    def _show_diagnostics_panel(self):
+        """Hidden Settings panel (Ctrl+Shift+D): start/stop the UI monitor + LibraryData profiler, view or save
+        the report, or show the memory footprint (Ctrl+Shift+M on any page saves it to the data dir)."""
+        win = getattr(self, "_diagnostics_win", None)
+        if win is not None and win.winfo_exists():
+            win.lift()
+            return
+        win = self._diagnostics_win = tk.Toplevel(self)
+        win.title("Diagnostics")
+        win.transient(self)
+        win.configure(bg=EDITCOLL_BG_COLOR)
+        win.geometry("640x560")
+
+        btn_font = tkfont.Font(family=SHARED_FONT_BUTTON, size=14)
+        text_font = tkfont.Font(family="Courier", size=11)
+
+        body = tk.Frame(win, bg=win["bg"], highlightthickness=0, bd=0)
+        body.pack(fill="both", expand=True, padx=16, pady=(16, 8))
+        scrollbar = tk.Scrollbar(body, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+        text = tk.Text(body, font=text_font, wrap="none", bg=SHARED_SCROLL_BG_COLOR, fg=EDITCOLL_BTN_TEXT_COLOR,
+                       relief="flat", highlightthickness=0, yscrollcommand=scrollbar.set)
+        text.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=text.yview)
+
+        row = tk.Frame(win, bg=win["bg"], highlightthickness=0, bd=0)
+        row.pack(fill="x", padx=16, pady=(0, 16))
+
+        def _refresh():
+            text.configure(state="normal")
+            text.delete("1.0", "end")
+            text.insert("1.0", json.dumps(self._diagnostics_report(), indent=2))
+            text.configure(state="disabled")
+            toggle_btn.configure(text="Stop Monitor" if self._ui_monitor is not None else "Start Monitor")
+
+        def _toggle():
+            if self._ui_monitor is None:
+                self.enable_ui_monitor()
+                self.data.profiler.enable()
+            else:
+                self.disable_ui_monitor()
+                self.data.profiler.disable()
+            _refresh()
+
+        def _save():
+            from tkinter import filedialog
+            path = filedialog.asksaveasfilename(parent=win, title="Save Diagnostics", defaultextension=".json",
+                                                initialfile="diagnostics.json", filetypes=[("JSON", "*.json")])
+            if path:
+                Path(path).write_text(json.dumps(self._diagnostics_report(), indent=2) + "\n", encoding="utf-8")
+
+        def _btn(label, cmd):
+            b = tk.Button(row, text=label, command=cmd, font=btn_font,
+                          bg=SHARED_BUTTON1_BG_COLOR, fg=SHARED_BUTTON1_TEXT_COLOR,
+                          activebackground=SHARED_BUTTON1_BG_ONCLICK_COLOR,
+                          activeforeground=SHARED_BUTTON1_TEXT_ONCLICK_COLOR,
+                          bd=SHARED_BUTTON_BORDER_WIDTH, relief="flat", highlightthickness=0, cursor="hand2")
+            b.pack(side="left", padx=(0, 8))
+            return b
+
+        def _memory():
+            text.configure(state="normal")
+            text.delete("1.0", "end")
+            text.insert("1.0", json.dumps(self.memory_report(), indent=2))
+            text.configure(state="disabled")
+
+        toggle_btn = _btn("Start Monitor", _toggle)
+        _btn("Refresh", _refresh)
+        _btn("Memory", _memory)
+        _btn("Save JSON", _save)
+        _btn("Close", win.destroy)
+        _refresh()
 
     def _safe_call(self, fn, *args, **kwargs):
         try:
@@ -925,6 +1384,14 @@ class LibraryApp(tk.Tk):
                 except Exception:
                     pass
                 setattr(self, attr, None)
+        # ...and any half-built progressive renders
+        self._progressive_gen = getattr(self, "_progressive_gen", 0) + 1
+        for after_id in list(getattr(self, "_progressive_jobs", {}).values()):
+            try:
+                self.after_cancel(after_id)
+            except Exception:
+                pass
+        self._progressive_jobs = {}
     def toggle_fullscreen(self, on: bool | None = None):
         if on is None:
             on = not bool(self.attributes("-fullscreen"))
@@ -1010,6 +1477,7 @@ class LibraryApp(tk.Tk):
             return
 
         # 2) typed confirmation
+        from tkinter import simpledialog
         typed = simpledialog.askstring(
             "Confirm Factory Reset",
             'Type RESET to permanently delete your library data:'
@@ -1023,6 +1491,7 @@ class LibraryApp(tk.Tk):
             self.data.factory_reset()
             self.data.save()
             self._refresh_catalog_from_data()
+            self._page_cache_clear()
         except Exception as e:
             messagebox.showerror("Factory Reset Failed", str(e))
             return
@@ -1042,6 +1511,7 @@ class LibraryApp(tk.Tk):
     def _refresh_catalog_from_data(self):
         self.catalog = list(self.data.catalog.values())
     def gui_import_csv(self):
+        from tkinter import filedialog
         path = filedialog.askopenfilename(
             title="Import Library CSV",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
@@ -1084,6 +1554,7 @@ class LibraryApp(tk.Tk):
 
         threading.Thread(target=worker, daemon=True).start()
     def gui_export_csv(self):
+        from tkinter import filedialog
         path = filedialog.asksaveasfilename(
             title="Export Library CSV",
             defaultextension=".csv",
@@ -1597,6 +2068,7 @@ class LibraryApp(tk.Tk):
     def _mdr_unescape(self, s: str) -> str:
         """HTML-unescape a string safely (OpenLibrary sometimes returns entities in title/author)."""
         try:
+            import html
             return html.unescape(s or "")
         except Exception:
             return (s or "")
@@ -1902,6 +2374,7 @@ class LibraryApp(tk.Tk):
             if isinstance(gvar, tk.StringVar):
                 g = (gvar.get() or "").strip()
                 if g == self._MDR_ADD_GENRE_OPTION:
+                    from tkinter import simpledialog
                     new_g = simpledialog.askstring("Add Genre", "Enter new genre name:")
                     if new_g:
                         g = new_g.strip().title()
@@ -1924,6 +2397,7 @@ class LibraryApp(tk.Tk):
             if updated:
                 latest.update(updated)
                 self.data.catalog[bid] = latest
+                self.data.note_book_changed(bid)
                 changed += 1
 
         # Persist once
@@ -2157,11 +2631,53 @@ class LibraryApp(tk.Tk):
             pady=10,
         )
         cancel_btn.pack(side="right")
+    _SMART_RULE_HELP = ('Books matching a rule, e.g.\n'
+                        '  genre=Mystery AND unread AND tag:"summer"\n'
+                        'Fields: genre, tag, author, title, year (year also < <= > >=)\n'
+                        'Words: read, unread, AND, OR, NOT, ( )')
+    def _side_new_smart_collection(self):
+        from tkinter import simpledialog
+        name = simpledialog.askstring("Smart Collection", "Collection name:", parent=self)
+        name = (name or "").strip()
+        if not name:
+            return
+        if self.data._find_collection_id_by_name(name):
+            messagebox.showerror("Smart Collection", f'A collection named "{name}" already exists.')
+            return
+        query = ""
+        while True:
+            query = simpledialog.askstring("Smart Collection", self._SMART_RULE_HELP, initialvalue=query, parent=self)
+            if not (query or "").strip():
+                return
+            try:
+                self.data.create_smart_collection(name, query, persist=True)
+                break
+            except ValueError as e:
+                messagebox.showerror("Smart Collection", f"Could not use that rule.\n\n{e}")
+        self.show_open_collection_page(name)
+    def _side_edit_smart_rule(self, name: str):
+        query = self.data.get_smart_query(name)
+        from tkinter import simpledialog
+        while True:
+            query = simpledialog.askstring(f"Edit Rule: {name}", self._SMART_RULE_HELP, initialvalue=query, parent=self)
+            if not (query or "").strip():
+                return
+            try:
+                self.data.set_smart_query(name, query, persist=True)
+                break
+            except ValueError as e:
+                messagebox.showerror("Edit Rule", f"Could not use that rule.\n\n{e}")
+        self._nav_suppress_record = True
+        self.show_open_collection_page(name)
     def _side_edit_open_collection(self):
         name = self._current_open_collection_name()
         if not name:
             messagebox.showerror("Edit Collection", "No collection is currently open.")
             return
+        if self.data.is_smart_collection(name):
+            # membership comes from the rule, so edit the rule instead of the book list
+            self._side_edit_smart_rule(name)
+            return
         rec = self._get_collection_record(name) or self._find_collection_record(name)
         if not rec:
             messagebox.showerror("Edit Collection", f'Collection "{name}" was not found.')
@@ -2230,8 +2746,8 @@ class LibraryApp(tk.Tk):
         book_title = self._unescape_entities(book.get("title") or "Untitled").strip()
 
 
-        # Get all collections
-        collections = self._collections_all()
+        # Get all collections (smart collections fill themselves from their rule)
+        collections = [c for c in self._collections_all() if not c.get("smart")]
         if not collections:
             messagebox.showinfo("Add to Collection", "No collections exist yet. Create one first from the Collections page.")
             return
@@ -2342,14 +2858,14 @@ class LibraryApp(tk.Tk):
             # Check if book is already in collection
             col_rec = self._find_collection_record(col_name)
             if col_rec:
-                existing_ids = self._collection_book_ids(col_rec)
-                if bid in existing_ids:
+                cid = col_rec.get("collection_id") or ""
+                if cid in self.data.collection_ids_for_book(bid) or (not cid and bid in self._collection_book_ids(col_rec)):
                     messagebox.showinfo("Already Added", f'"{book_title}" is already in "{col_name}".', parent=win)
                     return
 
             # Add book to collection
             try:
-                success = self.data.add_book_to_collection(col_name, bid, persist=True)
+                success = self.data.add_books_to_collection(col_name, [bid], persist=True) > 0
                 if success:
                     messagebox.showinfo("Success", f'Added "{book_title}" to "{col_name}".', parent=win)
                     win.destroy()
@@ -2905,30 +3421,34 @@ class LibraryApp(tk.Tk):
             changes_made = False
             books_updated = 0
 
-            for original_name, changes in pending_changes.items():
-                new_name = changes.get("new_name", original_name).strip().title()
-                is_deleted = changes.get("deleted", False)
-                is_new = changes.get("is_new", False)
-
-                if is_new:
-                    if not is_deleted and new_name:
-                        # Add new genre
-                        self.data.add_user_genre(new_name)
-                        changes_made = True
-                else:
-                    if is_deleted:
-                        # Delete the genre - data layer now handles clearing from books
-                        count = self.data.delete_genre(original_name)
-                        books_updated += count
-                        changes_made = True
-                    elif new_name != original_name and new_name:
-                        # Rename the genre
-                        count = self.data.rename_genre(original_name, new_name)
-                        books_updated += count
-                        changes_made = True
+            # every rename/delete saves; batch them into a single write
+            with self.data.transaction():
+                for original_name, changes in pending_changes.items():
+                    new_name = changes.get("new_name", original_name).strip().title()
+                    is_deleted = changes.get("deleted", False)
+                    is_new = changes.get("is_new", False)
+
+                    if is_new:
+                        if not is_deleted and new_name:
+                            # Add new genre
+                            self.data.add_user_genre(new_name)
+                            changes_made = True
+                    else:
+                        if is_deleted:
+                            # Delete the genre - data layer now handles clearing from books
+                            count = self.data.delete_genre(original_name)
+                            books_updated += count
+                            changes_made = True
+                        elif new_name != original_name and new_name:
+                            # Rename the genre
+                            count = self.data.rename_genre(original_name, new_name)
+                            books_updated += count
+                            changes_made = True
+
+                if changes_made:
+                    self.data.save()
 
             if changes_made:
-                self.data.save()
                 self._refresh_catalog_from_data()
 
             popup.destroy()
@@ -3025,14 +3545,37 @@ class LibraryApp(tk.Tk):
         )
 
     # ---------- BACKGROUND / UI HELPERS ----------
+    # ---------- BACKGROUND ART ----------
+    BG_FIT_CACHE_MAX = 4           # full-window images are big; a few sizes/pages is plenty
+    BG_FAST_RESIZE_INTERVAL = 0.033  # throttle for low-quality frames during a live drag
+
+    def _asset_source(self, path: Path, mode: str | None = None) -> Image.Image:
+        """
+        Decode an image asset once and keep it (never resized in place).
+        mode=None keeps transparency when the file has any (RGBA), else RGB.
+        """
+        key = (str(path), mode or "")
+        src = self._asset_sources.get(key)
+        if src is None:
+            with Image.open(path) as im:
+                if mode is None:
+                    mode = "RGBA" if ("A" in im.getbands() or "transparency" in im.info) else "RGB"
+                src = im.convert(mode)
+            self._asset_sources[key] = src
+        return src
     def _load_background_image(self):
         if not BG_IMAGE_PATH.exists():
             raise FileNotFoundError(f"Background image not found at: {BG_IMAGE_PATH}")
         # keep an original source image; never resize this in-place
-        self._bg_pil = Image.open(BG_IMAGE_PATH)
+        self._bg_asset = str(BG_IMAGE_PATH)
+        self._bg_pil = self._asset_source(BG_IMAGE_PATH)
         self._update_background_image()
-    def _update_background_image(self):
-        """Cover-fit background: fills window without distortion, center-crops overflow."""
+    def _update_background_image(self, *, fast: bool = False):
+        """
+        Cover-fit background: fills window without distortion, center-crops overflow.
+        - fast=True: cheap NEAREST resample for live drag-resize frames (not cached)
+        - otherwise LANCZOS, served from / stored in the (asset, w, h) LRU
+        """
         if self._bg_pil is None:
             return
 
@@ -3041,15 +3584,26 @@ class LibraryApp(tk.Tk):
         if width <= 1 or height <= 1:
             return
 
-        # ✅ cover-fit + center crop
-        fitted = ImageOps.fit(
-            self._bg_pil,
-            (width, height),
-            method=Image.LANCZOS,
-            centering=(0.5, 0.5),  # center crop
-        )
+        key = (self._bg_asset, width, height)
+        photo = self._bg_fit_cache.get(key)
+        if photo is not None:
+            self._bg_fit_cache.move_to_end(key)
+        else:
+            # ✅ cover-fit + center crop
+            from PIL import ImageOps
+            fitted = ImageOps.fit(
+                self._bg_pil,
+                (width, height),
+                method=(Image.NEAREST if fast else Image.LANCZOS),
+                centering=(0.5, 0.5),  # center crop
+            )
+            photo = ImageTk.PhotoImage(fitted)
+            if not fast:
+                self._bg_fit_cache[key] = photo
+                while len(self._bg_fit_cache) > self.BG_FIT_CACHE_MAX:
+                    self._bg_fit_cache.popitem(last=False)
 
-        self._bg_tk = ImageTk.PhotoImage(fitted)
+        self._bg_tk = photo
 
         self.canvas.delete("bg")
         self.canvas.create_image(0, 0, image=self._bg_tk, anchor="nw", tags="bg")
@@ -3057,8 +3611,12 @@ class LibraryApp(tk.Tk):
     def set_background(self, image_path: Path):
         if not image_path.exists():
             raise FileNotFoundError(f"Background image not found: {image_path}")
+        asset = str(image_path)
+        if asset == self._bg_asset and self._bg_tk is not None and self.canvas.find_withtag("bg"):
+            return  # same art already on screen at this size
         # keep an original source image; never resize this in-place
-        self._bg_pil = Image.open(image_path)
+        self._bg_asset = asset
+        self._bg_pil = self._asset_source(image_path)
         self._update_background_image()
     def _ui_font(self, family: str, size: int, weight: str | None = None, slant: str | None = None):
         kw = {"family": family, "size": size}
@@ -3238,7 +3796,13 @@ class LibraryApp(tk.Tk):
         if event.widget is not self:
             return
 
-        # debounce background + text + design widget reposition
+        # live drag: cheap background frames (throttled) so the art tracks the window edge
+        now = time.perf_counter()
+        if now - self._bg_fast_ts >= self.BG_FAST_RESIZE_INTERVAL:
+            self._bg_fast_ts = now
+            self._update_background_image(fast=True)
+
+        # debounce background + text + design widget reposition (final LANCZOS pass happens there)
         if self._resize_after_id is not None:
             try:
                 self.after_cancel(self._resize_after_id)
@@ -3485,6 +4049,7 @@ class LibraryApp(tk.Tk):
         if not bid:
             return False
 
+        from tkinter import filedialog
         path = filedialog.askopenfilename(
             title="Select Book Cover Image",
             filetypes=[
@@ -3584,6 +4149,7 @@ class LibraryApp(tk.Tk):
         # Genre dropdown (with Add new genre… option)
         genre_val = _get_var("genre", (latest.get("genre") or "").strip())
         if genre_val == "Add new genre…":
+            from tkinter import simpledialog
             new_g = simpledialog.askstring("Add Genre", "Enter new genre name:")
             if new_g:
                 genre_val = new_g.strip().title()
@@ -3623,24 +4189,22 @@ class LibraryApp(tk.Tk):
         # Persist
         latest.update(updated)
         self.data.catalog[bid] = latest
-        try:
-            self.data.save()
-        except Exception as e:
-            messagebox.showerror("Save Changes", f"Could not save changes.\n\n{e}")
-            return
+        self.data.note_book_changed(bid)
 
         # Update last_updated timestamp in all collections containing this book
-        # This enables "Last Updated" sort to work correctly
+        # This enables "Last Updated" sort to work correctly (written by the single save below)
         try:
-            for col in self._collections_all():
-                col_book_ids = self._collection_book_ids(col)
-                if bid in col_book_ids:
-                    col_name = (col.get("name") or "").strip()
-                    if col_name:
-                        self.data.touch_collection_book(col_name, bid)
+            for cid in self.data.collection_ids_for_book(bid):
+                self.data.touch_collection_book(cid, bid, persist=False)
         except Exception:
             pass  # Don't fail the save if timestamp update fails
 
+        try:
+            self.data.save()
+        except Exception as e:
+            messagebox.showerror("Save Changes", f"Could not save changes.\n\n{e}")
+            return
+
         self._book_edit_mode = False
         self._book_edit_vars = {}
         latest = self._ensure_book_origin(latest)
@@ -3657,7 +4221,9 @@ class LibraryApp(tk.Tk):
         self.active_widgets.clear()
     def clear_page(self):
         self.close_side_menu()
+        self._park_page()
         self._cancel_pending_page_jobs()
+        self._cancel_all_cover_requests()
         self.clear_active_widgets()
         self.clear_canvas_text()
         for attr in ("_book_detail_genre", "_book_detail_tags"):
@@ -3672,6 +4238,160 @@ class LibraryApp(tk.Tk):
 
         self.placed_widgets.clear()
         self._active_scroll_canvas = None
+
+    # ---------- PAGE CACHE ----------
+    PAGE_CACHE_MAX = 3
+    PAGE_CACHEABLE = ("genre_page", "tag_page", "view_all", "search_results", "open_collection")
+    PAGE_CACHE_STATE = ("last_search_results", "last_search_query", "_page_font_refs")
+
+    @staticmethod
+    def _page_cache_key(page: str, payload: dict | None) -> tuple[str, str]:
+        return page, repr(sorted((payload or {}).items()))
+    def _park_page(self):
+        """
+        Called by clear_page(): instead of destroying a finished list/grid page that Back can
+        return to, hide its widgets and keep them (LRU of PAGE_CACHE_MAX pages).
+        - only pages in PAGE_CACHEABLE that are on the Back stack are kept
+        - half-built pages (progressive render still running) and edit modes are not
+        - entries are tagged with data.generation and dropped once the catalog changes
+        """
+        leaving = self._page_leaving
+        self._page_leaving = None
+        if leaving is None:
+            leaving = (getattr(self, "current_page", None), dict(getattr(self, "page_payload", {}) or {}))
+        page, payload = leaving
+        if page not in self.PAGE_CACHEABLE:
+            return
+        key = self._page_cache_key(page, payload)
+        if key == self._page_cache_key(getattr(self, "current_page", None), getattr(self, "page_payload", {})):
+            return  # rebuilding the same page; the old widgets are stale
+        if (page, payload) not in [(p, dict(pl)) for p, pl in self._nav_history]:
+            return  # Back can't reach it
+        if getattr(self, "_progressive_jobs", None) or getattr(self, "_mark_read_mode", False) \
+                or getattr(self, "_book_edit_mode", False):
+            return
+
+        top = [w for w in self.active_widgets if w.master in (self.canvas, self)]
+        try:
+            if any(w.winfo_manager() not in ("place", "") for w in top):
+                return
+            placed = [(w, w.place_info()) for w in top if w.winfo_manager() == "place"]
+        except tk.TclError:
+            return
+
+        scrolls: list[tuple[tk.Canvas, float]] = []
+        stack = list(top)
+        while stack:
+            w = stack.pop()
+            try:
+                if isinstance(w, tk.Canvas) and getattr(w, "_inner_window_id", None) is not None:
+                    scrolls.append((w, w.yview()[0]))
+                stack.extend(w.winfo_children())
+            except tk.TclError:
+                pass
+
+        for w, _info in placed:
+            w.place_forget()
+        texts = list(self.canvas_text_items)
+        for item_id, _x, _y in texts:
+            try:
+                self.canvas.itemconfigure(item_id, state="hidden")
+                self.canvas.dtag(item_id, "ui_text")  # so clear_canvas_text() leaves it alone
+            except tk.TclError:
+                pass
+
+        entry = {
+            "generation": self.data.generation,
+            "widgets": list(self.active_widgets),
+            "placed": placed,
+            "placed_widgets": list(self.placed_widgets),
+            "texts": texts,
+            "scrolls": scrolls,
+            "left_nav": (getattr(self, "_left_nav_buttons", None) or [], getattr(self, "_left_nav_layout", None)),
+            "background": self._bg_asset,
+            "img_refs": list(self._page_img_refs),
+            "state": {attr: getattr(self, attr, None) for attr in self.PAGE_CACHE_STATE},
+        }
+        # the next page owns these lists now; don't let clear_page()/make_left_nav_stack() destroy parked widgets
+        self.active_widgets.clear()
+        self.placed_widgets.clear()
+        self.canvas_text_items.clear()
+        self._left_nav_buttons = []
+        self._scroll_target = None
+
+        old = self._page_cache.pop(key, None)
+        if old is not None:
+            self._discard_parked_page(old)
+        self._page_cache[key] = entry
+        while len(self._page_cache) > self.PAGE_CACHE_MAX:
+            _k, evicted = self._page_cache.popitem(last=False)
+            self._discard_parked_page(evicted)
+    def _discard_parked_page(self, entry: dict):
+        for w in entry["widgets"]:
+            try:
+                w.destroy()
+            except tk.TclError:
+                pass
+        for item_id, _x, _y in entry["texts"]:
+            try:
+                self.canvas.delete(item_id)
+            except tk.TclError:
+                pass
+    def _page_cache_clear(self):
+        while self._page_cache:
+            _k, entry = self._page_cache.popitem()
+            self._discard_parked_page(entry)
+    def _restore_parked_page(self, page: str, payload: dict) -> bool:
+        """Bring a parked page back (with its scroll position). False if there's nothing valid to restore."""
+        entry = self._page_cache.pop(self._page_cache_key(page, payload), None)
+        if entry is None:
+            return False
+        if entry["generation"] != self.data.generation:
+            self._discard_parked_page(entry)
+            return False
+
+        self.set_page(page, **payload)
+        self.clear_page()
+        self.set_background(Path(entry["background"]))
+        self._page_img_refs[:] = entry["img_refs"]
+        for attr, value in entry["state"].items():
+            setattr(self, attr, value)
+
+        self.active_widgets.extend(entry["widgets"])
+        self.placed_widgets.extend(entry["placed_widgets"])
+        for w, info in entry["placed"]:
+            try:
+                w.place(**info)
+            except tk.TclError:
+                pass
+        for item_id, _x, _y in entry["texts"]:
+            try:
+                self.canvas.addtag_withtag("ui_text", item_id)
+                self.canvas.itemconfigure(item_id, state="normal")
+            except tk.TclError:
+                pass
+        self.canvas_text_items.extend(entry["texts"])
+        self._left_nav_buttons, layout = entry["left_nav"]
+        if layout is not None:
+            self._left_nav_layout = layout
+
+        # the window may have been resized while the page was parked
+        self._update_canvas_text_positions()
+        self._reposition_design_widgets()
+        self._position_left_nav_stack()
+        self._raise_left_nav()
+
+        for canvas, first in entry["scrolls"]:
+            try:
+                if not canvas.winfo_exists():
+                    continue
+                canvas.yview_moveto(first)
+                refill = getattr(canvas, "_virtual_refill", None)
+                if refill is not None:
+                    refill()  # re-request covers that were cancelled while parked
+            except tk.TclError:
+                pass
+        return True
     def _position_left_nav_stack(self):
         """Pin left-nav stack to bottom-left of the canvas, like the menu button."""
         btns = getattr(self, "_left_nav_buttons", None) or []
@@ -3878,7 +4598,49 @@ class LibraryApp(tk.Tk):
         )
         return btn
     def _render_genre_buttons(self,*,grid_frame,grid_canvas,genres: list[str],fs_like: bool,gap_x: int,gap_y: int,btn_min_w: int,btn_h: int,max_cols: int,):
+        avail_w = max(grid_canvas.winfo_width(), 1)
+
+        cols_by_width = max(1, (avail_w + gap_x) // (btn_min_w + gap_x))
+        cols = max(1, min(int(cols_by_width), max_cols))
+
+        total_gap = gap_x * (cols - 1)
+        btn_w = max(btn_min_w, (avail_w - total_gap) // cols)
+
+        def _sync_scrollregion():
+            try:
+                grid_canvas.update_idletasks()
+                grid_canvas.configure(scrollregion=grid_canvas.bbox("all"))
+            except Exception:
+                pass
+
+        def _grid_button(i: int, frame: tk.Frame, btn: tk.Button):
+            r = i // cols
+            c = i % cols
+            row_bg = SHARED_TABLE_BG_COLOR if r % 2 == 0 else SHARED_TABLE_ALTROW_BG_COLOR
+            frame.configure(width=btn_w, height=btn_h, bg=row_bg)
+            frame.grid(
+                row=r, column=c,
+                padx=(0 if c == 0 else gap_x, 0),
+                pady=(0 if r == 0 else gap_y, 0),
+                sticky="nsew",
+            )
+            btn.configure(wraplength=btn_w - 20)
+
+        # Same genres already on screen (a resize): re-grid the existing buttons, don't rebuild them
+        state = getattr(grid_frame, "_genre_buttons", None)
+        if state and state["genres"] == tuple(genres) and state["cells"] and len(state["cells"]) == len(genres):
+            if state["cols"] == cols and state["btn_w"] == btn_w:
+                return
+            for c in range(max(cols, state["cols"])):
+                grid_frame.grid_columnconfigure(c, weight=(1 if c < cols else 0), uniform=("genrecols" if c < cols else ""))
+            for i, (frame, btn) in enumerate(state["cells"]):
+                _grid_button(i, frame, btn)
+            state.update(cols=cols, btn_w=btn_w)
+            _sync_scrollregion()
+            return
+
         # clear old
+        grid_frame._genre_buttons = None
         for child in grid_frame.winfo_children():
             child.destroy()
 
@@ -3894,29 +4656,14 @@ class LibraryApp(tk.Tk):
             ).pack(fill="both", expand=True)
             return
 
-        avail_w = max(grid_canvas.winfo_width(), 1)
-
-        cols_by_width = max(1, (avail_w + gap_x) // (btn_min_w + gap_x))
-        cols = max(1, min(int(cols_by_width), max_cols))
-
-        total_gap = gap_x * (cols - 1)
-        btn_w = max(btn_min_w, (avail_w - total_gap) // cols)
-
         for c in range(cols):
             grid_frame.grid_columnconfigure(c, weight=1, uniform="genrecols")
 
-        for i, genre in enumerate(genres):
-            r = i // cols
-            c = i % cols
-            row_bg = SHARED_TABLE_BG_COLOR if r % 2 == 0 else SHARED_TABLE_ALTROW_BG_COLOR
+        state = {"genres": tuple(genres), "cells": [], "cols": cols, "btn_w": btn_w}
+        grid_frame._genre_buttons = state
 
-            frame = tk.Frame(grid_frame, width=btn_w, height=btn_h, bg=row_bg, highlightthickness=0, bd=0)
-            frame.grid(
-                row=r, column=c,
-                padx=(0 if c == 0 else gap_x, 0),
-                pady=(0 if r == 0 else gap_y, 0),
-                sticky="nsew",
-            )
+        def _build_genre_button(i: int, genre: str):
+            frame = tk.Frame(grid_frame, highlightthickness=0, bd=0)
             frame.grid_propagate(False)
 
             btn = tk.Button(
@@ -3932,10 +4679,16 @@ class LibraryApp(tk.Tk):
                 highlightthickness=0,
                 relief="flat",
                 takefocus=False,
-                wraplength=btn_w - 20,
             )
             btn.pack(fill="both", expand=True)
+            _grid_button(i, frame, btn)
+            state["cells"].append((frame, btn))
             self.active_widgets.extend([frame, btn])
+
+        # first screenful now, the rest in time-sliced chunks
+        visible_rows = max(grid_canvas.winfo_height(), 1) // max(btn_h + gap_y, 1) + 1
+        self._render_progressively(grid_frame, genres, _build_genre_button,
+                                   first_batch=cols * visible_rows, on_chunk=_sync_scrollregion)
     def _make_scroll_container(self, *, relx=0.5, rely=0.5, relwidth=0.88, relheight=0.68, bg=THEME_COLOR8, top_inset: int = 0, sb_width: int = 14, content_pad_x: int = 0, content_pad_y: int = 0):
         """
         Creates a card container with a scrollable canvas inside.
@@ -3960,6 +4713,7 @@ class LibraryApp(tk.Tk):
         # ✅ store ids so renderers can force-width sync anytime
         canvas._inner_window_id = window_id
         canvas._inner_frame = scroll_frame
+        canvas._scrollbar = scrollbar
 
         def _sync_scrollregion(_evt=None):
             try:
@@ -4002,6 +4756,547 @@ class LibraryApp(tk.Tk):
         self.active_widgets.extend([container, canvas, scrollbar, scroll_frame])
         return container, canvas, scroll_frame
 
+    # ---------- PHOTO CACHE ----------
+    # One LRU of decoded PhotoImages for the whole app, keyed by (path, size, mode).
+    # Widgets still pin what they show (_page_img_refs / ._img_ref), so evicting only
+    # drops the cache's reference -- nothing on screen goes blank.
+    PHOTO_CACHE_BUDGET_BYTES = 96 * 1024 * 1024
+
+    @staticmethod
+    def _photo_cache_key(path, size: tuple[int, int], mode: str) -> tuple:
+        p = str(path)
+        try:
+            mtime = os.stat(p).st_mtime_ns  # a rewritten file must not hit the old image
+        except OSError:
+            mtime = 0
+        return (p, int(size[0]), int(size[1]), mode, mtime)
+    @staticmethod
+    def _decode_photo_source(path, size: tuple[int, int], mode: str = "fit", source: Image.Image | None = None) -> Image.Image:
+        """
+        PIL-only half of _cached_photo (no Tk calls, safe off the main thread).
+        Modes:
+          fit       - keep aspect, fit inside size (covers)
+          square    - center-crop to a square, then resize (collection photos)
+          exact     - stretch to size (menu button)
+          fill_left - cover size, anchored left (side menu background)
+        """
+        w, h = max(1, int(size[0])), max(1, int(size[1]))
+        if mode == "fit":
+            if source is None:
+                return decode_fitted_image(path, (w, h))  # JPEG draft decode
+            im = source.convert("RGB")
+            im.thumbnail((w, h), Image.LANCZOS)
+            return im
+
+        im = (source if source is not None else Image.open(path)).convert("RGBA")
+        if mode == "square":
+            iw, ih = im.size
+            side = min(iw, ih)
+            left = (iw - side) // 2
+            top = (ih - side) // 2
+            return im.crop((left, top, left + side, top + side)).resize((w, h), Image.LANCZOS)
+        if mode == "fill_left":
+            from PIL import ImageOps
+            return ImageOps.fit(im, (w, h), method=Image.LANCZOS, centering=(0, 0.5))
+        return im.resize((w, h), Image.LANCZOS)
+    def _photo_cache_get(self, key: tuple) -> ImageTk.PhotoImage | None:
+        hit = self._photo_cache.get(key)
+        if hit is None:
+            self._photo_cache_stats["misses"] += 1
+            return None
+        self._photo_cache.move_to_end(key)
+        self._photo_cache_stats["hits"] += 1
+        return hit[0]
+    def _photo_cache_put(self, key: tuple, pil: Image.Image) -> ImageTk.PhotoImage:
+        photo = ImageTk.PhotoImage(pil)
+        nbytes = photo.width() * photo.height() * 4
+
+        old = self._photo_cache.pop(key, None)
+        if old is not None:
+            self._photo_cache_bytes -= old[1]
+        self._photo_cache[key] = (photo, nbytes)
+        self._photo_cache_bytes += nbytes
+
+        # evict least-recently-used, but never the entry we just added
+        while self._photo_cache_bytes > self.PHOTO_CACHE_BUDGET_BYTES and len(self._photo_cache) > 1:
+            _k, (_p, n) = self._photo_cache.popitem(last=False)
+            self._photo_cache_bytes -= n
+            self._photo_cache_stats["evictions"] += 1
+        return photo
+    def _cached_photo(self, path, size: tuple[int, int], *, mode: str = "fit",
+                      source: Image.Image | None = None, decode_path=None) -> ImageTk.PhotoImage | None:
+        """
+        Shared decode+resize with LRU reuse across pages.
+        - path/size/mode form the cache key
+        - source: already-loaded PIL image to resize instead of opening path
+        - decode_path: read pixels from here instead (e.g. a pre-sized thumbnail)
+        Returns None if the file can't be decoded.
+        """
+        if not path:
+            return None
+        key = self._photo_cache_key(path, size, mode)
+        photo = self._photo_cache_get(key)
+        if photo is not None:
+            return photo
+        try:
+            pil = self._decode_photo_source(decode_path or path, size, mode, source)
+        except Exception:
+            return None
+        return self._photo_cache_put(key, pil)
+    def _cached_cover_photo(self, book_id: str, size: tuple[int, int]) -> ImageTk.PhotoImage | None:
+        """Book cover fitted into size; decodes from the thumbs/ copy on a miss."""
+        bid = (book_id or "").strip()
+        cover_path = self.data.get_cover_path(bid) if bid else None
+        if not cover_path:
+            return None
+        key = self._photo_cache_key(cover_path, size, "fit")
+        photo = self._photo_cache_get(key)
+        if photo is not None:
+            return photo
+        src = self.data.get_cover_thumbnail(bid, size) or cover_path
+        try:
+            pil = self._decode_photo_source(src, size, "fit")
+        except Exception:
+            return None
+        return self._photo_cache_put(key, pil)
+    # ---------- COVER DECODE POOL ----------
+    # PIL releases the GIL while decoding/resampling, so a few workers keep covers
+    # off the Tk thread. Results come back through after(0, ...); a ticket (Event)
+    # that gets set means "nobody wants this anymore".
+    COVER_DECODE_WORKERS = 3
+
+    def _request_cover_photo(self, book_id: str, size: tuple[int, int],
+                             on_ready: Callable[[ImageTk.PhotoImage], None]) -> threading.Event | None:
+        """
+        Deliver the book's fitted cover to on_ready (always on the Tk thread).
+        Cache hits call on_ready right away and return None; misses return a ticket
+        for _cancel_cover_request. Books without a cover never call on_ready.
+        """
+        bid = (book_id or "").strip()
+        cover_path = self.data.get_cover_path(bid) if bid else None
+        if not cover_path:
+            return None
+        key = self._photo_cache_key(cover_path, size, "fit")
+        photo = self._photo_cache_get(key)
+        if photo is not None:
+            on_ready(photo)
+            return None
+
+        if self._cover_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._cover_pool = ThreadPoolExecutor(max_workers=self.COVER_DECODE_WORKERS,
+                                                  thread_name_prefix="cover-decode")
+        ticket = threading.Event()
+
+        def _work():
+            if ticket.is_set():
+                return None
+            src = self.data.get_cover_thumbnail(bid, size) or cover_path
+            return self._decode_photo_source(src, size, "fit")
+
+        def _deliver(pil):
+            self._cover_jobs.pop(ticket, None)
+            if ticket.is_set() or pil is None:
+                return
+            hit = self._photo_cache.get(key)  # another tile may have decoded it meanwhile
+            on_ready(hit[0] if hit is not None else self._photo_cache_put(key, pil))
+
+        def _done(fut: Future):
+            if ticket.is_set() or fut.cancelled():
+                return
+            try:
+                pil = fut.result()
+            except Exception:
+                pil = None
+            try:
+                self.after(0, lambda: _deliver(pil))
+            except (RuntimeError, tk.TclError):
+                pass  # app is shutting down
+
+        fut = self._cover_pool.submit(_work)
+        self._cover_jobs[ticket] = fut
+        fut.add_done_callback(_done)
+        return ticket
+    def _cancel_cover_request(self, ticket: threading.Event | None):
+        if ticket is None:
+            return
+        ticket.set()
+        fut = self._cover_jobs.pop(ticket, None)
+        if fut is not None:
+            fut.cancel()
+    def _cancel_all_cover_requests(self):
+        for ticket in list(self._cover_jobs):
+            self._cancel_cover_request(ticket)
+    def photo_cache_stats(self) -> dict:
+        """Hit/miss/eviction counters plus current size of the shared photo cache."""
+        stats = dict(self._photo_cache_stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(
+            entries=len(self._photo_cache),
+            bytes=self._photo_cache_bytes,
+            budget_bytes=self.PHOTO_CACHE_BUDGET_BYTES,
+            hit_rate=(stats["hits"] / lookups) if lookups else 0.0,
+        )
+        return stats
+    def _photo_cache_clear(self):
+        self._photo_cache.clear()
+        self._photo_cache_bytes = 0
+
+    # ---------- PROGRESSIVE RENDER ----------
+    PROGRESSIVE_BUDGET_MS = 8
+
+    def _render_progressively(self, owner: tk.Widget, items: list, build_one: Callable[[int, Any], None], *,
+                              first_batch: int = 0, on_chunk: Callable[[], None] | None = None):
+        """
+        Build widgets for items in time-sliced chunks so input/repaint keep flowing.
+        - owner: the container being filled; a new job for the same owner replaces the old one
+        - first_batch: items built synchronously (the first screenful), ignoring the budget
+        - on_chunk: runs after every chunk (e.g. scrollregion sync)
+        Each later tick builds for ~PROGRESSIVE_BUDGET_MS, then yields via after().
+        Aborts when _cancel_pending_page_jobs runs (page change) or the owner is destroyed.
+        """
+        jobs = getattr(self, "_progressive_jobs", None)
+        if jobs is None:
+            jobs = self._progressive_jobs = {}
+        job_key = str(owner)
+        old = jobs.pop(job_key, None)
+        if old is not None:
+            try:
+                self.after_cancel(old)
+            except Exception:
+                pass
+
+        gen = getattr(self, "_progressive_gen", 0)
+        budget_s = self.PROGRESSIVE_BUDGET_MS / 1000.0
+        pos = {"i": 0}
+
+        def _tick(min_items: int = 0):
+            jobs.pop(job_key, None)
+            if gen != getattr(self, "_progressive_gen", 0):
+                return
+            try:
+                if not owner.winfo_exists():
+                    return
+            except tk.TclError:
+                return
+
+            deadline = time.perf_counter() + budget_s
+            i = pos["i"]
+            n = len(items)
+            built = 0
+            while i < n and (built < min_items or time.perf_counter() < deadline):
+                build_one(i, items[i])
+                i += 1
+                built += 1
+            pos["i"] = i
+
+            if on_chunk is not None:
+                on_chunk()
+            if i < n:
+                jobs[job_key] = self.after(1, _tick)
+
+        _tick(max(1, int(first_batch)))
+
+    # ---------- VIRTUAL ROWS ----------
+    VIRTUAL_OVERSCAN_PX = 360
+
+    def _clear_virtual_rows(self, canvas: tk.Canvas, scroll_frame: tk.Frame):
+        """Drop every row widget and hand the inner frame back to normal (requested-size) layout."""
+        canvas._virtual_refresh = None
+        canvas._virtual_refill = None
+        for child in scroll_frame.winfo_children():
+            child.destroy()
+        wid = getattr(canvas, "_inner_window_id", None)
+        if wid is not None:
+            try:
+                canvas.itemconfig(wid, height=0, state="normal")  # 0 = use the frame's requested height again
+            except Exception:
+                pass
+        # tear down a canvas-drawn list (see _mount_canvas_list)
+        try:
+            canvas.delete("vlist")
+            for seq in ("<Button-1>", "<Motion>"):
+                canvas.unbind(seq)
+            canvas.configure(cursor="")
+        except tk.TclError:
+            pass
+        canvas._vlist_redraw_row = None
+        canvas._vlist_relayout = None
+        self._register_scroll_canvas(canvas)  # drops the list's extra <Leave> handler
+    def _mount_virtual_rows(self, canvas: tk.Canvas, scroll_frame: tk.Frame, specs: list[tuple[str, int, Any]], *,
+                            make_row: Callable[[str], tk.Frame], fill_row: Callable[[tk.Frame, Any, int], None],
+                            release_row: Callable[[tk.Frame], None] | None = None,
+                            top: int = 0, bottom_pad: int = 0):
+        """
+        Virtualized rows inside a _make_scroll_container canvas.
+        - specs: one (kind, height_px, payload) per row
+        - make_row(kind) builds an empty row frame (child of scroll_frame)
+        - fill_row(frame, payload, index) points a pooled frame at a row
+        - release_row(frame), optional, runs when a row scrolls out (cancel its pending work)
+        Only rows inside the viewport (+ overscan) own widgets; rows scrolled out are recycled
+        into a per-kind pool. The inner window is sized from the row heights, so the scrollregion
+        is right without ever building the off-screen rows.
+        Anything already placed above `top` (headers) is left alone.
+        """
+        offsets: list[int] = []
+        y = top
+        for _kind, h, _payload in specs:
+            offsets.append(y)
+            y += h
+        total_h = y + bottom_pad
+
+        live: dict[int, tk.Frame] = {}
+        free: dict[str, list[tk.Frame]] = {}
+        overscan = self.VIRTUAL_OVERSCAN_PX
+
+        def _refresh():
+            try:
+                if not canvas.winfo_exists():
+                    return
+                wid = getattr(canvas, "_inner_window_id", None)
+                origin_y = canvas.coords(wid)[1] if wid is not None else 0
+                view_top = canvas.canvasy(0) - origin_y
+                view_bot = view_top + max(canvas.winfo_height(), 1)
+            except tk.TclError:
+                return
+
+            lo = max(0, bisect_right(offsets, view_top - overscan) - 1)
+            hi = bisect_left(offsets, view_bot + overscan)
+
+            for i in [i for i in live if not lo <= i < hi]:
+                frame = live.pop(i)
+                frame.place_forget()
+                if release_row is not None:
+                    release_row(frame)
+                free.setdefault(specs[i][0], []).append(frame)
+
+            for i in range(lo, hi):
+                if i in live:
+                    continue
+                kind, h, payload = specs[i]
+                pool = free.get(kind)
+                frame = pool.pop() if pool else make_row(kind)
+                fill_row(frame, payload, i)
+                frame.place(x=0, y=offsets[i], relwidth=1.0, height=h)
+                live[i] = frame
+
+        # route view changes (wheel, scrollbar drag, resize) through the refresh
+        if not getattr(canvas, "_virtual_hooked", False):
+            scrollbar = getattr(canvas, "_scrollbar", None)
+
+            def _on_yscroll(first, last):
+                if scrollbar is not None:
+                    scrollbar.set(first, last)
+                refresh = getattr(canvas, "_virtual_refresh", None)
+                if refresh is not None:
+                    refresh()
+
+            canvas.configure(yscrollcommand=_on_yscroll)
+            canvas._virtual_hooked = True
+
+        def _refill():
+            # hand every live row back to the pool and re-fill the viewport from scratch
+            for i in list(live):
+                frame = live.pop(i)
+                frame.place_forget()
+                if release_row is not None:
+                    release_row(frame)
+                free.setdefault(specs[i][0], []).append(frame)
+            _refresh()
+
+        canvas._virtual_refresh = _refresh
+        canvas._virtual_refill = _refill
+
+        wid = getattr(canvas, "_inner_window_id", None)
+        if wid is not None:
+            try:
+                canvas.itemconfig(wid, height=max(total_h, 1))
+            except Exception:
+                pass
+        try:
+            canvas.configure(scrollregion=(0, 0, max(canvas.winfo_width(), 1), max(total_h, 1)))
+        except Exception:
+            pass
+
+        _refresh()
+        canvas.after_idle(_refresh)
+
+    def _mount_canvas_list(self, canvas: tk.Canvas, scroll_frame: tk.Frame, *, columns: list[tuple[str, int, str]],
+                           rows: list, cell_texts: Callable[[Any], tuple[str, ...]], on_open: Callable[[Any], None],
+                           row_bg: Callable[[int], str], header_font, row_font, sort_field: str = "", sort_reverse: bool = False,
+                           on_header_click: Callable[[str], None] | None = None,
+                           on_cell_click: Callable[[int, int], bool] | None = None):
+        """
+        Table drawn straight onto a _make_scroll_container canvas: text + rectangle items, no
+        per-cell widgets. Only rows in the viewport (+ overscan) are drawn; clicks and hover
+        are hit-tested from the y coordinate.
+        - columns: (header text, width px, sort field) per column
+        - cell_texts(row) -> raw strings, ellipsized once per row and memoized
+        - on_cell_click(row_index, col_index) -> True if it handled the click (e.g. a checkbox);
+          call canvas._vlist_redraw_row(i) afterwards to repaint that row
+        """
+        self._clear_virtual_rows(canvas, scroll_frame)
+        wid = getattr(canvas, "_inner_window_id", None)
+        if wid is not None:
+            canvas.itemconfig(wid, state="hidden")
+
+        row_f = tkfont.Font(font=row_font)
+        header_h = tkfont.Font(font=header_font).metrics("linespace") + 22
+        row_h = row_f.metrics("linespace") + 18
+        total_h = header_h + row_h * len(rows)
+        columns = list(columns)
+        col_x: list[int] = []
+        geom = {"total_w": 0}
+
+        def _layout_columns():
+            col_x.clear()
+            x = 0
+            for _t, w, _f in columns:
+                col_x.append(x)
+                x += w
+            geom["total_w"] = x
+
+        _layout_columns()
+        shown: dict[int, tuple[str, ...]] = {}  # row index -> ellipsized strings
+
+        def _ellipsized(i: int) -> tuple[str, ...]:
+            cached = shown.get(i)
+            if cached is None:
+                raw = cell_texts(rows[i])
+                cached = tuple(self._ellipsize_px(t, row_f, columns[c][1] - 24) for c, t in enumerate(raw))
+                shown[i] = cached
+            return cached
+
+        def _row_right() -> int:
+            return max(geom["total_w"], canvas.winfo_width())
+
+        # --- header (scrolls with the rows, like the widget version did) ---
+        def _draw_header():
+            canvas.delete("vlist_hdr")
+            canvas.create_rectangle(0, 0, _row_right(), header_h, fill=SHARED_SUBHEADER_BG_COLOR,
+                                    outline="", tags=("vlist", "vlist_hdr"))
+            for c, (text, _w, field) in enumerate(columns):
+                if sort_field and field and sort_field.lower() == field.lower():
+                    text = f"{'▲' if sort_reverse else '▼'} {text}"
+                canvas.create_text(col_x[c] + 12, header_h // 2, text=text, anchor="w", font=header_font,
+                                   fill=SHARED_SUBHEADER_TEXT_COLOR, tags=("vlist", "vlist_hdr"))
+
+        _draw_header()
+
+        # spacer keeps bbox("all") (used by other scrollregion syncs) as tall as the table
+        canvas.create_rectangle(0, 0, 1, total_h, outline="", fill="", tags=("vlist",))
+        try:
+            canvas.configure(scrollregion=(0, 0, max(canvas.winfo_width(), 1), max(total_h, 1)))
+        except Exception:
+            pass
+
+        drawn = {"lo": 0, "hi": 0}
+
+        def _draw_row(i: int):
+            tag = f"vlist_r{i}"
+            canvas.delete(tag)
+            y0 = header_h + i * row_h
+            canvas.create_rectangle(0, y0, _row_right(), y0 + row_h, fill=row_bg(i),
+                                    outline="", tags=("vlist", "vlist_row", tag))
+            for c, txt in enumerate(_ellipsized(i)):
+                canvas.create_text(col_x[c] + 12, y0 + row_h // 2, text=txt, anchor="w", font=row_font,
+                                   fill=SHARED_SCROLLROW_TEXT_COLOR, tags=("vlist", "vlist_row", tag))
+            canvas.tag_raise("vlist_hover")
+
+        def _redraw_row(i: int):
+            shown.pop(i, None)
+            if drawn["lo"] <= i < drawn["hi"]:
+                _draw_row(i)
+
+        def _relayout(widths: list[int]):
+            """New column widths (window resize): re-ellipsize and redraw in place, rows stay sorted as-is."""
+            for c, w in enumerate(widths[:len(columns)]):
+                text, _old, field = columns[c]
+                columns[c] = (text, int(w), field)
+            _layout_columns()
+            shown.clear()
+            _draw_header()
+            for i in range(drawn["lo"], drawn["hi"]):
+                _draw_row(i)
+
+        def _refresh():
+            try:
+                if not canvas.winfo_exists():
+                    return
+                view_top = canvas.canvasy(0)
+                view_bot = view_top + max(canvas.winfo_height(), 1)
+            except tk.TclError:
+                return
+            overscan = self.VIRTUAL_OVERSCAN_PX
+            lo = max(0, int((view_top - overscan - header_h) // row_h))
+            hi = min(len(rows), int((view_bot + overscan - header_h) // row_h) + 1)
+            if (lo, hi) == (drawn["lo"], drawn["hi"]):
+                return
+            for i in range(drawn["lo"], drawn["hi"]):
+                if not lo <= i < hi:
+                    canvas.delete(f"vlist_r{i}")
+            for i in range(lo, hi):
+                if not drawn["lo"] <= i < drawn["hi"]:
+                    _draw_row(i)
+            drawn["lo"], drawn["hi"] = lo, hi
+
+        def _hit(event) -> tuple[int, int]:
+            """(row index, column index) under the pointer; row is -1 on the header, -2 below the last row."""
+            y = canvas.canvasy(event.y)
+            x = canvas.canvasx(event.x)
+            col = max(0, bisect_right(col_x, x) - 1)
+            if y < header_h:
+                return -1, col
+            i = int((y - header_h) // row_h)
+            return (i if 0 <= i < len(rows) else -2), col
+
+        def _on_click(event):
+            i, col = _hit(event)
+            if i == -1:
+                if on_header_click is not None and columns[col][2]:
+                    on_header_click(columns[col][2])
+                return "break"
+            if i < 0:
+                return None
+            if on_cell_click is not None and on_cell_click(i, col):
+                return "break"
+            on_open(rows[i])
+            return "break"
+
+        def _on_motion(event):
+            i, _col = _hit(event)
+            canvas.delete("vlist_hover")
+            if i >= 0:
+                y0 = header_h + i * row_h
+                canvas.create_rectangle(1, y0 + 1, _row_right() - 2, y0 + row_h - 1,
+                                        outline=SHARED_TABLE_HOVER_OUTLINE_COLOR, width=2, tags=("vlist", "vlist_hover"))
+            canvas.configure(cursor="hand2" if i != -2 else "")
+
+        canvas.bind("<Button-1>", _on_click)
+        canvas.bind("<Motion>", _on_motion)
+        canvas.bind("<Leave>", lambda _e: (canvas.delete("vlist_hover"), canvas.configure(cursor="")), add="+")
+
+        # same yscroll hook as _mount_virtual_rows drives the redraw
+        if not getattr(canvas, "_virtual_hooked", False):
+            scrollbar = getattr(canvas, "_scrollbar", None)
+
+            def _on_yscroll(first, last):
+                if scrollbar is not None:
+                    scrollbar.set(first, last)
+                refresh = getattr(canvas, "_virtual_refresh", None)
+                if refresh is not None:
+                    refresh()
+
+            canvas.configure(yscrollcommand=_on_yscroll)
+            canvas._virtual_hooked = True
+
+        canvas._virtual_refresh = _refresh
+        canvas._vlist_redraw_row = _redraw_row
+        canvas._vlist_relayout = _relayout
+        _refresh()
+        canvas.after_idle(_refresh)
+
     ## Side Menu
     # --- Side Menu core ---
     MENU_BTN_H_PX = 60
@@ -4016,9 +5311,8 @@ class LibraryApp(tk.Tk):
         if not SIDE_MENU_BG_IMG.exists():
             raise FileNotFoundError(f"Side menu bg image not found: {SIDE_MENU_BG_IMG}")
 
-        # Load PIL once
-        self._menu_btn_pil = Image.open(MENU_BTN_IMG).convert("RGBA")
-        self._side_menu_bg_pil = Image.open(SIDE_MENU_BG_IMG).convert("RGBA")
+        # Load PIL once (side menu art is decoded on first open, or warmed after startup)
+        self._menu_btn_pil = self._asset_source(MENU_BTN_IMG, "RGBA")
 
         # Create canvas image item ONCE
         if self._menu_btn_item is None:
@@ -4055,8 +5349,7 @@ class LibraryApp(tk.Tk):
         scale = target_h / h0
         target_w = max(1, int(w0 * scale))
 
-        resized = pil.resize((target_w, target_h), Image.LANCZOS)
-        self._menu_btn_tk = ImageTk.PhotoImage(resized)
+        self._menu_btn_tk = self._cached_photo(MENU_BTN_IMG, (target_w, target_h), mode="exact", source=pil)
 
         try:
             self.canvas.itemconfigure(self._menu_btn_item, image=self._menu_btn_tk)
@@ -4147,8 +5440,6 @@ class LibraryApp(tk.Tk):
 
     def _refresh_side_menu_bg_image(self):
         """Resize side_menu.png to the PANEL size (1/3 window)."""
-        if self._side_menu_bg_pil is None:
-            return
         if not (self._side_menu_panel_win and self._side_menu_panel_win.winfo_exists()):
             return
         if not (self._side_menu_bg_lbl and self._side_menu_bg_lbl.winfo_exists()):
@@ -4161,14 +5452,11 @@ class LibraryApp(tk.Tk):
 
         if self._side_menu_bg_last_size == size and self._side_menu_bg_tk is not None:
             return
+        if self._side_menu_bg_pil is None:
+            self._side_menu_bg_pil = self._asset_source(SIDE_MENU_BG_IMG, "RGBA")
 
-        pil = ImageOps.fit(
-            self._side_menu_bg_pil,
-            size,
-            method=Image.LANCZOS,
-            centering=(0, 0.5),
-        )
-        self._side_menu_bg_tk = ImageTk.PhotoImage(pil)
+        self._side_menu_bg_tk = self._cached_photo(SIDE_MENU_BG_IMG, size, mode="fill_left",
+                                                   source=self._side_menu_bg_pil)
         self._side_menu_bg_last_size = size
         try:
             self._side_menu_bg_lbl.config(image=self._side_menu_bg_tk)
@@ -4292,22 +5580,20 @@ class LibraryApp(tk.Tk):
     # ---------- SHARED BOOK SORTING AND VIEWING HELPERS ----------
     def _populate_book_table(self,scroll_frame: tk.Frame,rows: list[dict],
             col_order: tuple[str, str, str],header_labels: tuple[str, str, str],*,query_label: str = "",):
+        canvas = scroll_frame.master
         # Clear any existing contents
-        for child in scroll_frame.winfo_children():
-            child.destroy()
+        self._clear_virtual_rows(canvas, scroll_frame)
 
         header_font = SHARED_TABLE_HEADER_FONT
         row_font = SHARED_TABLE_ROW_FONT
 
-        # Column stretch
-        scroll_frame.grid_columnconfigure(0, weight=3, minsize=150)
-        scroll_frame.grid_columnconfigure(1, weight=3, minsize=280)
-        scroll_frame.grid_columnconfigure(2, weight=1, minsize=80)
+        # Column stretch (3 : 3 : 1), placed so every recycled row lines up with the header
+        col_spans = ((0.0, 3 / 7), (3 / 7, 3 / 7), (6 / 7, 1 / 7))
 
-        # Headers
+        header = tk.Frame(scroll_frame, bg=SHARED_TABLE_BG_COLOR, highlightthickness=0, bd=0)
         for col, label in enumerate(header_labels):
             tk.Label(
-                scroll_frame,
+                header,
                 text=label,
                 font=header_font,
                 anchor="w",
@@ -4315,7 +5601,9 @@ class LibraryApp(tk.Tk):
                 fg=FOCUS_PANEL_TEXT_COLOR,
                 padx=10,
                 pady=5,
-            ).grid(row=0, column=col, sticky="we")
+            ).place(relx=col_spans[col][0], relwidth=col_spans[col][1], y=0, relheight=1.0)
+        header_h = tkfont.Font(font=header_font).metrics("linespace") + 12
+        header.place(x=0, y=0, relwidth=1.0, height=header_h)
 
         if not rows:
             tk.Label(
@@ -4327,39 +5615,38 @@ class LibraryApp(tk.Tk):
                 fg=FOCUS_PANEL_TEXT_COLOR,
                 padx=10,
                 pady=20,
-            ).grid(row=1, column=0, columnspan=3, sticky="we")
+            ).place(x=0, y=header_h, relwidth=1.0)
+            self._mount_virtual_rows(canvas, scroll_frame, [], make_row=lambda _k: None,
+                                     fill_row=lambda *_a: None, top=header_h, bottom_pad=80)
             return
 
         # capture once so clicks always return to the same list
         rows_for_back = list(rows)
+        row_h = tkfont.Font(font=row_font).metrics("linespace") + 18
 
-        for idx, row in enumerate(rows_for_back, start=1):
-            author, title, year = self._get_display_fields(row)
-            field_map = {"title": title, "author": author, "year": year}
-            bg_color = SHARED_TABLE_ALTROW_BG_COLOR if idx % 2 == 0 else SHARED_TABLE_BG_COLOR
-
+        def _make_row(_kind: str) -> tk.Frame:
             # (Optional) full-row frame makes the whole stripe feel clickable
-            row_frame = tk.Frame(scroll_frame, bg=bg_color, highlightthickness=0, bd=0)
-            row_frame.grid(row=idx, column=0, columnspan=3, sticky="we")
-            row_frame.grid_columnconfigure(0, weight=3, minsize=150)
-            row_frame.grid_columnconfigure(1, weight=3, minsize=280)
-            row_frame.grid_columnconfigure(2, weight=1, minsize=80)
-
-            labels: list[tk.Label] = []
-            for col, field_key in enumerate(col_order):
+            row_frame = tk.Frame(scroll_frame, highlightthickness=0, bd=0, cursor="hand2")
+            row_frame._cells = []
+            for relx, relw in col_spans:
                 lbl = tk.Label(
                     row_frame,
-                    text=field_map[field_key],
                     font=row_font,
                     anchor="w",
                     bg=SHARED_TABLE_BG_COLOR,
                     fg=FOCUS_PANEL_TEXT_COLOR,
                     padx=15,
-                    pady=8,
                     cursor="hand2",
                 )
-                lbl.grid(row=0, column=col, sticky="we")
-                labels.append(lbl)
+                lbl.place(relx=relx, relwidth=relw, y=0, relheight=1.0)
+                row_frame._cells.append(lbl)
+            return row_frame
+
+        def _fill_row(row_frame: tk.Frame, row: dict, idx: int):
+            author, title, year = self._get_display_fields(row)
+            field_map = {"title": title, "author": author, "year": year}
+            bg_color = SHARED_TABLE_ALTROW_BG_COLOR if idx % 2 == 1 else SHARED_TABLE_BG_COLOR
+            row_frame.configure(bg=bg_color)
 
             # Click opens via helper (preserves “back to results”)
             def _open(_e, b=row, rows=rows_for_back, q=query_label):
@@ -4367,8 +5654,12 @@ class LibraryApp(tk.Tk):
 
             # bind row + cells so clicking anywhere works
             row_frame.bind("<Button-1>", _open)
-            for lbl in labels:
+            for lbl, field_key in zip(row_frame._cells, col_order):
+                lbl.configure(text=field_map[field_key])
                 lbl.bind("<Button-1>", _open)
+
+        specs = [("row", row_h, row) for row in rows_for_back]
+        self._mount_virtual_rows(canvas, scroll_frame, specs, make_row=_make_row, fill_row=_fill_row, top=header_h)
     def _year_key_from_row(self, r: dict) -> int:
         publish_date = (r.get("publish_date") or r.get("date_published") or "").strip()
         if publish_date:
@@ -4386,21 +5677,19 @@ class LibraryApp(tk.Tk):
         """
         field = (field or "").strip().lower()
 
-        if field == "author":
-            base_func = lambda r: self._author_display_and_sort_key(r)[1]
-        elif field == "year":
-            # Year sorts by numeric value
-            base_func = lambda r: self._year_key_from_row(r) if self._year_key_from_row(r) else 0
-        elif field == "genre":
-            base_func = lambda r: (r.get("genre") or "").strip().lower()
-        elif field == "updated" or field == "last updated":
+        # Title/Author/Year/Genre use the per-book collation keys cached in LibraryData
+        cached = self.data.sort_key_func(field)
+        if cached is not None:
+            return cached
+
+        if field == "updated" or field == "last updated":
             # For collections
             base_func = lambda r: (r.get("_collection_updated_ts") or r.get("updated_at") or 0)
         elif field == "read":
             base_func = lambda r: 0 if r.get("read") else 1  # Read items first
         else:
             # Default to title
-            base_func = lambda r: (r.get("title") or "").strip().lower()
+            base_func = self.data.sort_key_func("title")
 
         return base_func
     def _get_filter_first_char(self, book: dict, field: str) -> str:
@@ -4695,9 +5984,10 @@ class LibraryApp(tk.Tk):
     def _render_books_grid_or_list(self,*,canvas: tk.Canvas,scroll_frame: tk.Frame,books: list[dict],
         sort_var: tk.StringVar,view_var: tk.StringVar,view_btns: tk.Widget,context_label: str,panel_bg: str, row_text_fg: str = GENREPAGE_ROW_FG_COLOR,
         cols: int = 5,is_collection: bool = False,collection_name: str | None = None,secondary_sort_var: tk.StringVar | None = None,
-        secondary_sort_reverse_var: tk.BooleanVar | None = None,):
+        secondary_sort_reverse_var: tk.BooleanVar | None = None, whole_catalog: bool = False,):
         """
         One shared renderer used by Genre / View All / Search Results.
+        - whole_catalog: books is the full catalog (View All) -> use LibraryData's maintained orderings
         - Sort: Primary from dropdown + Secondary from clicking column headers
         - View: grid/list (grid shows covers)
         - Click: opens book detail and preserves back list + label
@@ -4710,55 +6000,72 @@ class LibraryApp(tk.Tk):
         if secondary_sort_reverse_var is None:
             secondary_sort_reverse_var = tk.BooleanVar(value=False)
 
-        def _add_book_tile(holder: tk.Frame, book: dict, row_bg: str, rows_for_back: list[dict]):
-            cell = tk.Frame(holder, bg=row_bg, highlightthickness=0, bd=0, cursor="hand2")
-            # caller grids this cell
-
-            title = self._unescape_entities(book.get("title") or "Untitled").strip()
-            book_id = str((book.get("book_id") or book.get("id") or "")).strip()
-            cover_path = self.data.get_cover_path(book_id) if book_id else None
-
-            def _open(_e=None, b=book, rows=rows_for_back):
-                self._open_book_from_list(b, rows, context_label)
-
-            if cover_path and hasattr(cover_path, "exists") and cover_path.exists():
-                pil = Image.open(cover_path).convert("RGB")
-                pil.thumbnail((cover_w, cover_h), Image.LANCZOS)
-                photo = ImageTk.PhotoImage(pil)
-                self._page_img_refs.append(photo)
-
-                cover_lbl = tk.Label(cell, image=photo, bg=row_bg, bd=0, highlightthickness=0, cursor="hand2")
-                cover_lbl.pack()
-                cover_lbl.bind("<Button-1>", _open)
-            else:
-                ph = tk.Canvas(cell, width=cover_w, height=cover_h, bg=SHARED_BLANKCOVER_BG_COLOR,
-                               highlightthickness=0, cursor="hand2")
-                ph.create_text(
-                    cover_w // 2, cover_h // 2,
-                    text="No Cover",
-                    fill=SHARED_BLANKCOVER_TEXT_COLOR,
-                    font=(SHARED_FONT_CUSTOM, 16),
-                )
-                ph.pack()
-                ph.bind("<Button-1>", _open)
+        def _make_book_tile(holder: tk.Frame) -> tk.Frame:
+            cell = tk.Frame(holder, highlightthickness=0, bd=0, cursor="hand2")
+            # caller grids this cell; _fill_book_tile points it at a book
 
+            cover = tk.Canvas(cell, width=cover_w, height=cover_h, highlightthickness=0, bd=0, cursor="hand2")
+            cover.pack()
             title_lbl = tk.Label(
                 cell,
-                text=title,
-                bg=row_bg,
                 fg=SHARED_SCROLLROW_TEXT_COLOR,
-                font=(SHARED_FONT_TABLE, 16),
+                font=title_font,
                 wraplength=title_wrap,
                 justify="center",
+                height=2,
                 cursor="hand2",
             )
-            self._book_detail_title_lbl = title_lbl
-
             title_lbl.pack(pady=(8, 0))
-            title_lbl.bind("<Button-1>", _open)
-            cell.bind("<Button-1>", _open)
 
+            cell._cover = cover
+            cell._title_lbl = title_lbl
+            cover._cover_ticket = None
+            cover._photo = None
             return cell
+        def _release_book_tile(cell: tk.Frame):
+            # drop the previous book's image / pending decode with the recycled tile
+            cover = cell._cover
+            self._cancel_cover_request(cover._cover_ticket)
+            cover._cover_ticket = None
+            cover._photo = None
+            cover.delete("all")
+        def _fill_book_tile(cell: tk.Frame, book: dict, row_bg: str, rows_for_back: list[dict]):
+            title = self._unescape_entities(book.get("title") or "Untitled").strip()
+            book_id = str((book.get("book_id") or book.get("id") or "")).strip()
+
+            def _open(_e=None, b=book, rows=rows_for_back):
+                self._open_book_from_list(b, rows, context_label)
+
+            cover = cell._cover
+            _release_book_tile(cell)
+
+            # placeholder first; the real cover is swapped in when the pool has decoded it
+            cover.configure(bg=SHARED_BLANKCOVER_BG_COLOR)
+            cover.create_text(
+                cover_w // 2, cover_h // 2,
+                text="No Cover",
+                fill=SHARED_BLANKCOVER_TEXT_COLOR,
+                font=(SHARED_FONT_CUSTOM, 16),
+            )
+
+            def _show_cover(photo, c=cover, bg=row_bg):
+                if not c.winfo_exists():
+                    return
+                c._cover_ticket = None
+                c._photo = photo
+                c.delete("all")
+                c.configure(bg=bg)
+                c.create_image(cover_w // 2, cover_h, image=photo, anchor="s")
+
+            if book_id:
+                cover._cover_ticket = self._request_cover_photo(book_id, (cover_w, cover_h), _show_cover)
+
+            # tiles have a fixed two-line title so every grid row has the same height
+            cell._title_lbl.configure(text=self._ellipsize_px(title, title_font, title_wrap * 2 - 24), bg=row_bg)
+            cell.configure(bg=row_bg)
+
+            for w in (cell, cover, cell._title_lbl):
+                w.bind("<Button-1>", _open)
         def _norm_genre(g: str) -> str:
             g = (g or "").strip()
             return g if g else "Unknown"
@@ -4772,36 +6079,56 @@ class LibraryApp(tk.Tk):
                 return float(self.data.get_collection_last_updated(collection_name, bid) or 0.0)
             except Exception:
                 return 0.0
+        # Sorted orders are reused across view toggles / resize re-renders (books don't change here).
+        # "Read"/"Last Updated" are excluded because mark-read mode changes them in place.
+        _sorted_cache: dict[tuple[str, str, bool], list[dict]] = {}
+        title_key = self.data.sort_key_func("title")
+
         def _sorted_rows(mode: str, secondary: str = "", reverse: bool = False) -> list[dict]:
             """Sort books by primary mode, then by secondary field if set.
             If reverse is True, reverses the sort order (Z-A instead of A-Z).
             """
             mode = (mode or "").strip()
             secondary = (secondary or "").strip()
+            cache_key = (mode, secondary, bool(reverse))
+            if cache_key in _sorted_cache:
+                return _sorted_cache[cache_key]
 
             # Special handling for collection-specific sorts
             if is_collection and mode == "Genre":
                 base_sorted = sorted(books,
-                              key=lambda b: (_norm_genre(b.get("genre")).lower(), (b.get("title") or "").lower()))
+                              key=lambda b: (_norm_genre(b.get("genre")).lower(), title_key(b)))
                 if secondary and secondary.lower() != "genre":
                     # Apply secondary sort within each genre group
                     sec_key = self._get_sort_key_func(secondary)
                     result = sorted(base_sorted, key=lambda b: (_norm_genre(b.get("genre")).lower(), sec_key(b)))
                 else:
                     result = base_sorted
-                return list(reversed(result)) if reverse else result
-            if is_collection and mode == "Last Updated":
-                base_sorted = sorted(books, key=lambda b: (_collection_updated_ts(b), (b.get("title") or "").lower()),
+                result = list(reversed(result)) if reverse else result
+            elif is_collection and mode == "Last Updated":
+                base_sorted = sorted(books, key=lambda b: (_collection_updated_ts(b), title_key(b)),
                               reverse=True)
-                return list(reversed(base_sorted)) if reverse else base_sorted
+                result = list(reversed(base_sorted)) if reverse else base_sorted
+            elif (whole_catalog and secondary.lower() in ("", "title")
+                  and mode.lower() in self.data.PAGE_SORTS and len(books) == len(self.data.catalog)):
+                # Full catalog: read the pre-sorted ordering instead of sorting every row
+                result = self.data.page(mode, 0, len(books), reverse=reverse)
+            else:
+                # Use multi-level sort for standard modes
+                result = self._sort_books_multi(books, mode, secondary if secondary else "Title", reverse=reverse)
 
-            # Use multi-level sort for standard modes
-            return self._sort_books_multi(books, mode, secondary if secondary else "Title", reverse=reverse)
+            if not {"read", "last updated"} & {mode.lower(), secondary.lower()}:
+                _sorted_cache[cache_key] = result
+            return result
 
         # --- layout constants (same feel as your genre page) ---
         cover_w, cover_h = 130, 190
-        pad_x, pad_y = 24, 0
+        pad_x = 24
         title_wrap = cover_w + 40
+        title_font = (SHARED_FONT_TABLE, 16)
+        stripe_pad = 12
+        tile_row_h = (stripe_pad * 2 + cover_h + 8
+                      + 2 * tkfont.Font(font=title_font).metrics("linespace") + 4)
 
         def _force_canvas_window_width():
             wid = getattr(canvas, "_inner_window_id", None)
@@ -4816,18 +6143,57 @@ class LibraryApp(tk.Tk):
             except Exception:
                 pass
         def clear_scroll_contents():
-            for child in scroll_frame.winfo_children():
-                child.destroy()
+            self._cancel_all_cover_requests()
+            self._clear_virtual_rows(canvas, scroll_frame)
+        def _make_tile_stripe(kind: str) -> tk.Frame:
+            stripe = tk.Frame(scroll_frame, highlightthickness=0, bd=0)
+            if kind == "genre":
+                lbl = tk.Label(
+                    stripe,
+                    bg=OPENCOLL_HEADER_BG_COLOR,
+                    fg=OPENCOLL_HEADER_FG_COLOR,
+                    font=(SHARED_FONT_TABLE, 16, "bold"),
+                    anchor="w",
+                    padx=18,
+                    pady=6,  # ✅ shorter than book rows
+                )
+                lbl.place(x=0, y=0, relwidth=1.0, relheight=1.0)
+                stripe._label = lbl
+                return stripe
+
+            holder = tk.Frame(stripe, highlightthickness=0, bd=0)
+            holder.place(relx=0.5, y=stripe_pad, anchor="n")
+            stripe._holder = holder
+            stripe._tiles = []
+            for c in range(cols):
+                cell = _make_book_tile(holder)
+                cell.grid(row=0, column=c, padx=(pad_x // 2, pad_x // 2), sticky="n")
+                stripe._tiles.append(cell)
+            return stripe
+        def _fill_tile_stripe(stripe: tk.Frame, payload, _idx: int):
+            if hasattr(stripe, "_label"):
+                stripe._label.configure(text=payload.upper())
+                return
+
+            row_books, row_bg, rows_sorted = payload
+            stripe.configure(bg=row_bg)
+            stripe._holder.configure(bg=row_bg)
+            for c, cell in enumerate(stripe._tiles):
+                if c < len(row_books):
+                    _fill_book_tile(cell, row_books[c], row_bg, rows_sorted)
+                    cell.grid()
+                else:
+                    _release_book_tile(cell)
+                    cell.grid_remove()
+        def _release_tile_stripe(stripe: tk.Frame):
+            for cell in getattr(stripe, "_tiles", ()):
+                _release_book_tile(cell)
         def render_grid_view(mode: str):
             _force_canvas_window_width()
             clear_scroll_contents()
 
             rows_sorted = _sorted_rows(mode)
-
-            try:
-                scroll_frame.grid_columnconfigure(0, weight=1)
-            except Exception:
-                pass
+            specs: list[tuple[str, int, Any]] = []
 
             # --- GROUPED GRID (collection-only, sort=Genre) ---
             if is_collection and mode == "Genre":
@@ -4842,91 +6208,52 @@ class LibraryApp(tk.Tk):
                         current_g = g
                     if g != current_g:
                         groups.append((current_g, bucket))
-                        current_g = g
-                        bucket = []
-                    bucket.append(b)
-                if current_g is not None:
-                    groups.append((current_g, bucket))
-
-                r = 0
-                stripe_i = 0
-
-                for genre, g_books in groups:
-                    # short header row
-                    hdr = tk.Frame(scroll_frame, bg=BROWSEGENRES_PANEL_BG_COLOR, highlightthickness=0, bd=0)
-                    hdr.grid(row=r, column=0, sticky="we", padx=0, pady=(0, 0))
-
-                    hdr.grid_columnconfigure(0, weight=1)
-
-                    tk.Label(
-                        hdr,
-                        text=genre.upper(),
-                        bg=OPENCOLL_HEADER_BG_COLOR,
-                        fg=OPENCOLL_HEADER_FG_COLOR,
-                        font=(SHARED_FONT_TABLE, 16, "bold"),
-                        anchor="w",
-                        padx=18,
-                        pady=6,  # ✅ shorter than book rows
-                    ).grid(row=0, column=0, sticky="we")
-
-                    r += 1
-
-                    # render this genre's books in rows of `cols`
-                    chunks = [g_books[i:i + cols] for i in range(0, len(g_books), cols)]
-                    for row_books in chunks:
-                        row_bg = SHARED_TABLE_ALTROW_BG_COLOR if (stripe_i % 2 == 0) else panel_bg
-                        stripe_i += 1
-
-                        stripe = tk.Frame(scroll_frame, bg=row_bg, highlightthickness=0, bd=0)
-                        stripe.grid(row=r, column=0, sticky="nsew", padx=0, pady=(0, 0))
-                        stripe.grid_columnconfigure(0, weight=1)
-
-                        holder = tk.Frame(stripe, bg=row_bg, highlightthickness=0, bd=0)
-                        holder.pack(padx=24, pady=(12, 12), anchor="center")
-
-                        for c, book in enumerate(row_books):
-                            cell = _add_book_tile(holder, book, row_bg, rows_sorted)
-                            cell.grid(row=0, column=c, padx=(pad_x // 2, pad_x // 2), sticky="n")
-
-                        r += 1
-
-                canvas.update_idletasks()
-                canvas.configure(scrollregion=canvas.bbox("all"))
-                return
-
-            # --- NORMAL GRID (your existing behavior) ---
-            row_chunks = [rows_sorted[i:i + cols] for i in range(0, len(rows_sorted), cols)]
-
-            for r, row_books in enumerate(row_chunks):
-                row_bg = SHARED_TABLE_ALTROW_BG_COLOR if (r % 2 == 0) else panel_bg
-
-                stripe = tk.Frame(scroll_frame, bg=row_bg, highlightthickness=0, bd=0)
-                stripe.grid(row=r, column=0, sticky="nsew", padx=0, pady=(0 if r == 0 else pad_y, 0))
-                stripe.grid_columnconfigure(0, weight=1)
-
-                holder = tk.Frame(stripe, bg=row_bg, highlightthickness=0, bd=0)
-                holder.pack(padx=24, pady=(12, 12), anchor="center")
+                        current_g = g
+                        bucket = []
+                    bucket.append(b)
+                if current_g is not None:
+                    groups.append((current_g, bucket))
 
-                for c, book in enumerate(row_books):
-                    cell = _add_book_tile(holder, book, row_bg, rows_sorted)
-                    cell.grid(row=0, column=c, padx=(pad_x // 2, pad_x // 2), sticky="n")
-        def render_list_view(mode: str):
-            _force_canvas_window_width()
-            clear_scroll_contents()
+                genre_hdr_h = tkfont.Font(font=(SHARED_FONT_TABLE, 16, "bold")).metrics("linespace") + 14
+                stripe_i = 0
 
-            # Get secondary sort from the variable
-            secondary = secondary_sort_var.get() if secondary_sort_var else ""
-            reverse = secondary_sort_reverse_var.get() if secondary_sort_reverse_var else False
-            rows_sorted = _sorted_rows(mode, secondary, reverse)
+                for genre, g_books in groups:
+                    # short header row
+                    specs.append(("genre", genre_hdr_h, genre))
 
+                    # render this genre's books in rows of `cols`
+                    for i in range(0, len(g_books), cols):
+                        row_bg = SHARED_TABLE_ALTROW_BG_COLOR if (stripe_i % 2 == 0) else panel_bg
+                        stripe_i += 1
+                        specs.append(("tiles", tile_row_h, (g_books[i:i + cols], row_bg, rows_sorted)))
+            else:
+                # --- NORMAL GRID (your existing behavior) ---
+                for r, i in enumerate(range(0, len(rows_sorted), cols)):
+                    row_bg = SHARED_TABLE_ALTROW_BG_COLOR if (r % 2 == 0) else panel_bg
+                    specs.append(("tiles", tile_row_h, (rows_sorted[i:i + cols], row_bg, rows_sorted)))
+
+            self._mount_virtual_rows(canvas, scroll_frame, specs, make_row=_make_tile_stripe,
+                                     fill_row=_fill_tile_stripe, release_row=_release_tile_stripe)
+        def _on_header_sort(field: str):
+            # Toggle reverse if clicking same column, otherwise set new column
+            current = secondary_sort_var.get() if secondary_sort_var else ""
+            if current.lower() == field.lower():
+                # Toggle reverse direction
+                current_reverse = secondary_sort_reverse_var.get() if secondary_sort_reverse_var else False
+                secondary_sort_reverse_var.set(not current_reverse)
+            else:
+                # New column - start with A-Z (not reversed)
+                secondary_sort_var.set(field)
+                secondary_sort_reverse_var.set(False)
+            render_content()
+        def _list_widths() -> tuple[int, ...]:
+            """Pixel column widths for the list view at the current canvas width."""
             total_w = max(canvas.winfo_width(), 1)
-            total_w = max(total_w - 24, 1)
 
-            header_font = (SHARED_FONT_TABLE, 18)
-            row_font = (SHARED_FONT_TABLE, 18)
+            # leave a little breathing room so text doesn't kiss the scrollbar
+            total_w = max(total_w - 24, 1)
 
             if is_collection:
-                editable = bool(getattr(self, "_mark_read_mode", False))
                 cb_w = 70  # always present
 
                 usable_w = max(total_w - cb_w, 1)
@@ -4935,238 +6262,110 @@ class LibraryApp(tk.Tk):
                 author_w = max(int(usable_w * 0.24), 180)
                 genre_w = max(int(usable_w * 0.16), 140)
                 updated_w = max(usable_w - title_w - author_w - genre_w, 140)
-
-                header = tk.Frame(scroll_frame, bg=SHARED_SUBHEADER_BG_COLOR, highlightthickness=0, bd=0)
-                header.grid(row=0, column=0, sticky="we")
-
-                col_widths = (cb_w, title_w, author_w, genre_w, updated_w)
-                for i, w in enumerate(col_widths):
-                    header.grid_columnconfigure(i, minsize=w)
-
-                # Define header columns with their sort field names
-                header_cols = [
-                    ("Read", 0, "Read"),
-                    ("Title", 1, "Title"),
-                    ("Author", 2, "Author"),
-                    ("Genre", 3, "Genre"),
-                    ("Updated", 4, "Updated"),
-                ]
-
-                for text, col_idx, sort_field in header_cols:
-                    # Show indicator if this is the secondary sort
-                    display_text = text
-                    if secondary and secondary.lower() == sort_field.lower():
-                        # Show arrow direction based on reverse state
-                        arrow = "▲" if reverse else "▼"
-                        display_text = f"{arrow} {text}"
-
-                    hdr_lbl = tk.Label(header, text=display_text, bg=SHARED_SUBHEADER_BG_COLOR, fg=SHARED_SUBHEADER_TEXT_COLOR,
-                                       font=header_font, anchor="w", padx=12, pady=10, cursor="hand2")
-                    hdr_lbl.grid(row=0, column=col_idx, sticky="we")
-
-                    def _on_header_click(e=None, field=sort_field):
-                        # Toggle reverse if clicking same column, otherwise set new column
-                        current = secondary_sort_var.get() if secondary_sort_var else ""
-                        if current.lower() == field.lower():
-                            # Toggle reverse direction
-                            current_reverse = secondary_sort_reverse_var.get() if secondary_sort_reverse_var else False
-                            secondary_sort_reverse_var.set(not current_reverse)
-                        else:
-                            # New column - start with A-Z (not reversed)
-                            secondary_sort_var.set(field)
-                            secondary_sort_reverse_var.set(False)
-                        render_content()
-
-                    hdr_lbl.bind("<Button-1>", _on_header_click)
-
-                for idx, book in enumerate(rows_sorted, start=1):
-                    row_bg = SHARED_TABLE_ALTROW_BG_COLOR if idx % 2 == 0 else SHARED_TABLE_BG_COLOR
-                    row = tk.Frame(scroll_frame, bg=row_bg, highlightthickness=0, bd=0)
-                    row.grid(row=idx, column=0, sticky="we")
-                    row.grid_columnconfigure(0, minsize=cb_w)
-                    row.grid_columnconfigure(1, minsize=title_w)
-                    row.grid_columnconfigure(2, minsize=author_w)
-                    row.grid_columnconfigure(3, minsize=genre_w)
-                    row.grid_columnconfigure(4, minsize=updated_w)
-
-                    # ✅ ALWAYS configure 5 columns in collection list view
-                    for i, w in enumerate((cb_w, title_w, author_w, genre_w, updated_w)):
-                        row.grid_columnconfigure(i, minsize=w)
-
-                    author, title, _year = self._get_display_fields(book)
-                    genre_txt = _norm_genre(book.get("genre")).title()
-                    updated_txt = self._ts_to_short_date(_collection_updated_ts(book))
-
-                    title_txt = self._ellipsize_px(title, row_font, title_w - 24)
-                    author_txt = self._ellipsize_px(author, row_font, author_w - 24)
-                    genre_txt = self._ellipsize_px(genre_txt, row_font, genre_w - 24)
-                    updated_txt = self._ellipsize_px(updated_txt, row_font, updated_w - 24)
-
-                    col_name = (collection_name or self._current_open_collection_name() or "").strip()
-
-                    # ✅ load persisted marks once per collection
-                    if col_name and col_name not in self._collection_read_marks:
-                        try:
-                            self._collection_read_marks[col_name] = set(self.data.get_collection_read_marks(col_name))
-                        except Exception:
-                            self._collection_read_marks[col_name] = set()
-
-                    key = self._book_key(book)
-                    var = tk.IntVar(
-                        value=1 if (col_name and key in self._collection_read_marks.get(col_name, set())) else 0)
-
-                    def _save_mark(k=key, v=var, cn=col_name):
-                        # editable toggle only controls whether user can change it
-                        if not bool(getattr(self, "_mark_read_mode", False)):
-                            return
-                        if not cn:
-                            return
-
-                        is_read = bool(v.get())
-                        if is_read:
-                            self._collection_read_marks.setdefault(cn, set()).add(k)
-                        else:
-                            self._collection_read_marks.setdefault(cn, set()).discard(k)
-
-                        # ✅ persist
-                        try:
-                            self.data.set_collection_read(cn, k, is_read)
-                        except Exception:
-                            pass
-
-                    cb = tk.Checkbutton(
-                        row,
-                        variable=var,
-                        command=_save_mark,
-                        state=("normal" if bool(getattr(self, "_mark_read_mode", False)) else "disabled"),
-                        bg=row_bg,
-                        activebackground=row_bg,
-                        highlightthickness=0,
-                        bd=0,
-                        takefocus=False,
-                    )
-                    cb.grid(row=0, column=0, sticky="w", padx=12)
-                    self.active_widgets.append(cb)
-
-                    cells = [
-                        tk.Label(row, text=title_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                                 anchor="w", padx=12, pady=8, cursor="hand2"),
-                        tk.Label(row, text=author_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                                 anchor="w", padx=12, pady=8, cursor="hand2"),
-                        tk.Label(row, text=genre_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                                 anchor="w", padx=12, pady=8, cursor="hand2"),
-                        tk.Label(row, text=updated_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                                 anchor="w", padx=12, pady=8, cursor="hand2"),
-                    ]
-
-                    for c, lbl in enumerate(cells):
-                        lbl.grid(row=0, column=1 + c, sticky="we")  # ✅ offset by 1 because col0 is Read
-                        lbl.bind("<Button-1>",
-                                 lambda e, b=book, rows=rows_sorted: self._open_book_from_list(b, rows, context_label))
-                        self.active_widgets.append(lbl)
-
-                canvas.update_idletasks()
-                canvas.configure(scrollregion=canvas.bbox("all"))
-                return
-
-            # --- compute column widths (pixels) from the visible canvas width ---
-            total_w = max(canvas.winfo_width(), 1)
-
-            # leave a little breathing room so text doesn't kiss the scrollbar
-            total_w = max(total_w - 24, 1)
+                return (cb_w, title_w, author_w, genre_w, updated_w)
 
             # Title | Author | Year
             title_w = max(int(total_w * 0.62), 320)
             author_w = max(int(total_w * 0.28), 200)
             year_w = max(total_w - title_w - author_w, 90)
+            return (title_w, author_w, year_w)
+        def render_list_view(mode: str):
+            _force_canvas_window_width()
+            clear_scroll_contents()
+
+            # Get secondary sort from the variable
+            secondary = secondary_sort_var.get() if secondary_sort_var else ""
+            reverse = secondary_sort_reverse_var.get() if secondary_sort_reverse_var else False
+            rows_sorted = _sorted_rows(mode, secondary, reverse)
 
             header_font = (SHARED_FONT_TABLE, 18)
             row_font = (SHARED_FONT_TABLE, 18)
 
-            # --- header row (fixed widths so it aligns with data) ---
-            header = tk.Frame(scroll_frame, bg=SHARED_SUBHEADER_BG_COLOR, highlightthickness=0, bd=0)
-            header.grid(row=0, column=0, sticky="we")
+            def _open_row(book: dict):
+                self._open_book_from_list(book, rows_sorted, context_label)
 
-            for i, w in enumerate((title_w, author_w, year_w)):
-                header.grid_columnconfigure(i, minsize=w)
+            if is_collection:
+                cb_w, title_w, author_w, genre_w, updated_w = _list_widths()
+
+                # (header text, width, sort field)
+                columns = [
+                    ("Read", cb_w, "Read"),
+                    ("Title", title_w, "Title"),
+                    ("Author", author_w, "Author"),
+                    ("Genre", genre_w, "Genre"),
+                    ("Updated", updated_w, "Updated"),
+                ]
 
-            # Define header columns with their sort field names
-            header_cols = [
-                ("Title", 0, "Title"),
-                ("Author", 1, "Author"),
-                ("Year", 2, "Year"),
-            ]
+                col_name = (collection_name or self._current_open_collection_name() or "").strip()
 
-            secondary = secondary_sort_var.get() if secondary_sort_var else ""
-            reverse = secondary_sort_reverse_var.get() if secondary_sort_reverse_var else False
+                # ✅ load persisted marks once per collection
+                if col_name and col_name not in self._collection_read_marks:
+                    try:
+                        self._collection_read_marks[col_name] = set(self.data.get_collection_read_marks(col_name))
+                    except Exception:
+                        self._collection_read_marks[col_name] = set()
 
-            for text, col_idx, sort_field in header_cols:
-                # Show indicator if this is the secondary sort
-                display_text = text
-                if secondary and secondary.lower() == sort_field.lower():
-                    # Show arrow direction based on reverse state
-                    arrow = "▲" if reverse else "▼"
-                    display_text = f"{arrow} {text}"
+                def _cells(book: dict) -> tuple[str, ...]:
+                    author, title, _year = self._get_display_fields(book)
+                    marked = bool(col_name) and self._book_key(book) in self._collection_read_marks.get(col_name, set())
+                    return (
+                        "☑" if marked else "☐",
+                        title,
+                        author,
+                        _norm_genre(book.get("genre")).title(),
+                        self._ts_to_short_date(_collection_updated_ts(book)),
+                    )
 
-                hdr_lbl = tk.Label(header, text=display_text, bg=SHARED_SUBHEADER_BG_COLOR, fg=SHARED_SUBHEADER_TEXT_COLOR,
-                                   font=header_font, anchor="w", padx=12, pady=10, cursor="hand2")
-                hdr_lbl.grid(row=0, column=col_idx, sticky="we")
+                def _on_cell_click(i: int, col: int) -> bool:
+                    if col != 0:
+                        return False
+                    # editable toggle only controls whether user can change it
+                    if not bool(getattr(self, "_mark_read_mode", False)) or not col_name:
+                        return True
 
-                def _on_header_click(e=None, field=sort_field):
-                    # Toggle reverse if clicking same column, otherwise set new column
-                    current = secondary_sort_var.get() if secondary_sort_var else ""
-                    if current.lower() == field.lower():
-                        # Toggle reverse direction
-                        current_reverse = secondary_sort_reverse_var.get() if secondary_sort_reverse_var else False
-                        secondary_sort_reverse_var.set(not current_reverse)
+                    k = self._book_key(rows_sorted[i])
+                    marks = self._collection_read_marks.setdefault(col_name, set())
+                    is_read = k not in marks
+                    if is_read:
+                        marks.add(k)
                     else:
-                        # New column - start with A-Z (not reversed)
-                        secondary_sort_var.set(field)
-                        secondary_sort_reverse_var.set(False)
-                    render_content()
-
-                hdr_lbl.bind("<Button-1>", _on_header_click)
-
-            # --- data rows ---
-            for idx, book in enumerate(rows_sorted, start=1):
-                row_bg = SHARED_TABLE_ALTROW_BG_COLOR if idx % 2 == 0 else panel_bg
+                        marks.discard(k)
 
-                row = tk.Frame(scroll_frame, bg=row_bg, highlightthickness=0, bd=0)
-                row.grid(row=idx, column=0, sticky="we")
+                    # ✅ persist
+                    try:
+                        self.data.set_collection_read(col_name, k, is_read)
+                    except Exception:
+                        pass
+                    canvas._vlist_redraw_row(i)
+                    return True
+
+                self._mount_canvas_list(
+                    canvas, scroll_frame, columns=columns, rows=rows_sorted, cell_texts=_cells, on_open=_open_row,
+                    row_bg=lambda i: SHARED_TABLE_ALTROW_BG_COLOR if i % 2 == 1 else SHARED_TABLE_BG_COLOR,
+                    header_font=header_font, row_font=row_font, sort_field=secondary, sort_reverse=reverse,
+                    on_header_click=_on_header_sort, on_cell_click=_on_cell_click,
+                )
+                return
 
+            # --- column widths (pixels) from the visible canvas width ---
+            title_w, author_w, year_w = _list_widths()
 
-                for i, w in enumerate((title_w, author_w, year_w)):
-                    row.grid_columnconfigure(i, minsize=w)
+            columns = [
+                ("Title", title_w, "Title"),
+                ("Author", author_w, "Author"),
+                ("Year", year_w, "Year"),
+            ]
 
+            def _cells(book: dict) -> tuple[str, ...]:
                 author, title, year = self._get_display_fields(book)
+                return (title, author, year)
 
-                # Ellipsize to fit pixel widths (minus padding)
-                title_txt = self._ellipsize_px(title, row_font, title_w - 24)
-                author_txt = self._ellipsize_px(author, row_font, author_w - 24)
-                year_txt = self._ellipsize_px(year, row_font, year_w - 24)
-
-                cells = [
-                    tk.Label(row, text=title_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
-                    tk.Label(row, text=author_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
-                    tk.Label(row, text=year_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
-                ]
-
-                cells[0].grid(row=0, column=0, sticky="we")
-                cells[1].grid(row=0, column=1, sticky="we")
-                cells[2].grid(row=0, column=2, sticky="we")
-
-                for lbl in cells:
-                    lbl.bind(
-                        "<Button-1>",
-                        lambda e, b=book, rows=rows_sorted: self._open_book_from_list(b, rows, context_label),
-                    )
-                    self.active_widgets.append(lbl)
-
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            self._mount_canvas_list(
+                canvas, scroll_frame, columns=columns, rows=rows_sorted, cell_texts=_cells, on_open=_open_row,
+                row_bg=lambda i: SHARED_TABLE_ALTROW_BG_COLOR if i % 2 == 1 else panel_bg,
+                header_font=header_font, row_font=row_font, sort_field=secondary, sort_reverse=reverse,
+                on_header_click=_on_header_sort,
+            )
         def render_content():
             mode = sort_var.get()
             view = view_var.get()
@@ -5180,6 +6379,8 @@ class LibraryApp(tk.Tk):
 
         def _on_list_resize(event):
             if view_var.get() != "list":
+                # grid stripes span the inner frame and center their tiles; just keep it canvas-wide
+                _force_canvas_window_width()
                 return
 
             w = int(getattr(event, "width", 0) or canvas.winfo_width())
@@ -5194,7 +6395,17 @@ class LibraryApp(tk.Tk):
                     self.after_cancel(after_id)
                 except Exception:
                     pass
-            self._list_resize_after = self.after(90, render_content)
+            self._list_resize_after = self.after(90, relayout_list)
+
+        def relayout_list():
+            # width change only: keep the sorted rows, just re-measure columns and redraw in place
+            self._list_resize_after = None
+            _force_canvas_window_width()
+            relayout = getattr(canvas, "_vlist_relayout", None)
+            if relayout is not None:
+                relayout(list(_list_widths()))
+            else:
+                render_content()
 
         canvas.bind("<Configure>", _on_list_resize)
 
@@ -5220,7 +6431,7 @@ class LibraryApp(tk.Tk):
         render_content()
     def _make_books_browser_card(self,*,panel_bg: str,header_h: int, context_label: str,books: list[dict],cols: int = 5,
             default_view: str = "grid",default_sort: str = "Title",sort_values: tuple[str, ...] = ("Title", "Author", "Year"),
-                                 is_collection: bool = False,collection_name: str | None = None,):
+                                 is_collection: bool = False,collection_name: str | None = None, whole_catalog: bool = False,):
 
         container, canvas, scroll_frame = self._make_scroll_container(
             bg=SHARED_TABLE_BG_COLOR,
@@ -5268,6 +6479,7 @@ class LibraryApp(tk.Tk):
             collection_name=collection_name,
             secondary_sort_var=secondary_sort_var,
             secondary_sort_reverse_var=secondary_sort_reverse_var,
+            whole_catalog=whole_catalog,
         )
 
         return container, canvas, scroll_frame, sort_var, view_var, secondary_sort_var, secondary_sort_reverse_var
@@ -5277,7 +6489,7 @@ class LibraryApp(tk.Tk):
         if max_px <= 10:
             return "…"
 
-        f = tkfont.Font(font=font)
+        f = font if isinstance(font, tkfont.Font) else tkfont.Font(font=font)
         if f.measure(text) <= max_px:
             return text
 
@@ -5318,6 +6530,10 @@ class LibraryApp(tk.Tk):
         """
         ids = rec.get("book_ids") or rec.get("ids") or []
 
+        # LibraryData migrates saved collections to canonical book_id strings on load
+        if isinstance(ids, list) and all(isinstance(x, str) for x in ids):
+            return [x.strip() for x in ids if x.strip()]
+
         # sometimes data ends up as a single comma-separated string
         if isinstance(ids, str):
             ids = [p.strip() for p in ids.split(",") if p.strip()]
@@ -5359,63 +6575,9 @@ class LibraryApp(tk.Tk):
         return out
     def _collection_books(self, col_rec: dict) -> list[dict]:
         """Return actual book dicts for a collection record's book_ids (preserve order)."""
-
-        def _digits(s: str) -> str:
-            return re.sub(r"\D+", "", s or "")
-
-        def _canon(s: str) -> str:
-            return self._norm(str(s or ""))
-
-        all_books = self._all_books()  # must return real book dicts
-
-        # Build a multi-key index so collections saved under older key styles still resolve.
-        by_key: dict[str, dict] = {}
-
-        for b in all_books:
-            candidates: set[str] = set()
-
-            for fld in ("book_id", "id", "isbn13", "isbn_13", "isbn10", "isbn_10", "isbn", "title"):
-                v = b.get(fld)
-                if v is None:
-                    continue
-                if isinstance(v, (int, float)):
-                    v = str(int(v))
-                v = str(v).strip()
-                if not v:
-                    continue
-
-                candidates.add(v)
-                candidates.add(_canon(v))
-
-                d = _digits(v)
-                if d:
-                    candidates.add(d)
-
-            for k in candidates:
-                if k and k not in by_key:
-                    by_key[k] = b
-
-        # normalize ids coming from the collection record
-        ids = self._collection_book_ids(col_rec)
-
-        out: list[dict] = []
-        seen: set[str] = set()
-
-        for raw in ids:
-            probes = [raw, _canon(raw), _digits(raw)]
-            found = None
-            for p in probes:
-                if p and p in by_key:
-                    found = by_key[p]
-                    break
-
-            if found:
-                stable = self._book_key(found)
-                if stable not in seen:
-                    out.append(found)
-                    seen.add(stable)
-
-        return out
+        # LibraryData keeps a persistent alias index, so collections saved under
+        # older key styles still resolve without rebuilding a per-call lookup.
+        return self.data.resolve_book_refs(self._collection_book_ids(col_rec))
     def _books_by_ids(self, ids: list[str]) -> list[dict]:
         """
         Resolve book dicts for a list of ids that may be:
@@ -5428,79 +6590,7 @@ class LibraryApp(tk.Tk):
         """
         if not ids:
             return []
-
-        def _canon(s: str) -> str:
-            return self._norm(str(s or ""))
-
-        def _digits(s: str) -> str:
-            return re.sub(r"\D+", "", str(s or ""))
-
-        # normalize incoming ids
-        wanted: list[str] = []
-        for raw in ids:
-            if raw is None:
-                continue
-            if isinstance(raw, (int, float)):
-                raw = str(int(raw))
-            raw = str(raw).strip()
-            if raw:
-                wanted.append(raw)
-
-        if not wanted:
-            return []
-
-        # Build a multi-key index across ALL books
-        by_key: dict[str, dict] = {}
-
-        for b in self._all_books():
-            candidates: set[str] = set()
-
-            # include your stable key too
-            try:
-                candidates.add(str(self._book_key(b)).strip())
-            except Exception:
-                pass
-
-            for fld in ("book_id", "id", "isbn13", "isbn_13", "isbn10", "isbn_10", "isbn", "title"):
-                v = b.get(fld)
-                if v is None:
-                    continue
-                if isinstance(v, (int, float)):
-                    v = str(int(v))
-                v = str(v).strip()
-                if not v:
-                    continue
-
-                candidates.add(v)
-                candidates.add(_canon(v))
-
-                d = _digits(v)
-                if d:
-                    candidates.add(d)
-
-            for k in candidates:
-                if k and k not in by_key:
-                    by_key[k] = b
-
-        # Resolve in saved order, dedupe by stable book key
-        out: list[dict] = []
-        seen: set[str] = set()
-
-        for raw in wanted:
-            probes = [raw, _canon(raw), _digits(raw)]
-            found = None
-            for p in probes:
-                if p and p in by_key:
-                    found = by_key[p]
-                    break
-
-            if found:
-                stable = self._book_key(found)
-                if stable not in seen:
-                    out.append(found)
-                    seen.add(stable)
-
-        return out
+        return self.data.resolve_book_refs(ids)
     def _ellipsize(self, s: str, max_chars: int = 44) -> str:
         s = (s or "").strip()
         if len(s) <= max_chars:
@@ -5600,6 +6690,7 @@ class LibraryApp(tk.Tk):
         self._nav_history.clear()
         self._nav_suppress_record = True
         self.show_main_page()
+        self._page_cache_clear()  # nothing is reachable by Back anymore
     def set_page(self, page_name: str, **payload):
         """Single source of truth for navigation state."""
         prev_page = getattr(self, "current_page", None)
@@ -5642,6 +6733,10 @@ class LibraryApp(tk.Tk):
         # reset the suppress flag after each navigation
         self._nav_suppress_record = False
 
+        # widgets on screen still belong to the previous page until clear_page() runs
+        if prev_page is not None and self._page_leaving is None:
+            self._page_leaving = (prev_page, dict(prev_payload))
+
         self.current_page = page_name
         self.page_payload = dict(payload)
     def _open_book_from_list(self, book: dict, rows: list[dict] | None, query_label: str = ""):
@@ -5670,6 +6765,9 @@ class LibraryApp(tk.Tk):
         """Navigate to a page name using your existing page functions."""
         payload = payload or {}
 
+        if page in self.PAGE_CACHEABLE and self._restore_parked_page(page, payload):
+            return
+
         if page == "browse_genres":
             self.show_browse_genres_page(payload.get("tab", "fiction"))
         elif page == "genre_page":
@@ -5968,6 +7066,13 @@ class LibraryApp(tk.Tk):
             for child in scroll_frame.winfo_children():
                 child.destroy()
 
+        def _sync_scrollregion():
+            try:
+                canvas.update_idletasks()
+                canvas.configure(scrollregion=canvas.bbox("all"))
+            except Exception:
+                pass
+
         def _sort_collections_with_reverse(rows: list[dict], mode: str, reverse: bool) -> list[dict]:
             mode = (mode or "").strip()
             if mode == "Name":
@@ -5983,12 +7088,12 @@ class LibraryApp(tk.Tk):
                 sorted_rows = list(reversed(sorted_rows))
             return sorted_rows
 
-        def render_grid_view(mode: str, reverse: bool = False):
-            _force_canvas_window_width()
-            clear_scroll_contents()
+        # Built widgets survive resizes: grid tiles are re-gridded into the new column count
+        # and list cells re-ellipsized in place (see reflow_content).
+        grid_state: dict[str, Any] = {"board": None, "cells": [], "stripes": [], "cols": 0}
+        list_state: dict[str, Any] = {"header": None, "rows": [], "widths": ()}
 
-            rows_sorted = _sort_collections_with_reverse(collections, mode, reverse)
-            canvas.update_idletasks()
+        def _grid_cols() -> int:
             avail_w = max(canvas.winfo_width(), 1)
 
             # account for stripe/holder padding you apply
@@ -5997,84 +7102,134 @@ class LibraryApp(tk.Tk):
             dynamic_cols = max(1, (avail_w - side_padding) // max(cell_w, 1))
 
             # respect the user-provided cols as a maximum
-            use_cols = max(1, min(int(cols), int(dynamic_cols)))
+            return max(1, min(int(cols), int(dynamic_cols)))
+
+        def _row_bg(r: int) -> str:
+            return SHARED_TABLE_ALTROW_BG_COLOR if (r % 2 == 0) else panel_bg
+
+        def _ensure_stripe(r: int, use_cols: int):
+            """Row r's background band: a frame spanning the row, lowered beneath the tiles."""
+            board = grid_state["board"]
+            stripes = grid_state["stripes"]
+            while len(stripes) <= r:
+                stripes.append(tk.Frame(board, bg=_row_bg(len(stripes)), highlightthickness=0, bd=0))
+            stripe = stripes[r]
+            stripe.grid(row=r, column=0, columnspan=use_cols + 2, sticky="nsew", pady=(0 if r == 0 else pad_y, 0))
+            stripe.lower()
+
+        def _place_cell(i: int, cell: tk.Frame, use_cols: int):
+            r, c = divmod(i, use_cols)
+            _ensure_stripe(r, use_cols)
+            top = (0 if r == 0 else pad_y) + 12
+            cell.grid(row=r, column=1 + c, padx=(pad_x // 2, pad_x // 2), pady=(top, 12), sticky="n")
+            bg = _row_bg(r)
+            for w in cell._bg_widgets:
+                w.configure(bg=bg)
+
+        def _configure_board_columns(use_cols: int, old_cols: int = 0):
+            board = grid_state["board"]
+            for c in range(max(use_cols, old_cols) + 2):
+                board.grid_columnconfigure(c, weight=0, minsize=0)
+            board.grid_columnconfigure(0, minsize=24)  # side padding (was holder padx=24)
+            board.grid_columnconfigure(use_cols + 1, minsize=24)
+            for c in range(use_cols):
+                board.grid_columnconfigure(1 + c, weight=1)
+
+        def reflow_grid():
+            board = grid_state["board"]
+            if board is None or not board.winfo_exists():
+                return
+            use_cols = _grid_cols()
+            old_cols = grid_state["cols"]
+            if use_cols == old_cols:
+                return
+            grid_state["cols"] = use_cols
+            _configure_board_columns(use_cols, old_cols)
 
-            chunks = [rows_sorted[i:i + cols] for i in range(0, len(rows_sorted), cols)]
+            cells = grid_state["cells"]
+            n_rows = (len(cells) + use_cols - 1) // use_cols
+            for stripe in grid_state["stripes"][n_rows:]:
+                stripe.grid_remove()
+            for i, cell in enumerate(cells):
+                _place_cell(i, cell, use_cols)
+            _sync_scrollregion()
 
-            for r, row_cols in enumerate(chunks):
-                row_bg = SHARED_TABLE_ALTROW_BG_COLOR if (r % 2 == 0) else panel_bg
+        def render_grid_view(mode: str, reverse: bool = False):
+            _force_canvas_window_width()
+            clear_scroll_contents()
+            list_state.update(header=None, rows=[], widths=())
 
-                stripe = tk.Frame(scroll_frame, bg=row_bg, highlightthickness=0, bd=0)
-                stripe.grid(row=r, column=0, sticky="nsew", padx=0, pady=(0 if r == 0 else pad_y, 0))
-                stripe.grid_columnconfigure(0, weight=1)
+            rows_sorted = _sort_collections_with_reverse(collections, mode, reverse)
+            canvas.update_idletasks()
+            use_cols = _grid_cols()
 
-                holder = tk.Frame(stripe, bg=row_bg, highlightthickness=0, bd=0)
-                holder.pack(fill="x", expand=True, padx=24, pady=(12, 12))
+            board = tk.Frame(scroll_frame, bg=panel_bg, highlightthickness=0, bd=0)
+            board.grid(row=0, column=0, sticky="nsew")
+            grid_state.update(board=board, cells=[], stripes=[], cols=use_cols)
+            _configure_board_columns(use_cols)
 
-                for c_i, col in enumerate(row_cols):
-                    holder.grid_columnconfigure(c_i, weight=1)
-                    cell = tk.Frame(holder, bg=row_bg, highlightthickness=0, bd=0, cursor="hand2")
-                    cell.grid(row=0, column=c_i, padx=(pad_x // 2, pad_x // 2), sticky="n")
+            def _build_tile(i: int, col: dict):
+                cell = tk.Frame(board, highlightthickness=0, bd=0, cursor="hand2")
 
-                    name = (col.get("name") or "Untitled Collection").strip()
-                    # --- blank square placeholder ---
-                    tk_img = self._get_collection_tile_photo(col, tile)
+                name = (col.get("name") or "Untitled Collection").strip()
+                # --- blank square placeholder ---
+                tk_img = self._get_collection_tile_photo(col, tile)
+
+                ph = tk.Canvas(
+                    cell,
+                    width=tile,
+                    height=tile,
+                    bg=SHARED_BLANKCOLLECTION_TILEBG_COLOR,
+                    highlightthickness=1,
+                    highlightbackground=FOCUS_PANEL_ACCENT_COLOR,
+                    cursor="hand2",
+                )
+                ph.pack()
 
-                    ph = tk.Canvas(
-                        cell,
-                        width=tile,
-                        height=tile,
-                        bg=SHARED_BLANKCOLLECTION_TILEBG_COLOR,
-                        highlightthickness=1,
-                        highlightbackground=FOCUS_PANEL_ACCENT_COLOR,
-                        cursor="hand2",
-                    )
-                    ph.pack()
+                if tk_img:
+                    ph.create_image(tile // 2, tile // 2, image=tk_img)
+                    ph._img_ref = tk_img  # prevent GC
+                else:
+                    ph.create_rectangle(6, 6, tile - 6, tile - 6, outline=SHARED_BLANKCOLLECTION_TILEACCENT_COLOR)
 
-                    if tk_img:
-                        ph.create_image(tile // 2, tile // 2, image=tk_img)
-                        ph._img_ref = tk_img  # prevent GC
-                    else:
-                        ph.create_rectangle(6, 6, tile - 6, tile - 6, outline=SHARED_BLANKCOLLECTION_TILEACCENT_COLOR)
-
-                    ph.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
-
-                    name_lbl = tk.Label(
-        cell,
-        text=self._ellipsize_px(name, (SHARED_FONT_TABLE, 16), tile + 40),
-        bg=row_bg,
-        fg=COLLECTIONS_NAME_FG_COLOR,
-                        font=(SHARED_FONT_TABLE, 16),
-                        wraplength=tile + 40,
-                        justify="center",
-                        cursor="hand2",
-                    )
-                    name_lbl.pack(pady=(8, 0))
-                    name_lbl.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
+                ph.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
 
+                name_lbl = tk.Label(
+                    cell,
+                    text=self._ellipsize_px(name, (SHARED_FONT_TABLE, 16), tile + 40),
+                    fg=COLLECTIONS_NAME_FG_COLOR,
+                    font=(SHARED_FONT_TABLE, 16),
+                    wraplength=tile + 40,
+                    justify="center",
+                    cursor="hand2",
+                )
+                name_lbl.pack(pady=(8, 0))
+                name_lbl.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
 
-                    count = len(col.get("book_ids") or [])
-                    meta = tk.Label(
-                        cell,
-                        text=f"{count} books",
-                        bg=row_bg,
-                        fg=COLLECTIONS_META_FG_COLOR,
-                        font=(SHARED_FONT_TABLE, 14),
-                        cursor="hand2",
-                    )
-                    meta.pack(pady=(4, 0))
-                    meta.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
-                    cell.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
+                count = len(col.get("book_ids") or [])
+                meta = tk.Label(
+                    cell,
+                    text=f"{count} books" + (" · smart" if col.get("smart") else ""),
+                    fg=COLLECTIONS_META_FG_COLOR,
+                    font=(SHARED_FONT_TABLE, 14),
+                    cursor="hand2",
+                )
+                meta.pack(pady=(4, 0))
+                meta.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
+                cell.bind("<Button-1>", lambda e, n=name: (self.show_open_collection_page(n), "break"))
 
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
+                cell._bg_widgets = (cell, name_lbl, meta)
+                grid_state["cells"].append(cell)
+                _place_cell(i, cell, grid_state["cols"])
 
-        def render_list_view(mode: str, reverse: bool = False):
-            _force_canvas_window_width()
-            clear_scroll_contents()
+            # ~tile + name + meta + stripe padding per row
+            visible_rows = max(canvas.winfo_height(), 1) // (tile + 100) + 1
+            self._render_progressively(scroll_frame, rows_sorted, _build_tile,
+                                       first_batch=visible_rows * use_cols, on_chunk=_sync_scrollregion)
 
-            rows_sorted = _sort_collections_with_reverse(collections, mode, reverse)
+        row_font = (SHARED_FONT_TABLE, 18)
 
+        def _list_widths() -> tuple[int, int, int, int]:
             total_w = max(canvas.winfo_width(), 1)
             total_w = max(total_w - 24, 1)
 
@@ -6083,18 +7238,48 @@ class LibraryApp(tk.Tk):
             books_w = max(int(total_w * 0.12), 80)
             created_w = max(int(total_w * 0.20), 120)
             updated_w = max(total_w - name_w - books_w - created_w, 120)
+            return (name_w, books_w, created_w, updated_w)
+
+        col_weights = (4, 1, 2, 2)  # name grows most, others grow less
+
+        def _apply_list_row_widths(frame: tk.Frame, col_widths: tuple[int, ...]):
+            for i, w in enumerate(col_widths):
+                frame.grid_columnconfigure(i, minsize=w, weight=col_weights[i])
+
+        def _ellipsize_list_row(labels: list[tk.Label], raw: tuple[str, ...], col_widths: tuple[int, ...]):
+            for c, (lbl, txt) in enumerate(zip(labels, raw)):
+                # Books is a bare count; everything else is cut to its column
+                lbl.configure(text=txt if c == 1 else self._ellipsize_px(txt, row_font, col_widths[c] - 24))
+
+        def relayout_list():
+            header = list_state["header"]
+            if header is None or not header.winfo_exists():
+                return
+            col_widths = _list_widths()
+            if col_widths == list_state["widths"]:
+                return
+            list_state["widths"] = col_widths
+            _apply_list_row_widths(header, col_widths)
+            for row, labels, raw in list_state["rows"]:
+                _apply_list_row_widths(row, col_widths)
+                _ellipsize_list_row(labels, raw, col_widths)
+            _sync_scrollregion()
+
+        def render_list_view(mode: str, reverse: bool = False):
+            _force_canvas_window_width()
+            clear_scroll_contents()
+            grid_state.update(board=None, cells=[], stripes=[], cols=0)
+
+            rows_sorted = _sort_collections_with_reverse(collections, mode, reverse)
 
             header_font = (SHARED_FONT_TABLE, 18)
-            row_font = (SHARED_FONT_TABLE, 18)
 
             header = tk.Frame(scroll_frame, bg=SHARED_SUBHEADER_BG_COLOR, highlightthickness=0, bd=0)
             header.grid(row=0, column=0, sticky="we")
 
-            col_widths = (name_w, books_w, created_w, updated_w)
-            col_weights = (4, 1, 2, 2)
-
-            for i, w in enumerate(col_widths):
-                header.grid_columnconfigure(i, minsize=w, weight=col_weights[i])
+            col_widths = _list_widths()
+            _apply_list_row_widths(header, col_widths)
+            list_state.update(header=header, rows=[], widths=col_widths)
 
             # Define clickable header columns
             header_cols = [
@@ -6131,51 +7316,40 @@ class LibraryApp(tk.Tk):
 
                 hdr_lbl.bind("<Button-1>", _on_header_click)
 
-            for idx, col in enumerate(rows_sorted, start=1):
+            def _build_row(i: int, col: dict):
+                idx = i + 1  # row 0 is the header
                 row_bg = SHARED_TABLE_ALTROW_BG_COLOR if idx % 2 == 0 else SHARED_TABLE_BG_COLOR
 
                 row = tk.Frame(scroll_frame, bg=row_bg, highlightthickness=0, bd=0)
                 row.grid(row=idx, column=0, sticky="ew")
 
-                col_widths = (name_w, books_w, created_w, updated_w)
-                col_weights = (4, 1, 2, 2)  # name grows most, others grow less
-
-                for i, w in enumerate(col_widths):
-                    row.grid_columnconfigure(i, minsize=w, weight=col_weights[i])
+                widths_now = list_state["widths"]
+                _apply_list_row_widths(row, widths_now)
 
                 name = (col.get("name") or "Untitled Collection").strip()
                 count = len(col.get("book_ids") or [])
                 created = self._ts_to_short_date(col.get("created_at") or 0.0)
                 updated = self._ts_to_short_date(col.get("updated_at") or 0.0)
-
-                name_txt = self._ellipsize_px(name, row_font, name_w - 24)
-                books_txt = str(count)
-                created_txt = self._ellipsize_px(created, row_font, created_w - 24)
-                updated_txt = self._ellipsize_px(updated, row_font, updated_w - 24)
+                raw = (name, str(count), created, updated)
 
                 cells = [
-                    tk.Label(row, text=name_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
-                    tk.Label(row, text=books_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
-                    tk.Label(row, text=created_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
-                    tk.Label(row, text=updated_txt, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
-                             anchor="w", padx=12, pady=8, cursor="hand2"),
+                    tk.Label(row, bg=row_bg, fg=SHARED_SCROLLROW_TEXT_COLOR, font=row_font,
+                             anchor="w", padx=12, pady=8, cursor="hand2")
+                    for _ in raw
                 ]
-                cells[0].grid(row=0, column=0, sticky="we")
-                cells[1].grid(row=0, column=1, sticky="we")
-                cells[2].grid(row=0, column=2, sticky="we")
-                cells[3].grid(row=0, column=3, sticky="we")
+                for c, lbl in enumerate(cells):
+                    lbl.grid(row=0, column=c, sticky="we")
+                _ellipsize_list_row(cells, raw, widths_now)
 
                 for lbl in cells:
                     lbl.bind("<Button-1>", lambda e, n=(col.get("name") or "").strip(): (self.show_open_collection_page(n), "break"))
                     self.active_widgets.append(lbl)
+                list_state["rows"].append((row, cells, raw))
 
-            canvas.update_idletasks()
-            total_w = max(canvas.winfo_width(), 1)
-            total_w = max(total_w - 24, 1)
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            row_h = tkfont.Font(font=row_font).metrics("linespace") + 18
+            visible_rows = max(canvas.winfo_height(), 1) // row_h + 1
+            self._render_progressively(scroll_frame, rows_sorted, _build_row,
+                                       first_batch=visible_rows, on_chunk=_sync_scrollregion)
 
         def render_content():
             mode = sort_var.get()
@@ -6186,21 +7360,25 @@ class LibraryApp(tk.Tk):
             else:
                 render_grid_view(mode, reverse)
 
-        # --- NEW: reflow grid when canvas size changes ---
+        def reflow_content():
+            # layout-only update: no re-sort, no image loads, no new widgets
+            _force_canvas_window_width()
+            if view_var.get() == "list":
+                relayout_list()
+            else:
+                reflow_grid()
+
+        # --- reflow (not rebuild) when canvas size changes ---
         _resize_after = {"id": None}
 
         def _on_canvas_resize(_evt=None):
-            # only matters for grid view (list already measures widths each render)
-            if view_var.get() != "grid":
-                return
-
             if _resize_after["id"] is not None:
                 try:
                     canvas.after_cancel(_resize_after["id"])
                 except Exception:
                     pass
 
-            _resize_after["id"] = canvas.after(80, render_content)
+            _resize_after["id"] = canvas.after(60, reflow_content)
 
         canvas.bind("<Configure>", _on_canvas_resize)
 
@@ -6262,6 +7440,7 @@ class LibraryApp(tk.Tk):
             ).pack()
             return
 
+        # (the renderer reflows its own layout when the canvas width changes)
         self._render_collections_grid_or_list(
             canvas=canvas,
             scroll_frame=scroll_frame,
@@ -6274,28 +7453,6 @@ class LibraryApp(tk.Tk):
             sort_reverse_var=sort_reverse_var,
         )
 
-        # --- Re-render when the canvas width changes (so list columns stay dynamic) ---
-        def _on_canvas_configure(e=None):
-            # debounce so we don't rebuild 100x while dragging window
-            if hasattr(self, "_collections_resize_after"):
-                try:
-                    self.after_cancel(self._collections_resize_after)
-                except Exception:
-                    pass
-            self._collections_resize_after = self.after(60, lambda: self._render_collections_grid_or_list(
-                canvas=canvas,
-                scroll_frame=scroll_frame,
-                collections=collections,
-                sort_var=sort_var,
-                view_var=view_var,
-                view_btns=view_btns,
-                panel_bg=panel_bg,
-                cols=cols,
-                sort_reverse_var=sort_reverse_var,
-            ))
-
-        canvas.bind("<Configure>", _on_canvas_configure)
-
     def _norm(self, s: str) -> str:
         s = (s or "").strip().lower()
         return re.sub(r"\s+", " ", s)
@@ -7018,38 +8175,11 @@ class LibraryApp(tk.Tk):
     def _buildcol_load_preview_photo(self, abs_path: str, size_px: int):
         """
         Load + center-crop to a square, return ImageTk.PhotoImage.
-        Cached by (path, size).
+        Served from the shared photo cache (path, size, "square").
         """
-        from PIL import Image, ImageTk
-
         if not abs_path:
             return None
-
-        cache = getattr(self, "_collection_photo_preview_cache", None)
-        if cache is None:
-            cache = {}
-            self._collection_photo_preview_cache = cache
-
-        key = (abs_path, int(size_px))
-        if key in cache:
-            return cache[key]
-
-        try:
-            im = Image.open(abs_path).convert("RGBA")
-        except Exception:
-            return None
-
-        # Center-crop square then resize
-        w, h = im.size
-        side = min(w, h)
-        left = (w - side) // 2
-        top = (h - side) // 2
-        im = im.crop((left, top, left + side, top + side))
-        im = im.resize((int(size_px), int(size_px)), Image.LANCZOS)
-
-        tk_img = ImageTk.PhotoImage(im)
-        cache[key] = tk_img
-        return tk_img
+        return self._cached_photo(abs_path, (int(size_px), int(size_px)), mode="square")
 
     def _buildcol_refresh_photo_preview(self):
         """Refresh the build-collection photo preview (square placeholder + optional image)."""
@@ -8440,6 +9570,7 @@ class LibraryApp(tk.Tk):
             context_label="All Books",
             books=books,
             cols=5, default_view="list",
+            whole_catalog=True,
         )
 
     # ---------- PAGE: BOOK DETAIL ----------
@@ -8774,22 +9905,13 @@ class LibraryApp(tk.Tk):
                             all_tags.add(tag_str)
             return all_tags
 
-        def get_recent_tags(limit: int = 3) -> list[str]:
-            """Get the most recently added tags (stored in instance)."""
-            recent = getattr(self, "_recent_tags_added", [])
-            return recent[:limit]
-
-        def add_to_recent_tags(tags: list[str]):
-            """Add tags to the recent tags list."""
-            recent = getattr(self, "_recent_tags_added", [])
-            for t in reversed(tags):
-                t_lower = t.strip().lower()
-                if t_lower:
-                    # Remove if already exists (to move to front)
-                    recent = [r for r in recent if r.lower() != t_lower]
-                    recent.insert(0, t_lower)
-            # Keep only last 10
-            self._recent_tags_added = recent[:10]
+        # library-wide tag list is only needed for typed searching; scan once per editor
+        library_tags: dict[str, list[str] | None] = {"sorted": None}
+
+        def get_library_tags_sorted() -> list[str]:
+            if library_tags["sorted"] is None:
+                library_tags["sorted"] = sorted(get_all_tags_in_library())
+            return library_tags["sorted"]
 
         def update_suggestions(event=None):
             for child in suggestions_frame.winfo_children():
@@ -8803,41 +9925,17 @@ class LibraryApp(tk.Tk):
                 book_tags = book.get("tags") if isinstance(book.get("tags"), list) else []
             current_tags = {str(t).strip().lower() for t in book_tags}
 
-            # ---- NEW: suggestions come from backend "recent tags" ----
+            # Ranked from the backend tag history (frequency + recency), no catalog scan.
             try:
-                recent = self.data.get_recent_tags_global(50)  # grab more so filtering still yields up to 6
+                suggestions = self.data.rank_recent_tags(current_text, limit=6, exclude=current_tags)
             except Exception:
-                recent = []
-
-            # Build list in priority order:
-            # 1) recent tags (most recent first)
-            # 2) remaining tags in library (alphabetical), as fallback for typed searching
-            all_tags = sorted(get_all_tags_in_library())
-            ordered = []
-            seen = set()
-
-            for t in recent:
-                if t and t not in seen:
-                    ordered.append(t)
-                    seen.add(t)
-
-            for t in all_tags:
-                t = str(t).strip().lower()
-                if t and t not in seen:
-                    ordered.append(t)
-                    seen.add(t)
-
-            # Filter by empty/typed input + exclude tags already on this book
-            suggestions = []
-            if not current_text:
-                for t in get_recent_tags(6):  # <-- you said last 6
-                    if t.lower() not in current_tags:
-                        suggestions.append(t)
-                        if len(suggestions) >= 6:
-                            break
-            else:
-                for t in sorted(get_all_tags_in_library()):
-                    if current_text in t.lower() and t.lower() not in current_tags:
+                suggestions = []
+
+            # Typed searching: fill up with remaining library tags (alphabetical)
+            if current_text and len(suggestions) < 6:
+                seen = set(suggestions)
+                for t in get_library_tags_sorted():
+                    if current_text in t and t not in current_tags and t not in seen:
                         suggestions.append(t)
                         if len(suggestions) >= 6:
                             break
@@ -9009,7 +10107,7 @@ class LibraryApp(tk.Tk):
 
             try:
                 self.data.add_tags(book_id, items, persist=True)
-                add_to_recent_tags(items)
+                library_tags["sorted"] = None
             except Exception:
                 tags = book.get("tags") if isinstance(book.get("tags"), list) else []
                 low = {str(x).strip().lower() for x in tags}
@@ -9030,6 +10128,7 @@ class LibraryApp(tk.Tk):
                 tags = book.get("tags") if isinstance(book.get("tags"), list) else []
                 norm = str(tag).strip().lower()
                 book["tags"] = [t for t in tags if str(t).strip().lower() != norm]
+            library_tags["sorted"] = None
             self._refresh_catalog_from_data()
             refresh_chips()
             update_suggestions()
@@ -9390,6 +10489,7 @@ class LibraryApp(tk.Tk):
 
         desc = (book.get("description") or book.get("notes") or "").strip() or "No description available."
         # Decode HTML entities like &#039; -> ' (sometimes double-escaped)
+        import html
         for _ in range(2):
             new = html.unescape(desc)
             if new == desc:
@@ -9620,10 +10720,8 @@ class LibraryApp(tk.Tk):
         display_w_px = COVER_W
         display_h_px = COVER_H
 
-        if cover_path and cover_path.exists():
-            pil = Image.open(cover_path).convert("RGB")
-            pil.thumbnail((COVER_W, COVER_H), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(pil)
+        photo = self._cached_cover_photo(book_id, (COVER_W, COVER_H)) if cover_path else None
+        if photo is not None:
             self._page_img_refs.append(photo)
 
             display_w_px = photo.width()
@@ -9846,6 +10944,7 @@ class LibraryApp(tk.Tk):
                 selected = genre_var.get()
                 if selected == "Add new genre…":
                     # Show popup to enter new genre
+                    from tkinter import simpledialog
                     new_genre = simpledialog.askstring(
                         "Add New Genre",
                         "Enter the name for the new genre:",
@@ -10161,6 +11260,7 @@ class LibraryApp(tk.Tk):
     # ---------- LOGIC HELPERS ----------
     def _unescape_entities(self, s: str) -> str:
         s = (s or "").strip()
+        import html
         for _ in range(2):
             new = html.unescape(s)
             if new == s:
@@ -10231,13 +11331,8 @@ class LibraryApp(tk.Tk):
 
         return author, title, year
     def _filter_books_by_genre(self, genre_name: str) -> list[dict]:
-        g = (genre_name or "").strip().lower()
-        out = []
-        for b in self.catalog:
-            bg = (b.get("genre") or "").strip().lower()
-            if bg == g:
-                out.append(b)
-        return out
+        # already in title order (the page's default sort), see LibraryData.books_in_genre
+        return self.data.books_in_genre(genre_name)
     def perform_search(self, query: str):
         # Reset book edit mode when navigating away via search
         self._book_edit_mode = False
@@ -10276,10 +11371,17 @@ class LibraryApp(tk.Tk):
         if not self.catalog:
             messagebox.showinfo("Random Book", "No books in the library yet.")
             return
+        import random
         book = random.choice(self.catalog)
         self.show_book_detail(book)
 
 
 if __name__ == "__main__":
     app = LibraryApp()
+    if "--startup-times" in sys.argv[1:]:
+        app.when_started(lambda: print(app.startup_report(), flush=True))
+    if "--ui-monitor" in sys.argv[1:]:
+        app.enable_ui_monitor()  # before the main page is built, so its build is timed too
     app.mainloop()
+    if app._ui_monitor is not None:
+        print(json.dumps(app.ui_monitor_report(), indent=2), flush=True)